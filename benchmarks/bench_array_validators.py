@@ -0,0 +1,34 @@
+"""Time a range check on a large NumPy array, checked at once versus element by element.
+
+Usage: python -m benchmarks.bench_array_validators
+"""
+import timeit
+
+import numpy as np
+
+from fancy_signatures.validation import GE, LT
+
+ARRAY = np.random.default_rng(0).uniform(0, 1, 10_000_000)
+VALIDATORS = [GE(0), LT(1)]
+
+
+def vectorized() -> None:
+    for validator in VALIDATORS:
+        validator("a", ARRAY)
+
+
+def per_element() -> None:
+    for value in ARRAY[:1_000_000].tolist():
+        for validator in VALIDATORS:
+            validator("a", value)
+
+
+def main(number: int = 5) -> None:
+    seconds = timeit.timeit(vectorized, number=number) / number
+    print(f"{'array (10M elements)':<35} {seconds * 1e3:10.2f} ms")
+    seconds = timeit.timeit(per_element, number=1) * 10
+    print(f"{'per element (extrapolated to 10M)':<35} {seconds * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Compare awaiting the async validators of a coroutine function one by one with `validate`, which awaits them
+concurrently. And likewise for the defaults of missing arguments constructed by an `AsyncDefaultFactory`. Every
+validator and default simulates a call to a service taking 10 ms.
+
+Usage: python -m benchmarks.bench_async
+"""
+import asyncio
+import time
+from typing import Any
+
+from fancy_signatures import validate, argument
+from fancy_signatures.core.interface import Validator
+from fancy_signatures.default import AsyncDefaultFactory
+
+
+class Lookup(Validator[str]):
+    async def validate(self, obj: str) -> str:
+        await asyncio.sleep(0.01)
+        return obj
+
+
+LOOKUP = Lookup()
+
+
+async def sequential(a: str, b: str, c: str, d: str) -> Any:
+    for name, value in (("a", a), ("b", b), ("c", c), ("d", d)):
+        await LOOKUP.call_async(name, value)
+    return a
+
+
+@validate
+async def concurrent(
+    a: str = argument(validators=[LOOKUP]),
+    b: str = argument(validators=[LOOKUP]),
+    c: str = argument(validators=[LOOKUP]),
+    d: str = argument(validators=[LOOKUP]),
+) -> Any:
+    return a
+
+
+async def lookup_default() -> int:
+    await asyncio.sleep(0.01)
+    return 0
+
+
+async def sequential_defaults() -> Any:
+    return [await lookup_default() for _ in range(4)]
+
+
+@validate
+async def concurrent_defaults(
+    a: int = argument(default=AsyncDefaultFactory(lookup_default)),
+    b: int = argument(default=AsyncDefaultFactory(lookup_default)),
+    c: int = argument(default=AsyncDefaultFactory(lookup_default)),
+    d: int = argument(default=AsyncDefaultFactory(lookup_default)),
+) -> Any:
+    return [a, b, c, d]
+
+
+async def run(func: Any, number: int, *args: Any) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await func(*args)
+    return time.perf_counter() - start
+
+
+def main(number: int = 20) -> None:
+    arguments = ("a", "b", "c", "d")
+    for name, func, args in (
+        ("validators sequential", sequential, arguments),
+        ("validators validate", concurrent, arguments),
+        ("defaults sequential", sequential_defaults, ()),
+        ("defaults validate", concurrent_defaults, ()),
+    ):
+        seconds = asyncio.run(run(func, number, *args))
+        print(f"{name:<22} {seconds / number * 1e3:8.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
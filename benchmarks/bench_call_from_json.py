@@ -0,0 +1,44 @@
+"""Compare `json.loads` followed by a call with `**body` with `call_from_json`, for a valid payload and for a payload
+with a large member that doesn't belong to the function.
+
+Usage: python -m benchmarks.bench_call_from_json
+"""
+import json
+import timeit
+from typing import Any
+
+from fancy_signatures import validate, call_from_json
+
+
+@validate(compile=True)
+def handler(user_id: int, name: str, scores: list[float]) -> int:
+    return user_id
+
+
+VALID = json.dumps({"user_id": 1, "name": "a", "scores": [1.5] * 10_000}).encode()
+UNKNOWN = json.dumps({"metadata": [{"key": i, "value": str(i)} for i in range(20_000)], "user_id": 1}).encode()
+
+
+def loads_and_call(payload: bytes) -> Any:
+    try:
+        return handler(**json.loads(payload))
+    except TypeError:
+        return None
+
+
+def from_json(payload: bytes) -> Any:
+    try:
+        return call_from_json(handler, payload)
+    except TypeError:
+        return None
+
+
+def main(number: int = 50) -> None:
+    for payload_name, payload in (("valid", VALID), ("unknown member", UNKNOWN)):
+        for name, func in (("json.loads + call", loads_and_call), ("call_from_json", from_json)):
+            seconds = timeit.timeit(lambda: func(payload), number=number)
+            print(f"{payload_name:<15} {name:<18} {seconds / number * 1e3:8.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
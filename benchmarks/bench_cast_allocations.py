@@ -0,0 +1,67 @@
+"""Measure the memory allocated when casting a large dict and list that are valid, or of which a single element
+is invalid.
+
+Compares rebuilding the whole container (how `cast` used to work) with `coerce`, with and without `CAST_IN_PLACE`.
+
+Usage: python -m benchmarks.bench_cast_allocations
+"""
+import tracemalloc
+from typing import Any, Callable
+
+from fancy_signatures.settings import set as adjust_setting, reset as reset_settings
+from fancy_signatures.typecasting import typecaster_factory
+
+SIZE = 1_000_000
+DICT_CASTER = typecaster_factory(dict[str, int])
+LIST_CASTER = typecaster_factory(list[int])
+
+
+def make_dict() -> dict[str, Any]:
+    value: dict[str, Any] = {str(i): i for i in range(SIZE)}
+    value["0"] = "0"
+    return value
+
+
+def make_list() -> list[Any]:
+    value: list[Any] = list(range(SIZE))
+    value[-1] = str(SIZE - 1)
+    return value
+
+
+def rebuild_dict(value: dict[str, Any]) -> dict[str, int]:
+    return {str(k): int(v) for k, v in value.items()}
+
+
+def rebuild_list(value: list[Any]) -> list[int]:
+    return [int(v) for v in value]
+
+
+def allocated(func: Callable[[Any], Any], value: Any) -> int:
+    tracemalloc.start()
+    result = func(value)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+
+def main() -> None:
+    for name, make, rebuild, caster in [
+        ("dict", make_dict, rebuild_dict, DICT_CASTER),
+        ("list", make_list, rebuild_list, LIST_CASTER),
+    ]:
+        results = {
+            "valid, rebuild": allocated(rebuild, rebuild(make())),
+            "valid, coerce": allocated(lambda v: caster.coerce(v, False), rebuild(make())),
+            "rebuild": allocated(rebuild, make()),
+            "coerce": allocated(lambda v: caster.coerce(v, False), make()),
+        }
+        adjust_setting("CAST_IN_PLACE", True)
+        results["coerce, CAST_IN_PLACE"] = allocated(lambda v: caster.coerce(v, False), make())
+        reset_settings()
+        for label, peak in results.items():
+            print(f"{name + ', ' + label:<35} {peak / 1e6:10.2f} MB allocated per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Compare validating and casting a container in two passes (`validate`, then `cast`) with `coerce`.
+
+Usage: python -m benchmarks.bench_coerce
+"""
+import timeit
+from typing import Any
+
+from fancy_signatures.typecasting import typecaster_factory
+
+CASTER = typecaster_factory(list[int])
+VALID = list(range(100_000))
+# A single element needs to be cast
+ONE_INVALID = VALID[:-1] + ["1"]
+
+
+def two_passes(value: Any) -> Any:
+    if CASTER.validate(value):
+        return value
+    return CASTER.cast(value)
+
+
+def main(number: int = 50) -> None:
+    results = {
+        "valid, validate + cast": timeit.timeit(lambda: two_passes(VALID), number=number),
+        "valid, coerce": timeit.timeit(lambda: CASTER.coerce(VALID, False), number=number),
+        "one invalid, validate + cast": timeit.timeit(lambda: two_passes(ONE_INVALID), number=number),
+        "one invalid, coerce": timeit.timeit(lambda: CASTER.coerce(ONE_INVALID, False), number=number),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<30} {seconds / number * 1e3:8.2f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
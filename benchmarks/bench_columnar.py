@@ -0,0 +1,46 @@
+"""Compare validating columnar data row by row with `validate_columns`.
+
+Usage: python -m benchmarks.bench_columnar
+"""
+import timeit
+from typing import Any
+
+from fancy_signatures import validate, validate_columns, validate_many, argument
+from fancy_signatures.validation import GE
+
+
+@validate(lazy=True)
+def function(a: int, b: int = argument(validators=[GE(0)]), c: str = argument(alias="see")) -> Any:
+    return a, b, c
+
+
+NUM_ROWS = 10_000
+# Every 10th row is invalid
+COLUMNS = {
+    "a": list(range(NUM_ROWS)),
+    "b": ["1" if i % 10 else -1 for i in range(NUM_ROWS)],
+    "see": ["c"] * NUM_ROWS,
+}
+
+
+def rows() -> None:
+    records = [dict(zip(COLUMNS, values)) for values in zip(*COLUMNS.values())]
+    for _ in validate_many(function, records):
+        pass
+
+
+def columns() -> None:
+    validate_columns(function, COLUMNS)
+
+
+def main(number: int = 20) -> None:
+    results = {
+        "convert to rows + validate_many": timeit.timeit(rows, number=number),
+        "validate_columns": timeit.timeit(columns, number=number),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<35} {seconds / number / NUM_ROWS * 1e6:8.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare reading a CSV file with `csv.reader`, validating the rows by calling a validated function in a loop, and
+`validate_csv`.
+
+Usage: python -m benchmarks.bench_csv
+"""
+import csv
+import io
+import timeit
+from typing import Any, Callable
+
+from fancy_signatures import validate, validate_csv, argument
+from fancy_signatures.validation import GE
+
+
+@validate
+def numeric(a: int, b: float, c: int) -> None:
+    pass
+
+
+@validate
+def with_validators(a: int, b: float = argument(validators=[GE(0)]), c: int = 0, d: bool = False) -> None:
+    pass
+
+
+NUMERIC_CSV = "a,b,c\n" + "".join(f"{i},{i / 3},{i * 7}\n" for i in range(100_000))
+MIXED_CSV = "a,b,c,d\n" + "".join(f"{i},{i / 3},{i * 7},{'true' if i % 2 else '0'}\n" for i in range(100_000))
+
+
+def raw(data: str) -> None:
+    for _ in csv.reader(io.StringIO(data)):
+        pass
+
+
+def loop(func: Callable[..., Any], data: str) -> None:
+    reader = csv.reader(io.StringIO(data))
+    header = next(reader)
+    for row in reader:
+        func(**dict(zip(header, row)))
+
+
+def batched(func: Callable[..., Any], data: str) -> None:
+    for _ in validate_csv(func, io.StringIO(data)):
+        pass
+
+
+def main(number: int = 5) -> None:
+    for name, func, data in (("numeric", numeric, NUMERIC_CSV), ("with validators", with_validators, MIXED_CSV)):
+        raw_seconds = timeit.timeit(lambda: raw(data), number=number)
+        results = {
+            "csv.reader": raw_seconds,
+            "call in a loop": timeit.timeit(lambda: loop(func, data), number=number),
+            "validate_csv": timeit.timeit(lambda: batched(func, data), number=number),
+        }
+        for method, seconds in results.items():
+            print(
+                f"{name:<16} {method:<16} {seconds / number * 1e3:8.2f} ms ({seconds / raw_seconds:5.2f}x csv.reader)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Compare validating the rows of a sqlite3 query by calling a validated function per row with `validate_cursor`.
+
+Usage: python -m benchmarks.bench_cursor
+"""
+import sqlite3
+import timeit
+
+from fancy_signatures import validate, validate_cursor, argument
+from fancy_signatures.validation import GE
+
+
+@validate
+def handler(user_id: int, name: str, score: float = argument(validators=[GE(0)])) -> None:
+    pass
+
+
+CONNECTION = sqlite3.connect(":memory:", check_same_thread=False)
+CONNECTION.execute("CREATE TABLE users (user_id INTEGER, name TEXT, score REAL)")
+CONNECTION.executemany("INSERT INTO users VALUES (?, ?, ?)", [(i, f"user {i}", i / 3) for i in range(100_000)])
+QUERY = "SELECT user_id, name, score FROM users"
+
+
+def per_row() -> None:
+    cursor = CONNECTION.execute(QUERY)
+    names = [column[0] for column in cursor.description]
+    for row in cursor:
+        handler(**dict(zip(names, row)))
+
+
+def batched(prefetch: bool) -> None:
+    for _ in validate_cursor(handler, CONNECTION.execute(QUERY), batch_size=1_000, prefetch=prefetch):
+        pass
+
+
+def main(number: int = 5) -> None:
+    results = {
+        "call per row": timeit.timeit(per_row, number=number),
+        "validate_cursor": timeit.timeit(lambda: batched(False), number=number),
+        "validate_cursor(prefetch)": timeit.timeit(lambda: batched(True), number=number),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<26} {seconds / number * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Compare the cost of calling a validated method on short-lived instances with calling a validated function.
+
+Usage: python -m benchmarks.bench_method_binding
+"""
+import timeit
+
+from fancy_signatures import validate, argument
+from fancy_signatures.validation import GE
+
+
+@validate
+def function(a: int, b: int = argument(validators=[GE(0)])) -> int:
+    return a + b
+
+
+class Handler:
+    def __init__(self, base: int) -> None:
+        self._base = base
+
+    @validate
+    def method(self, a: int, b: int = argument(validators=[GE(0)])) -> int:
+        return self._base + a + b
+
+
+def main(number: int = 100_000) -> None:
+    handler = Handler(1)
+    results = {
+        "function call": timeit.timeit(lambda: function(1, 2), number=number),
+        "method call (same instance)": timeit.timeit(lambda: handler.method(1, 2), number=number),
+        "method call (new instance per call)": timeit.timeit(lambda: Handler(1).method(1, 2), number=number),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<40} {seconds / number * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
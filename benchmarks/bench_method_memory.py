@@ -0,0 +1,52 @@
+"""Measure the memory used per instance after calling a validated method on every instance.
+
+Usage: python -m benchmarks.bench_method_memory [number of instances]
+"""
+import sys
+import tracemalloc
+
+from fancy_signatures import validate
+
+
+class Regular:
+    def __init__(self, base: int) -> None:
+        self._base = base
+
+    @validate
+    def method(self, a: int) -> int:
+        return self._base + a
+
+
+class Slotted:
+    __slots__ = ("_base",)
+
+    def __init__(self, base: int) -> None:
+        self._base = base
+
+    @validate
+    def method(self, a: int) -> int:
+        return self._base + a
+
+
+def measure(cls: type, number: int) -> float:
+    tracemalloc.start()
+    instances = [cls(i) for i in range(number)]
+    after_init, _ = tracemalloc.get_traced_memory()
+    for instance in instances:
+        instance.method(1)
+    after_calls, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{cls.__name__:<10} {after_init / number:8.1f} bytes/instance after init, "
+        f"{after_calls / number:8.1f} bytes/instance after calling the method"
+    )
+    return after_calls
+
+
+def main(number: int = 1_000_000) -> None:
+    measure(Regular, number)
+    measure(Slotted, number)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,41 @@
+"""Compare the cost of calling a validated function with metrics disabled (the default) and enabled.
+
+Usage: python -m benchmarks.bench_metrics
+"""
+import timeit
+
+from fancy_signatures import validate, argument, metrics
+from fancy_signatures.default import DefaultValue
+from fancy_signatures.validation import GE
+
+
+@validate
+def function(a: int, b: int = argument(validators=[GE(0)]), c: str = argument(default=DefaultValue("c"))) -> int:
+    return a + b
+
+
+@validate(compile=True)
+def compiled_function(
+    a: int, b: int = argument(validators=[GE(0)]), c: str = argument(default=DefaultValue("c"))
+) -> int:
+    return a + b
+
+
+def main(number: int = 100_000) -> None:
+    results = {}
+    for enabled in (False, True):
+        if enabled:
+            metrics.enable()
+        state = "enabled" if enabled else "disabled"
+        results[f"metrics {state}"] = timeit.timeit(lambda: function(1, "2"), number=number)
+        results[f"metrics {state} (compiled)"] = timeit.timeit(lambda: compiled_function(1, "2"), number=number)
+    metrics.disable()
+
+    for name, seconds in results.items():
+        print(f"{name:<40} {seconds / number * 1e6:8.2f} us/call")
+    stats = metrics.snapshot()[f"{__name__}.function"]
+    print(f"p50 {stats.p50_ns} ns, p99 {stats.p99_ns} ns, parameters {stats.parameters}")
+
+
+if __name__ == "__main__":
+    main()
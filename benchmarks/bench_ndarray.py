@@ -0,0 +1,41 @@
+"""Compare validating a large numeric payload as `list[float]` with validating it as an ndarray.
+
+Usage: python -m benchmarks.bench_ndarray
+"""
+import timeit
+from typing import Annotated, Any
+
+import numpy as np
+
+from fancy_signatures import validate
+from fancy_signatures.typecasting.ndarray import register_ndarray_typecaster, DType, Shape
+
+register_ndarray_typecaster()
+
+
+@validate
+def as_list(values: list[float]) -> Any:
+    return values
+
+
+@validate
+def as_array(values: Annotated[np.ndarray, DType(np.float64), Shape(-1)]) -> Any:
+    return values
+
+
+PAYLOAD = [float(i) for i in range(1_000_000)]
+ARRAY = np.asarray(PAYLOAD)
+
+
+def main(number: int = 5) -> None:
+    results = {
+        "list[float], list input": timeit.timeit(lambda: as_list(PAYLOAD), number=number),
+        "ndarray, list input": timeit.timeit(lambda: as_array(PAYLOAD), number=number),
+        "ndarray, ndarray input": timeit.timeit(lambda: as_array(ARRAY), number=number),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<25} {seconds / number * 1e3:10.3f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
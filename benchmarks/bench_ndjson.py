@@ -0,0 +1,48 @@
+"""Measure the throughput and peak memory of `validate_ndjson` for JSON Lines files of increasing size.
+
+Usage: python -m benchmarks.bench_ndjson
+"""
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from fancy_signatures import validate, validate_ndjson, argument
+from fancy_signatures.validation import GE
+
+
+@validate(lazy=True)
+def handler(user_id: int, name: str, score: float = argument(validators=[GE(0)])) -> None:
+    pass
+
+
+def write_file(path: str, num_records: int) -> None:
+    with open(path, "w") as file:
+        for i in range(num_records):
+            # Every 10th record is invalid
+            file.write(json.dumps({"user_id": str(i), "name": f"user {i}", "score": -1 if i % 10 == 0 else i}) + "\n")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        for num_records in (10_000, 100_000, 1_000_000):
+            path = os.path.join(directory, f"{num_records}.jsonl")
+            write_file(path, num_records)
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            num_valid = sum(result.ok for result in validate_ndjson(handler, path))
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            megabytes = os.stat(path).st_size / 1e6
+            print(
+                f"{megabytes:7.1f} MB, {num_valid:>7} valid: {num_records / seconds:10,.0f} records/s, "
+                f"peak memory {peak / 1e3:8.1f} kB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare serial and parallel (`Parallel` metadata) validation of a large list with an element validator, for
+valid elements and for elements that have to be cast. Only a free-threaded build of Python can run the chunks at
+the same time, with the GIL the parallel version shows the overhead of the thread pool.
+
+Usage: python -m benchmarks.bench_parallel
+"""
+import sys
+import timeit
+from typing import Annotated, Any
+
+from fancy_signatures import validate, argument
+from fancy_signatures.typecasting import Parallel
+from fancy_signatures.validation import GE
+
+SIZE = 1_000_000
+
+
+@validate
+def serial(values: list[float] = argument(each=[GE(0)])) -> Any:
+    return values
+
+
+@validate
+def parallel(values: Annotated[list[float], Parallel(threshold=10_000)] = argument(each=[GE(0)])) -> Any:
+    return values
+
+
+def main(number: int = 3) -> None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil_enabled}")
+    for data_name, data in (("valid", [1.5] * SIZE), ("cast", ["1.5"] * SIZE)):
+        for name, func in (("serial", serial), ("parallel", parallel)):
+            seconds = timeit.timeit(lambda: func(data), number=number)
+            print(f"{data_name:<6} {name:<9} {seconds / number * 1e3:9.1f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""Compare parsing strings with `eval` (the previous implementation) and `parse_literal`.
+
+Usage: python -m benchmarks.bench_parse_literal
+"""
+import json
+import timeit
+
+from fancy_signatures.typecasting.parsing import parse_literal
+
+INPUTS = {
+    "JSON array, 10k ints": json.dumps(list(range(10_000))),
+    "JSON object, 10k items": json.dumps({str(i): [i, i / 2] for i in range(10_000)}),
+    "comma separated, 10k": ", ".join(str(i) for i in range(10_000)),
+    "Python dict, 10k items": repr({i: (i, "a") for i in range(10_000)}),
+    "None": "None",
+}
+
+
+def main(number: int = 20) -> None:
+    for name, text in INPUTS.items():
+        eval_seconds = timeit.timeit(lambda: eval(text), number=number)
+        parse_seconds = timeit.timeit(lambda: parse_literal(text), number=number)
+        eval_ms = eval_seconds / number * 1e3
+        parse_ms = parse_seconds / number * 1e3
+        print(f"{name:<24} eval {eval_ms:8.3f} ms, parse_literal {parse_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
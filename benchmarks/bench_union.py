@@ -0,0 +1,32 @@
+"""Compare validating union members in order with the type-dispatch table of `UnionTypeCaster`.
+
+Usage: python -m benchmarks.bench_union
+"""
+import timeit
+from typing import Any
+
+from fancy_signatures.typecasting import typecaster_factory
+
+CASTER = typecaster_factory(int | float | bytes | list[int] | dict[str, int] | str | None)
+# Values matching the last members of the union are the worst case when members are tried in order
+VALUES = ["a", None, "b", {"a": 1}, "c", None] * 1_000
+
+
+def sequential(value: Any) -> bool:
+    for caster in CASTER._casters:
+        if caster.validate(value):
+            return True
+    return False
+
+
+def main(number: int = 100) -> None:
+    results = {
+        "sequential": timeit.timeit(lambda: [sequential(v) for v in VALUES], number=number),
+        "dispatch": timeit.timeit(lambda: [CASTER.validate(v) for v in VALUES], number=number),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<12} {seconds / number * 1e3:8.2f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
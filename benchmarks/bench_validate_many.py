@@ -0,0 +1,53 @@
+"""Compare validating records by calling a validated function in a loop with `validate_many`, in this process and
+in a pool of worker processes (one per CPU).
+
+Usage: python -m benchmarks.bench_validate_many
+"""
+import os
+import timeit
+from typing import Any
+
+from fancy_signatures import validate, validate_many, argument
+from fancy_signatures.exceptions import ValidationErrorGroup
+from fancy_signatures.validation import GE
+
+
+@validate(lazy=True)
+def function(a: int, b: int = argument(validators=[GE(0)]), c: str = argument(alias="see")) -> Any:
+    return a, b, c
+
+
+# Every 10th record is invalid
+RECORDS = [{"a": i, "b": "1" if i % 10 else -1, "see": "c"} for i in range(10_000)]
+
+
+def loop() -> None:
+    for record in RECORDS:
+        try:
+            function(**record)
+        except ValidationErrorGroup:
+            pass
+
+
+def batch() -> None:
+    for _ in validate_many(function, RECORDS, call=True):
+        pass
+
+
+def processes() -> None:
+    for _ in validate_many(function, RECORDS, call=True, processes=os.cpu_count() or 1):
+        pass
+
+
+def main(number: int = 20) -> None:
+    results = {
+        "call in a loop": timeit.timeit(loop, number=number),
+        "validate_many(call=True)": timeit.timeit(batch, number=number),
+        f"processes={os.cpu_count() or 1}": timeit.timeit(processes, number=number),
+    }
+    for name, seconds in results.items():
+        print(f"{name:<30} {seconds / number / len(RECORDS) * 1e6:8.2f} us/record")
+
+
+if __name__ == "__main__":
+    main()
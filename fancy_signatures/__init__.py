@@ -3,6 +3,12 @@
 """
 
 from .api import argument, validate  # noqa
+from .batch import validate_many, split_results, RecordResult  # noqa
+from .columnar import validate_columns, ColumnarResult  # noqa
+from .payload import call_from_json  # noqa
+from .ndjson import validate_ndjson  # noqa
+from .tabular import validate_csv  # noqa
+from .cursor import validate_cursor  # noqa
 from .core.interface import TypeCaster, Validator, Default  # noqa
 from .core.empty import is_empty  # noqa
 from .typecasting.handlers import register_typecaster, unregister_typecaster, unregister_strict_typecaster  # noqa
@@ -0,0 +1,75 @@
+"""Command line interface of fancy_signatures
+
+Usage: python -m fancy_signatures validate-file module:function path.jsonl
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+import argparse
+import importlib
+import os
+import sys
+import time
+
+from .ndjson import validate_ndjson
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m fancy_signatures")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate_file = commands.add_parser(
+        "validate-file", help="Validate the records of a JSON Lines file against the signature of a function"
+    )
+    validate_file.add_argument("target", help="The function decorated with `validate`, as module:function")
+    validate_file.add_argument("path", help="Path of the JSON Lines file")
+    validate_file.add_argument("--not-lazy", action="store_true", help="Only report the first error of each record")
+    validate_file.add_argument(
+        "--max-errors", type=int, default=None, help="Maximum number of errors to print, all are counted"
+    )
+
+    args = parser.parse_args(argv)
+    try:
+        func = _load_target(args.target)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error(f"Can't load '{args.target}': {e}")
+    try:
+        return _validate_file(func, args.path, not args.not_lazy, args.max_errors)
+    except OSError as e:
+        parser.error(f"Can't read '{args.path}': {e}")
+
+
+def _load_target(target: str) -> Callable[..., Any]:
+    module_name, _, attribute_path = target.partition(":")
+    if not module_name or not attribute_path:
+        raise ValueError("the target should be formatted as module:function")
+    obj: Any = importlib.import_module(module_name)
+    for attribute in attribute_path.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def _validate_file(func: Callable[..., Any], path: str, lazy: bool, max_errors: int | None) -> int:
+    start = time.perf_counter()
+    num_valid = 0
+    num_invalid = 0
+    for result in validate_ndjson(func, path, lazy=lazy):
+        if result.ok:
+            num_valid += 1
+            continue
+        num_invalid += 1
+        if max_errors is None or num_invalid <= max_errors:
+            print(f"{path}:{result.position + 1}: {result.error!r}")
+    seconds = time.perf_counter() - start
+
+    total = num_valid + num_invalid
+    megabytes = os.stat(path).st_size / 1e6
+    print(
+        f"{total} records: {num_valid} valid, {num_invalid} invalid in {seconds:.3f} s "
+        f"({total / seconds if seconds else 0:,.0f} records/s, {megabytes / seconds if seconds else 0:,.1f} MB/s)"
+    )
+    return 1 if num_invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
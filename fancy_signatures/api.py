@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from typing import TypeVar, Callable, Any, cast, overload
+from typing import TypeVar, Callable, Any, Awaitable, cast, overload
+from types import MethodType
+import asyncio
 import inspect
+import time
 
 from .validation.related import Related
-from .typecasting import typecaster_factory
+from .typecasting import typecaster_factory, registry_version
 from .default import DefaultValue
 from .core.field import UnTypedArgField, TypedArgField
 from .core.interface import Validator, Default
-from .exceptions import ValidationErrorGroup, ValidationError
-from .core.empty import __EmptyArg__
+from .exceptions import ValidationErrorGroup, ValidationError, MissingArgument, UnrecognizedArgument
+from .core.empty import __EmptyArg__, is_empty
 from .alias import check_alias_collisions, process_aliases
+from .codegen import compile_call
+from . import metrics
 
 
 CallableT = TypeVar("CallableT", bound=Callable[..., Any])
@@ -22,6 +27,9 @@ def argument(
     default: Default | None = None,
     required: bool = True,
     alias: str | None = None,
+    each: list[Validator] | None = None,
+    keys: list[Validator] | None = None,
+    values: list[Validator] | None = None,
 ) -> Any:
     """An argument in a function or method, use this to add behavior to an argument.
 
@@ -31,6 +39,11 @@ def argument(
         required (bool, optional): Whether the argument is required, if not it will default to __EmptyArg__().
         Defaults to True.
         alias (str | None, optional): Alias name for the argument (when parsing from e.g. a dict). Defaults to None.
+        each (list[Validator] | None, optional): Validators to apply to each element of a list, tuple or set argument.
+        Defaults to None.
+        keys (list[Validator] | None, optional): Validators to apply to each key of a dict argument. Defaults to None.
+        values (list[Validator] | None, optional): Validators to apply to each value of a dict argument.
+        Defaults to None.
 
     Returns:
         UnTypedArgField: Container class for processing the field when the decorated function is called.
@@ -39,12 +52,14 @@ def argument(
     """
     default = default if default is not None else DefaultValue()
     validators = validators if validators is not None else []
-    return UnTypedArgField(required, default=default, validators=validators, alias=alias)
+    return UnTypedArgField(
+        required, default=default, validators=validators, alias=alias, each=each, keys=keys, values=values
+    )
 
 
 @overload
 def validate(
-    *, related: list[Related] | None = None, lazy: bool = False, type_strict: bool = False
+    *, related: list[Related] | None = None, lazy: bool = False, type_strict: bool = False, compile: bool = False
 ) -> Callable[[CallableT], CallableT]:
     ...
 
@@ -60,9 +75,12 @@ def validate(
     related: list[Related] | None = None,
     lazy: bool = False,
     type_strict: bool = False,
+    compile: bool = False,
 ) -> Callable[[CallableT], CallableT]:
     """Validate the annotated parameters based on the type hint and the provided 'Validators'.
     If you decorate a class `validate` will validate the `__init__` method of the decorated class.
+    If you decorate a coroutine function, the validators may be async (see `Validator.is_async`), these are awaited
+    concurrently when the returned coroutine function is called.
 
     Args:
         __func_or_cls (FuncT, optional): The decorated callable. Can be a class, method, or function.
@@ -73,6 +91,8 @@ def validate(
         Related (list[Related], optional): Related validators that apply a validation function on two or more arguments.
         Defaults to None
         type_strict (bool, optional): Whether to raise an error if a typecheck fails, or attempt a typecast first
+        compile (bool, optional): Whether to generate a specialized function for processing the arguments of this
+        specific signature when decorating. This reduces the overhead per call. Defaults to False.
 
     Raises:
         ValidationError: error that occurred during validation of parameters
@@ -92,10 +112,11 @@ def validate(
             # If it's a class, decorate the `__init__` method
             init_func = func_or_cls.__init__
             setattr(init_func, "__fancy_signature_name__", func_or_cls.__name__)
-            func_or_cls.__init__ = _FunctionWrapper(init_func, related, lazy, type_strict)
+            func_or_cls.__init__ = _FunctionWrapper(init_func, related, lazy, type_strict, compile)
             return cast(CallableT, func_or_cls)
         setattr(func_or_cls, "__fancy_signature_name__", func_or_cls.__name__)
-        return cast(CallableT, _FunctionWrapper(func_or_cls, related, lazy, type_strict))
+        wrapper_cls = _AsyncFunctionWrapper if inspect.iscoroutinefunction(func_or_cls) else _FunctionWrapper
+        return cast(CallableT, wrapper_cls(func_or_cls, related, lazy, type_strict, compile))
 
     if __func_or_cls is None:
         return wrapper
@@ -110,16 +131,37 @@ class _FunctionWrapper:
         "_func_params",
         "_fields",
         "_related",
+        "_async_related",
+        "_has_async_validators",
+        "_async_defaults",
         "_strict",
+        "_type_hints",
+        "_aliases",
+        "_passthrough",
+        "_registry_version",
+        "_compiled",
+        "_compile_requested",
+        "_compiled_source",
+        "_metrics_generation",
+        "_metrics",
+        "_argument_validators",
         "__name__",
         "__qualname__",
         "__annotations__",
         "__doc__",
         "__dict__",
+        "__weakref__",
     )
 
+    _is_async = False
+
     def __init__(
-        self, wrapped_func: CallableT, related_validators: list[Related], lazy: bool, type_strict: bool
+        self,
+        wrapped_func: CallableT,
+        related_validators: list[Related],
+        lazy: bool,
+        type_strict: bool,
+        compile: bool = False,
     ) -> None:
         if not hasattr(wrapped_func, "__fancy_signature_name__"):
             raise AttributeError(
@@ -131,10 +173,14 @@ class _FunctionWrapper:
         signature = inspect.signature(wrapped_func)
         _ = annotations_dict.pop("return", Any)
         named_fields: dict[str, TypedArgField] = {}
+        type_hints: dict[str, Any] = {}
+
+        self._registry_version = registry_version()
 
         prepared_arg: UnTypedArgField
         for name, parameter in signature.parameters.items():
-            typecaster = typecaster_factory(type_hint=annotations_dict.get(name, Any))
+            type_hints[name] = annotations_dict.get(name, Any)
+            typecaster = typecaster_factory(type_hint=type_hints[name])
             if isinstance(parameter.default, UnTypedArgField):
                 prepared_arg = parameter.default
             elif parameter.default == inspect._empty:
@@ -149,8 +195,41 @@ class _FunctionWrapper:
         self._wrapped_func = wrapped_func
         self._func_params = signature.parameters
         self._fields = named_fields
-        self._related = related_validators
+        self._related = [related for related in related_validators if not related.is_async]
+        self._async_related = [related for related in related_validators if related.is_async]
+        self._has_async_validators = bool(self._async_related) or any(
+            field.async_validators for field in named_fields.values()
+        )
+        if self._has_async_validators and not self._is_async:
+            raise TypeError(
+                f"'{wrapped_func.__fancy_signature_name__}' has async validators, "
+                "which can only be used for coroutine functions"
+            )
+        # Position, name and alias of the parameters with an async default
+        self._async_defaults = tuple(
+            (i, name, field.alias) for i, (name, field) in enumerate(named_fields.items()) if field.default.is_async
+        )
+        if self._async_defaults and not self._is_async:
+            raise TypeError(
+                f"'{wrapped_func.__fancy_signature_name__}' has async defaults, "
+                "which can only be used for coroutine functions"
+            )
         self._strict = type_strict
+        self._type_hints = type_hints
+        self._aliases: dict[str, str | None] = {
+            name: field.alias for name, field in named_fields.items() if field.alias is not None
+        }
+        self._passthrough = frozenset(
+            name for name, field in named_fields.items() if _is_passthrough(field, type_hints[name])
+        )
+        # The function `__call__` delegates to, if any: the generated function or a call measuring it
+        self._compiled: Callable[..., Any] | None = None
+        self._compile_requested = compile
+        self._compiled_source: str | None = None
+        self._metrics_generation = -1
+        # Created on the first call with metrics enabled, kept when the TypeCasters are refreshed
+        self._metrics: metrics.FunctionMetrics | None = None
+        self._argument_validators: dict[bool, Callable[..., dict[str, Any]]] = {}
 
         # Copying all interesting stuff from the wrapped function (much like functools.wraps)
         self.__name__ = wrapped_func.__name__
@@ -159,29 +238,187 @@ class _FunctionWrapper:
         self.__module__ = wrapped_func.__module__
         self.__doc__ = wrapped_func.__doc__
 
-    def __get__(self, obj: Any, objtype: type[Any] | None = None) -> _FunctionWrapper:
-        """Bind the wrapped function and return another _FunctionWrapper wrapping that."""
+        self._select_call()
+
+    def __get__(self, obj: Any, objtype: type[Any] | None = None) -> _FunctionWrapper | MethodType:
+        """Bind this wrapper to `obj`, like a function is bound to become a method.
+
+        The bound method calls this wrapper with `obj` as first argument, so the fields, typecasters and
+        validators are shared by all instances instead of being rebuilt for every instance. Like a regular
+        method, nothing is stored on `obj`, which keeps memory usage per instance flat and supports
+        classes using `__slots__`.
+        """
         if obj is None:
+            return self
+        return MethodType(self, obj)
+
+    def __reduce__(self) -> str:
+        """Pickle the wrapper by reference, like a function: only its module and qualified name are stored.
+
+        The decorated function is replaced by its wrapper in its module (or class), so unpickling imports the
+        module and finds the wrapper, whose fields were built when the module was decorated. The fields,
+        TypeCasters and generated code are never pickled, only functions that can be imported can be pickled.
+        """
+        return self.__qualname__
+
+    @property
+    def compiled_source(self) -> str | None:
+        """The source code of the generated function when decorated with `compile=True`, otherwise None"""
+        return self._compiled_source
+
+    def _compile(self) -> None:
+        self._compiled, self._compiled_source = compile_call(
+            self._wrapped_func.__fancy_signature_name__,
+            self._func_params,
+            self._fields,
+            self._related,
+            self._lazy,
+            self._strict,
+            self._wrapped_func,
+            qualname=self._qualified_name(),
+        )
+
+    def _qualified_name(self) -> str:
+        return f"{self._wrapped_func.__module__}.{self._wrapped_func.__qualname__}"
+
+    def _argument_validator(self, lazy: bool) -> Callable[..., dict[str, Any]]:
+        """Get a function that processes the arguments like calling this wrapper does, but instead
+        of calling the wrapped function it returns the validated arguments as a dict.
+
+        If possible a specialized function is generated (see `compile_call`), it's created once per
+        value of `lazy`.
+        """
+        self._check_registry()
+
+        argument_validator = self._argument_validators.get(lazy)
+        if argument_validator is None:
             try:
-                return objtype.__getattribute__(objtype, self.__name__)  # type: ignore
-            except AttributeError:
-                # First time the attribute is accessed only
-                pass
-
-        bound_function = self._wrapped_func.__get__(obj, objtype)
-        result = self.__class__(bound_function, self._related, self._lazy, self._strict)
-        if self.__name__ is not None:
-            if obj is not None:
-                setattr(obj, self.__name__, result)
+                argument_validator = self._compile_argument_validator(lazy)
+            except NotImplementedError:
+
+                def argument_validator(*args: Any, **kwargs: Any) -> dict[str, Any]:
+                    return self._process_arguments(args, kwargs, lazy)
+
+            self._argument_validators[lazy] = argument_validator
+        return argument_validator
+
+    def _compile_argument_validator(self, lazy: bool) -> Callable[..., dict[str, Any]]:
+        argument_validator, _ = compile_call(
+            self._wrapped_func.__fancy_signature_name__,
+            self._func_params,
+            self._fields,
+            self._related,
+            lazy,
+            self._strict,
+            dict,
+            call_with_keywords=True,
+            qualname=self._qualified_name(),
+        )
+        return argument_validator
+
+    def _check_registry(self) -> None:
+        if self._registry_version != registry_version():
+            self._refresh_typecasters()
+        elif self._metrics_generation != metrics.generation():
+            self._select_call()
+
+    def _refresh_typecasters(self) -> None:
+        """Rebuild the TypeCasters of all fields, used when the handler registry changed after decorating.
+
+        The version is updated last, so other threads keep refreshing (instead of using outdated fields)
+        until the new fields are in place.
+        """
+        version = registry_version()
+        self._fields = {
+            name: field.set_type(typecaster_factory(self._type_hints[name])) for name, field in self._fields.items()
+        }
+        self._argument_validators = {}
+        self._select_call()
+        self._registry_version = version
+
+    def _select_call(self) -> None:
+        """Select how calls are processed: by the generated function if compiling was requested. With metrics
+        enabled (see `metrics.enable`) the processing of the arguments is measured as well.
+
+        The metrics generation is updated last, like the registry version in `_refresh_typecasters`.
+        """
+        generation = metrics.generation()
+        compiled: Callable[..., Any] | None = None
+        if self._compile_requested:
+            self._compile()
+            compiled = self._compiled
+        if metrics.is_enabled() and not self._has_async_validators and not self._async_defaults:
+            function_metrics = self._metrics
+            if function_metrics is None:
+                function_metrics = self._metrics = metrics.register(
+                    self,
+                    f"{self.__module__}.{self.__qualname__}",
+                    [name for name in self._fields if name not in self._passthrough],
+                )
+            lazy = self._lazy
+            if compiled is not None:
+                # Only the time is measured, by the same generated code returning the arguments instead
+                process_arguments = self._compile_argument_validator(lazy)
             else:
-                setattr(objtype, self.__name__, result)
-        return result
+                counters = function_metrics.parameters
+
+                def process_arguments(*args: Any, **kwargs: Any) -> dict[str, Any]:
+                    return self._process_arguments(args, kwargs, lazy, counters)
+
+            compiled = _measured_call(self._wrapped_func, process_arguments, function_metrics)
+        self._compiled = compiled
+        self._metrics_generation = generation
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        kwargs = process_aliases(
-            {name: field.alias for name, field in self._fields.items()},
-            kwargs,
-        )
+        if self._registry_version != registry_version() or self._metrics_generation != metrics.generation():
+            self._check_registry()
+
+        if self._compiled is not None:
+            return self._compiled(*args, **kwargs)
+
+        return self._wrapped_func(**self._process_arguments(args, kwargs, self._lazy))
+
+    def _process_arguments(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any], lazy: bool, counters: metrics.Counters | None = None
+    ) -> dict[str, Any]:
+        """Assign the arguments to the parameters, then validate and typecast them.
+
+        Args:
+            args (tuple[Any, ...]): Positional arguments
+            kwargs (dict[str, Any]): Keyword arguments, this dict is updated in place
+            lazy (bool): Whether to collect the errors in a `ValidationErrorGroup`
+            counters (metrics.Counters | None, optional): Counters of the outcome per parameter, to update when
+            collecting metrics. Defaults to None.
+
+        Returns:
+            dict[str, Any]: The validated arguments per parameter name
+        """
+        kwargs, errors = self._process_fields(args, kwargs, lazy, counters)
+        if errors:
+            raise ValidationErrorGroup(
+                f"Parameter validation for {self._wrapped_func.__fancy_signature_name__} failed", list(errors.values())
+            )
+        self._apply_related(kwargs, lazy)
+        return kwargs
+
+    def _process_fields(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any], lazy: bool, counters: metrics.Counters | None = None
+    ) -> tuple[dict[str, Any], dict[str, ValidationError | ValidationErrorGroup]]:
+        """Assign the arguments to the parameters and execute the field of each parameter.
+
+        Args:
+            args (tuple[Any, ...]): Positional arguments
+            kwargs (dict[str, Any]): Keyword arguments, this dict is updated in place
+            lazy (bool): Whether to collect the errors, otherwise the first error is raised
+            counters (metrics.Counters | None, optional): Counters of the outcome per parameter, to update when
+            collecting metrics. Defaults to None.
+
+        Returns:
+            tuple[dict[str, Any], dict[str, ValidationError | ValidationErrorGroup]]: The arguments per parameter name
+            and the errors per parameter name (only when lazy)
+        """
+        if self._aliases:
+            kwargs = process_aliases(self._aliases, kwargs)
 
         for i, param_name in enumerate(self._func_params):
             if param_name not in kwargs:
@@ -190,38 +427,235 @@ class _FunctionWrapper:
                 else:
                     kwargs[param_name] = __EmptyArg__()
 
-        errors: list[ValidationError | ValidationErrorGroup] = []
+        errors: dict[str, ValidationError | ValidationErrorGroup] = {}
         for name, value in kwargs.items():
+            if name in self._passthrough and not isinstance(value, __EmptyArg__):
+                continue
+
             try:
                 field = self._fields[name]
             except KeyError:
-                raise TypeError(f"Unrecognized argument '{name}' for '{self._wrapped_func.__fancy_signature_name__}'")
+                raise UnrecognizedArgument(
+                    f"Unrecognized argument '{name}' for '{self._wrapped_func.__fancy_signature_name__}'"
+                )
 
             try:
-                kwargs[name] = field.execute(name, value, self._lazy, self._strict)
+                result = field.execute(name, value, lazy, self._strict)
             except (ValidationError, ValidationErrorGroup) as e:
-                if self._lazy:
+                if counters is not None:
+                    metrics.count_failure(counters, name)
+                if lazy:
+                    errors[name] = e
+                    continue
+                raise e
+            except MissingArgument:
+                if counters is not None:
+                    metrics.count_failure(counters, name)
+                raise
+            if counters is not None:
+                metrics.count(counters, name, value, result)
+            kwargs[name] = result
+
+        return kwargs, errors
+
+    def _apply_related(self, kwargs: dict[str, Any], lazy: bool) -> None:
+        errors: list[ValidationError | ValidationErrorGroup] = []
+        for related_validator in self._related:
+            try:
+                related_validator(**kwargs)
+            except ValidationError as e:
+                if lazy:
                     errors.append(e)
                 else:
                     raise e
 
         if errors:
             raise ValidationErrorGroup(
-                f"Parameter validation for {self._wrapped_func.__fancy_signature_name__} failed", errors
+                f"Related parameter validation for {self._wrapped_func.__fancy_signature_name__} failed", errors
             )
 
-        for related_validator in self._related:
-            try:
-                related_validator(**kwargs)
-            except ValidationError as e:
-                if self._lazy:
-                    errors.append(e)
-                else:
-                    raise e
+
+class _AsyncFunctionWrapper(_FunctionWrapper):
+    """Wrapper of a coroutine function, calling it returns a coroutine.
+
+    Besides regular validators, the arguments can have validators with a coroutine `validate` method
+    and related validators can use a coroutine function. Those are awaited concurrently, after the
+    arguments were typecasted and the regular validators were applied. The async related validators are
+    awaited after the regular related validators. Async defaults of missing arguments are awaited
+    concurrently before anything else.
+    """
+
+    __slots__ = ()
+
+    _is_async = True
+
+    def __init__(
+        self,
+        wrapped_func: CallableT,
+        related_validators: list[Related],
+        lazy: bool,
+        type_strict: bool,
+        compile: bool = False,
+    ) -> None:
+        super().__init__(wrapped_func, related_validators, lazy, type_strict, compile)
+        if hasattr(inspect, "markcoroutinefunction"):
+            # Python 3.12+, makes `inspect.iscoroutinefunction` recognize the wrapper
+            inspect.markcoroutinefunction(self)
+
+    def _compile(self) -> None:
+        if self._has_async_validators:
+            # The generated function can't await the async validators, the arguments are processed as usual
+            return
+        super()._compile()
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if self._registry_version != registry_version() or self._metrics_generation != metrics.generation():
+            self._check_registry()
+        if self._async_defaults:
+            await self._resolve_async_defaults(args, kwargs)
+
+        if self._compiled is not None:
+            return await self._compiled(*args, **kwargs)
+        if not self._has_async_validators:
+            return await self._wrapped_func(**self._process_arguments(args, kwargs, self._lazy))
+
+        lazy = self._lazy
+        kwargs, errors = self._process_fields(args, kwargs, lazy)
+        await self._apply_async_validators(kwargs, errors, lazy)
+        if errors:
+            raise ValidationErrorGroup(
+                f"Parameter validation for {self._wrapped_func.__fancy_signature_name__} failed",
+                [errors[name] for name in self._func_params if name in errors],
+            )
+        self._apply_related(kwargs, lazy)
+        await self._apply_async_related(kwargs, lazy)
+        return await self._wrapped_func(**kwargs)
+
+    async def _resolve_async_defaults(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        """Await the async defaults of the missing arguments concurrently and add them to `kwargs`"""
+        missing = [
+            name
+            for i, name, alias in self._async_defaults
+            if i >= len(args) and name not in kwargs and (alias is None or alias not in kwargs)
+        ]
+        if not missing:
+            return
+        empty = __EmptyArg__()
+        values = await asyncio.gather(*(self._fields[name].default.get_async(empty) for name in missing))
+        kwargs.update(zip(missing, values))
+
+    async def _apply_async_validators(
+        self, kwargs: dict[str, Any], errors: dict[str, ValidationError | ValidationErrorGroup], lazy: bool
+    ) -> None:
+        """Await the async validators of all valid, non-empty arguments concurrently and add their errors to `errors`"""
+        names: list[str] = []
+        calls: list[Awaitable[Any]] = []
+        for name, field in self._fields.items():
+            value = kwargs[name]
+            if name in errors or is_empty(value):
+                continue
+            for validator in field.async_validators:
+                names.append(name)
+                calls.append(validator.call_async(name, value))
+        if not calls:
+            return
+
+        field_errors: dict[str, list[ValidationError]] = {}
+        for name, result in zip(names, await asyncio.gather(*calls, return_exceptions=True)):
+            if not isinstance(result, BaseException):
+                continue
+            if not isinstance(result, ValidationError) or not lazy:
+                raise result
+            field_errors.setdefault(name, []).append(result)
+
+        for name, validation_errors in field_errors.items():
+            errors[name] = ValidationErrorGroup(f"Errors during validation of '{name}'", validation_errors)
+
+    async def _apply_async_related(self, kwargs: dict[str, Any], lazy: bool) -> None:
+        if not self._async_related:
+            return
+        results = await asyncio.gather(
+            *(related_validator.call_async(**kwargs) for related_validator in self._async_related),
+            return_exceptions=True,
+        )
+        errors: list[ValidationError | ValidationErrorGroup] = []
+        for result in results:
+            if not isinstance(result, BaseException):
+                continue
+            if not isinstance(result, ValidationError) or not lazy:
+                raise result
+            errors.append(result)
 
         if errors:
             raise ValidationErrorGroup(
                 f"Related parameter validation for {self._wrapped_func.__fancy_signature_name__} failed", errors
             )
 
-        return self._wrapped_func(**kwargs)
+
+def _measured_call(
+    wrapped_func: Callable[..., Any],
+    process_arguments: Callable[..., dict[str, Any]],
+    function_metrics: metrics.FunctionMetrics,
+) -> Callable[..., Any]:
+    """Get a function that processes the arguments like `process_arguments` and calls `wrapped_func`, recording
+    the time spent processing the arguments in `function_metrics`"""
+    perf_counter_ns = time.perf_counter_ns
+    record = function_metrics.record
+
+    def measured_call(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            kwargs = process_arguments(*args, **kwargs)
+        except BaseException:
+            record(perf_counter_ns() - start, True)
+            raise
+        record(perf_counter_ns() - start, False)
+        return wrapped_func(**kwargs)
+
+    return measured_call
+
+
+def _is_passthrough(field: TypedArgField, type_hint: Any) -> bool:
+    """Whether executing the field returns any non-empty value as is.
+
+    This holds for parameters without type hint, validators and default, like `self`. Skipping those
+    makes calling a method as cheap as calling a function.
+    """
+    default = field.default
+    return (
+        type_hint is Any
+        and not field.validators
+        and field.alias is None
+        and type(default) is DefaultValue
+        and is_empty(default.value)
+    )
+
+
+def _unwrap(
+    func: Callable[..., Any], *, allow_async_validators: bool = False
+) -> tuple[_FunctionWrapper, tuple[Any, ...]]:
+    """Get the `_FunctionWrapper` of a function or method decorated with `validate`
+
+    Args:
+        func (Callable[..., Any]): The decorated function, or a method bound to an instance or class
+        allow_async_validators (bool, optional): Whether the function may have async validators and defaults. Only
+        calling the function applies those, they are skipped when its arguments are validated otherwise.
+        Defaults to False.
+
+    Raises:
+        TypeError: If `func` isn't decorated with `validate`, or has async validators or defaults that aren't allowed
+
+    Returns:
+        tuple[_FunctionWrapper, tuple[Any, ...]]: The wrapper and the arguments bound to it (the instance for methods)
+    """
+    wrapper: _FunctionWrapper
+    bound_args: tuple[Any, ...]
+    if isinstance(func, MethodType) and isinstance(func.__func__, _FunctionWrapper):
+        wrapper, bound_args = func.__func__, (func.__self__,)
+    elif isinstance(func, _FunctionWrapper):
+        wrapper, bound_args = func, ()
+    else:
+        raise TypeError(f"'{getattr(func, '__name__', func)}' should be a function or method decorated with `validate`")
+    if (wrapper._has_async_validators or wrapper._async_defaults) and not allow_async_validators:
+        raise TypeError(f"'{wrapper.__name__}' has async validators or defaults, call it to validate its arguments")
+    return wrapper, bound_args
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import itertools
+import pickle
+
+from .api import _unwrap, _FunctionWrapper
+from .settings import _snapshot as settings_snapshot, _restore as restore_settings
+from .typecasting.handlers import handler_registry, restore_handlers
+from .exceptions import ValidationError, MissingArgument, UnrecognizedArgument
+
+
+class RecordResult(NamedTuple):
+    """The result of validating a single record
+
+    Attributes:
+        position (int): Position of the record in the input
+        value (Any): The validated arguments, or the return value of the function if it was called.
+        None if the validation failed.
+        error (Exception | None): The error if the validation failed, otherwise None.
+    """
+
+    position: int
+    value: Any
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def validate_many(
+    func: Callable[..., Any],
+    records: Iterable[Mapping[str, Any]],
+    *,
+    lazy: bool = True,
+    call: bool = False,
+    processes: int | None = None,
+    chunk_size: int = 1000,
+) -> Iterator[RecordResult]:
+    """Validate many records against the signature of a function decorated with `validate`.
+
+    Every record is a mapping of argument names (or aliases) to values, like the keyword arguments
+    of a call. The fields and related validators of the decorated function are reused for every record.
+    Invalid records don't stop the iteration: a `ValidationError`, `MissingArgument` or `UnrecognizedArgument` is
+    returned per record. Other exceptions, e.g. raised by a bug in a validator, are raised.
+
+    With `processes`, the records are validated by a pool of worker processes in chunks of `chunk_size`
+    records. The function is pickled by reference, so every worker imports it (and builds its fields) once.
+    The settings and registered TypeCasters of this process are sent to the workers as well, so the records
+    are validated the same as without `processes` (also with the `spawn` start method). Metrics (see
+    `fancy_signatures.metrics`) aren't collected for records validated by a worker.
+    The records, and the results, should be picklable. Only a few chunks are sent ahead, so records are
+    consumed while the results are iterated.
+
+    Args:
+        func (Callable[..., Any]): Function or method decorated with `validate`, for `processes` it should be
+        importable (defined at the top level of a module, or a method of such a class)
+        records (Iterable[Mapping[str, Any]]): The records to validate
+        lazy (bool, optional): Whether to collect all errors of a record in a `ValidationErrorGroup`, or only
+        return the first error. Defaults to True.
+        call (bool, optional): Whether to call the function with the validated arguments. Defaults to False.
+        processes (int | None, optional): Number of worker processes. Defaults to None, validate in this process.
+        chunk_size (int, optional): Number of records sent to a worker process at once. Defaults to 1000.
+
+    Raises:
+        TypeError: If `func` isn't decorated with `validate`
+        ValueError: If `processes` or `chunk_size` isn't positive
+        pickle.PicklingError: If `processes` is given and `func`, or a registered TypeCaster, can't be pickled
+
+    Returns:
+        Iterator[RecordResult]: The result per record, in the order of the records
+    """
+    wrapper, bound_args = _unwrap(func)
+    if processes is not None:
+        if processes < 1 or chunk_size < 1:
+            raise ValueError(f"processes and chunk_size should be positive, got {processes} and {chunk_size}")
+        try:
+            pickle.dumps(func)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise pickle.PicklingError(f"Can't send '{wrapper.__qualname__}' to worker processes: {e}") from e
+        state = _worker_state()
+        try:
+            pickle.dumps(state)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise pickle.PicklingError(f"Can't send the registered TypeCasters to worker processes: {e}") from e
+        return _iter_process_results(func, records, lazy, call, processes, chunk_size, state)
+
+    record_validator = _record_validator(wrapper, bound_args, lazy)
+    return _iter_results(record_validator, wrapper._wrapped_func if call else None, records)
+
+
+def _record_validator(
+    wrapper: _FunctionWrapper, bound_args: tuple[Any, ...], lazy: bool
+) -> Callable[[Mapping[str, Any]], dict[str, Any]]:
+    """Get a function that validates a record like `wrapper._argument_validator`, passing the bound arguments.
+
+    A key that can't be passed as keyword argument, because it isn't a string or names a bound parameter
+    (e.g. `self`), raises `UnrecognizedArgument` like any other unknown key.
+    """
+    argument_validator = wrapper._argument_validator(lazy)
+    bound_names = frozenset(list(wrapper._fields)[: len(bound_args)])
+    func_name: str = getattr(wrapper._wrapped_func, "__fancy_signature_name__")
+
+    def validate_record(record: Mapping[str, Any]) -> dict[str, Any]:
+        for key in record:
+            if not isinstance(key, str) or key in bound_names:
+                raise UnrecognizedArgument(f"Unrecognized argument '{key}' for '{func_name}'")
+        return argument_validator(*bound_args, **record)
+
+    return validate_record
+
+
+def _iter_results(
+    record_validator: Callable[[Mapping[str, Any]], dict[str, Any]],
+    wrapped_func: Callable[..., Any] | None,
+    records: Iterable[Mapping[str, Any]],
+    start: int = 0,
+) -> Iterator[RecordResult]:
+    for position, record in enumerate(records, start):
+        try:
+            kwargs = record_validator(record)
+        except (ValidationError, MissingArgument, UnrecognizedArgument) as e:
+            yield RecordResult(position, None, e)
+            continue
+
+        yield RecordResult(position, kwargs if wrapped_func is None else wrapped_func(**kwargs))
+
+
+# The settings, strict handlers and handlers sent to the worker processes of `validate_many`
+_WorkerState = tuple[dict[str, Any], dict[Any, Any], dict[Any, Any]]
+# The record validator and function to call of a worker process of `validate_many`
+_worker_plan: tuple[Callable[[Mapping[str, Any]], dict[str, Any]], Callable[..., Any] | None] | None = None
+
+
+def _iter_process_results(
+    func: Callable[..., Any],
+    records: Iterable[Mapping[str, Any]],
+    lazy: bool,
+    call: bool,
+    processes: int,
+    chunk_size: int,
+    state: _WorkerState,
+) -> Iterator[RecordResult]:
+    initargs = (func, lazy, call, state)
+    with ProcessPoolExecutor(processes, initializer=_init_worker, initargs=initargs) as executor:
+        pending: deque[Future[list[RecordResult]]] = deque()
+        iterator = iter(records)
+        start = 0
+        while chunk := list(itertools.islice(iterator, chunk_size)):
+            pending.append(executor.submit(_validate_chunk, chunk, start))
+            start += len(chunk)
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _worker_state() -> _WorkerState:
+    """Get the state of this process that influences validation, to apply in the worker processes"""
+    registry = handler_registry()
+    return settings_snapshot(), dict(registry.strict_handlers), dict(registry.handlers)
+
+
+def _init_worker(func: Callable[..., Any], lazy: bool, call: bool, state: _WorkerState) -> None:
+    global _worker_plan
+    settings, strict_handlers, handlers = state
+    restore_settings(settings)
+    restore_handlers(strict_handlers, handlers)
+    wrapper, bound_args = _unwrap(func)
+    _worker_plan = _record_validator(wrapper, bound_args, lazy), wrapper._wrapped_func if call else None
+
+
+def _validate_chunk(records: list[Mapping[str, Any]], start: int) -> list[RecordResult]:
+    assert _worker_plan is not None, "The worker process wasn't initialized"
+    record_validator, wrapped_func = _worker_plan
+    return list(_iter_results(record_validator, wrapped_func, records, start))
+
+
+def split_results(results: Iterable[RecordResult]) -> tuple[Iterator[RecordResult], Iterator[RecordResult]]:
+    """Split results into an iterator of the valid results and an iterator of the invalid results.
+
+    Both iterators consume `results` in a single pass. Results for the other iterator are buffered until
+    that iterator reaches them, so consume both (e.g. alternately), or `close` the iterator you don't need
+    to stop buffering for it.
+
+    Args:
+        results (Iterable[RecordResult]): The results, e.g. of `validate_many`
+
+    Returns:
+        tuple[Iterator[RecordResult], Iterator[RecordResult]]: The valid and the invalid results, in order
+    """
+    source = _SplitSource(results)
+    return _SplitResults(source, True), _SplitResults(source, False)
+
+
+class _SplitSource:
+    """The results shared by the iterators of `split_results`, with a buffer per iterator"""
+
+    __slots__ = ("results", "buffers", "closed")
+
+    def __init__(self, results: Iterable[RecordResult]) -> None:
+        self.results = iter(results)
+        self.buffers: dict[bool, deque[RecordResult]] = {True: deque(), False: deque()}
+        self.closed = {True: False, False: False}
+
+    def next(self, ok: bool) -> RecordResult:
+        buffer = self.buffers[ok]
+        if buffer:
+            return buffer.popleft()
+        for result in self.results:
+            if result.ok is ok:
+                return result
+            if not self.closed[not ok]:
+                self.buffers[not ok].append(result)
+        raise StopIteration
+
+
+class _SplitResults(Iterator[RecordResult]):
+    __slots__ = ("_source", "_ok")
+
+    def __init__(self, source: _SplitSource, ok: bool) -> None:
+        self._source = source
+        self._ok = ok
+
+    def __next__(self) -> RecordResult:
+        if self._source.closed[self._ok]:
+            raise StopIteration
+        return self._source.next(self._ok)
+
+    def close(self) -> None:
+        """Stop iterating and stop buffering results for this iterator"""
+        self._source.closed[self._ok] = True
+        self._source.buffers[self._ok].clear()
+
+    def __del__(self) -> None:
+        self.close()
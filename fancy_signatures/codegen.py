@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, NoReturn
+import inspect
+import itertools
+import linecache
+import weakref
+
+from .validation.related import Related
+from .default import DefaultValue, DefaultFactory
+from .core.field import TypedArgField, element_validation_error
+from .core.interface import has_default_coerce
+from .core.empty import __EmptyArg__, is_empty
+from .exceptions import (
+    ValidationError,
+    ValidationErrorGroup,
+    TypeValidationError,
+    TypeCastError,
+    MissingArgument,
+    UnrecognizedArgument,
+    ElementValidationFailed,
+)
+
+
+_SUPPORTED_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+# Prefix for all names used internally by the generated code, to avoid collisions with parameter names
+_PREFIX = "_fs_"
+# Numbers the generated functions, so each gets its own file name in `linecache`
+_counter = itertools.count()
+
+
+class _SourceBuilder:
+    """Collects the lines of the generated function and the objects it refers to"""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.namespace: dict[str, Any] = {
+            f"{_PREFIX}EmptyArg": __EmptyArg__,
+            f"{_PREFIX}empty": __EmptyArg__(),
+            f"{_PREFIX}ValidationError": ValidationError,
+            f"{_PREFIX}ValidationErrorGroup": ValidationErrorGroup,
+            f"{_PREFIX}TypeValidationError": TypeValidationError,
+            f"{_PREFIX}TypeCastError": TypeCastError,
+            f"{_PREFIX}MissingArgument": MissingArgument,
+            f"{_PREFIX}ElementValidationFailed": ElementValidationFailed,
+            f"{_PREFIX}element_validation_error": element_validation_error,
+            f"{_PREFIX}raise_unrecognized": _raise_unrecognized,
+        }
+
+    def add(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def bind(self, name: str, obj: Any) -> str:
+        name = f"{_PREFIX}{name}"
+        self.namespace[name] = obj
+        return name
+
+    @property
+    def source(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def compile_call(
+    name: str,
+    parameters: Mapping[str, inspect.Parameter],
+    fields: dict[str, TypedArgField],
+    related: list[Related],
+    lazy: bool,
+    strict: bool,
+    func: Callable[..., Any],
+    call_with_keywords: bool = False,
+    qualname: str | None = None,
+) -> tuple[Callable[..., Any], str]:
+    """Generate a function that processes the arguments for one specific signature.
+
+    The generated function behaves like `_FunctionWrapper.__call__`, but all loops over the parameters, aliases
+    and validators are unrolled at decoration time. The parameters of the decorated function are the parameters
+    of the generated function, so arguments are assigned to parameters like in a regular function call.
+
+    Args:
+        name (str): Name of the decorated function, used in error messages
+        parameters (Mapping[str, inspect.Parameter]): The parameters of the decorated function
+        fields (dict[str, TypedArgField]): The fields of the parameters
+        related (list[Related]): Related validators
+        lazy (bool): Whether to collect errors in a `ValidationErrorGroup`
+        strict (bool): Whether typecasting is disabled
+        func (Callable[..., Any]): The decorated function
+        call_with_keywords (bool, optional): Whether to pass all arguments to `func` as keyword arguments.
+        Defaults to False.
+        qualname (str | None, optional): Module and qualified name of the decorated function, used in the file
+        name of the generated source shown in tracebacks. Defaults to None, `name`.
+
+    Raises:
+        NotImplementedError: If the signature contains positional-only or variadic parameters
+
+    Returns:
+        tuple[Callable[..., Any], str]: The generated function and its source code
+    """
+    for parameter in parameters.values():
+        if parameter.kind not in _SUPPORTED_KINDS:
+            raise NotImplementedError(
+                f"Compiling a signature with {parameter.kind.description} parameter '{parameter.name}' is not "
+                "supported, use `validate(compile=False)` for this function."
+            )
+        if parameter.name.startswith(_PREFIX):
+            raise NotImplementedError(
+                f"Compiling a signature with parameter names starting with '{_PREFIX}' is not " "supported"
+            )
+
+    builder = _SourceBuilder()
+    func_name = builder.bind("func", func)
+    name_var = builder.bind("name", name)
+    kwargs_var = f"{_PREFIX}kwargs"
+    errors_var = f"{_PREFIX}errors"
+
+    signature = ", ".join(f"{param_name}={_PREFIX}empty" for param_name in parameters)
+    builder.add(0, f"def compiled_call({signature}, **{kwargs_var}):")
+
+    # Aliases, and arguments that don't belong to any parameter
+    aliases = [(param_name, field.alias) for param_name, field in fields.items() if field.alias is not None]
+    indent = 1
+    if aliases:
+        builder.add(1, f"if {kwargs_var}:")
+        indent = 2
+        for param_name, alias in aliases:
+            builder.add(2, f"if {kwargs_var}.get({alias!r}):")
+            builder.add(3, f"{param_name} = {kwargs_var}.pop({alias!r})")
+    builder.add(indent, f"if {kwargs_var}:")
+    builder.add(indent + 1, f"{_PREFIX}raise_unrecognized({kwargs_var}, {name_var})")
+
+    if lazy:
+        builder.add(1, f"{errors_var} = []")
+
+    for i, (param_name, field) in enumerate(fields.items()):
+        _add_field(builder, i, param_name, field, lazy, strict)
+
+    if lazy:
+        builder.add(1, f"if {errors_var}:")
+        builder.add(
+            2, f'raise {_PREFIX}ValidationErrorGroup(f"Parameter validation for {{{name_var}}} failed", {errors_var})'
+        )
+
+    all_kwargs = ", ".join(f"{param_name}={param_name}" for param_name in parameters)
+    for i, related_validator in enumerate(related):
+        related_name = builder.bind(f"related_{i}", related_validator)
+        if lazy:
+            builder.add(1, "try:")
+            builder.add(2, f"{related_name}({all_kwargs})")
+            builder.add(1, f"except {_PREFIX}ValidationError as {_PREFIX}e:")
+            builder.add(2, f"{errors_var}.append({_PREFIX}e)")
+        else:
+            builder.add(1, f"{related_name}({all_kwargs})")
+
+    if lazy and related:
+        builder.add(1, f"if {errors_var}:")
+        builder.add(
+            2,
+            f'raise {_PREFIX}ValidationErrorGroup(f"Related parameter validation for {{{name_var}}} failed", '
+            f"{errors_var})",
+        )
+
+    call_args = [
+        param_name
+        if parameter.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD and not call_with_keywords
+        else f"{param_name}={param_name}"
+        for param_name, parameter in parameters.items()
+    ]
+    builder.add(1, f"return {func_name}({', '.join(call_args)})")
+
+    source = builder.source
+    variant = "arguments" if call_with_keywords else "call"
+    filename = f"<fancy_signatures compiled {qualname or name} {variant}{' lazy' if lazy else ''} #{next(_counter)}>"
+    exec(compile(source, filename, "exec"), builder.namespace)
+    compiled_call = builder.namespace["compiled_call"]
+    # Make the generated source available to tracebacks and debuggers, for as long as the function exists
+    linecache.cache[filename] = (len(source), None, source.splitlines(keepends=True), filename)
+    weakref.finalize(compiled_call, _forget_source, filename)
+    return compiled_call, source
+
+
+def _add_field(builder: _SourceBuilder, index: int, name: str, field: TypedArgField, lazy: bool, strict: bool) -> None:
+    indent = 1
+    default = field.default
+    exc = f"{_PREFIX}e"
+
+    # Inline the default handling of the built-in defaults, other defaults are always called (like `execute` does)
+    if type(default) is DefaultValue:
+        default_value = builder.bind(f"default_{index}", default.value)
+        maybe_empty = is_empty(default.value)
+        if not maybe_empty:
+            builder.add(indent, f"if isinstance({name}, {_PREFIX}EmptyArg):")
+            builder.add(indent + 1, f"{name} = {default_value}")
+    elif type(default) is DefaultFactory:
+        factory = builder.bind(f"default_{index}", default.factory)
+        maybe_empty = True
+        builder.add(indent, f"if isinstance({name}, {_PREFIX}EmptyArg):")
+        builder.add(indent + 1, f"{name} = {factory}()")
+    else:
+        default_func = builder.bind(f"default_{index}", default)
+        maybe_empty = True
+        builder.add(indent, f"{name} = {default_func}({name})")
+
+    if maybe_empty:
+        if field.required:
+            message = f"Parameter '{name}' is required and no default was provided"
+            builder.add(indent, f"if isinstance({name}, {_PREFIX}EmptyArg):")
+            builder.add(indent + 1, f"raise {_PREFIX}MissingArgument({message!r})")
+        else:
+            builder.add(indent, f"if not isinstance({name}, {_PREFIX}EmptyArg):")
+            indent += 1
+
+    if lazy:
+        builder.add(indent, "try:")
+        indent += 1
+
+    caster = builder.bind(f"caster_{index}", field.typecaster)
+    if not has_default_coerce(field.typecaster):
+        # The TypeCaster validates and casts in a single pass (and applies element validators), always call it
+        cast_indent = indent
+    else:
+        # Only call the TypeCaster when the type is invalid, this saves a call for valid input
+        validate_type = builder.bind(f"validate_type_{index}", field.typecaster.validate)
+        builder.add(indent, f"if not {validate_type}({name}):")
+        cast_indent = indent + 1
+    builder.add(cast_indent, "try:")
+    builder.add(cast_indent + 1, f"{name} = {caster}({name}, {strict})")
+    builder.add(cast_indent, f"except {_PREFIX}TypeValidationError as {exc}:")
+    builder.add(
+        cast_indent + 1, f'raise {_PREFIX}ValidationError(f"Type validation failed. message: {{{exc}}}", {name!r})'
+    )
+    builder.add(cast_indent, f"except {_PREFIX}TypeCastError as {exc}:")
+    builder.add(
+        cast_indent + 1,
+        f'raise {_PREFIX}ValidationError(f"Couldn\'t cast to the correct type. message: {{{exc}}}", {name!r})',
+    )
+    builder.add(cast_indent, f"except {_PREFIX}MissingArgument as {exc}:")
+    builder.add(cast_indent + 1, f"raise {_PREFIX}ValidationError(str({exc}), {name!r})")
+    if field.validates_elements:
+        builder.add(cast_indent, f"except {_PREFIX}ElementValidationFailed as {exc}:")
+        builder.add(cast_indent + 1, f"raise {_PREFIX}element_validation_error({name!r}, {exc}, {lazy})")
+
+    validators = [builder.bind(f"validator_{index}_{i}", v) for i, v in enumerate(field.sync_validators)]
+    if lazy and validators:
+        field_errors = f"{_PREFIX}field_errors"
+        builder.add(indent, f"{field_errors} = []")
+        for validator in validators:
+            builder.add(indent, "try:")
+            builder.add(indent + 1, f"{validator}({name!r}, {name})")
+            builder.add(indent, f"except {_PREFIX}ValidationError as {exc}:")
+            builder.add(indent + 1, f"{field_errors}.append({exc})")
+        message = f"Errors during validation of '{name}'"
+        builder.add(indent, f"if {field_errors}:")
+        builder.add(indent + 1, f"raise {_PREFIX}ValidationErrorGroup({message!r}, {field_errors})")
+    else:
+        for validator in validators:
+            builder.add(indent, f"{validator}({name!r}, {name})")
+
+    if lazy:
+        indent -= 1
+        builder.add(indent, f"except {_PREFIX}ValidationError as {exc}:")
+        builder.add(indent + 1, f"{_PREFIX}errors.append({exc})")
+
+
+def _forget_source(filename: str) -> None:
+    linecache.cache.pop(filename, None)
+
+
+def _raise_unrecognized(kwargs: dict[str, Any], name: str) -> NoReturn:
+    raise UnrecognizedArgument(f"Unrecognized argument '{next(iter(kwargs))}' for '{name}'")
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Collection, Iterable, Mapping, NamedTuple, Sequence
+from itertools import repeat
+
+from .api import _unwrap, _FunctionWrapper
+from .core.empty import __EmptyArg__
+from .exceptions import ValidationError, ValidationErrorGroup, MissingArgument, UnrecognizedArgument
+
+
+class ColumnarResult(NamedTuple):
+    """The result of validating columns
+
+    Attributes:
+        columns (dict[str, list[Any]]): The validated column per parameter name. Values in invalid rows are left
+        as provided.
+        mask (list[bool]): Whether a row is valid, per row
+        errors (dict[int, ValidationError | MissingArgument]): The error per invalid row
+    """
+
+    columns: dict[str, list[Any]]
+    mask: list[bool]
+    errors: dict[int, ValidationError | MissingArgument]
+
+
+def validate_columns(
+    func: Callable[..., Any],
+    columns: Mapping[str, Sequence[Any]],
+    *,
+    lazy: bool = True,
+) -> ColumnarResult:
+    """Validate columnar data against the signature of a function decorated with `validate`.
+
+    Each column is processed at once by the field of its parameter, so the TypeCaster and validators
+    are applied column by column instead of row by row. Related validators are applied per row, to
+    the rows that are valid so far. The function itself isn't called.
+
+    Args:
+        func (Callable[..., Any]): Function or method decorated with `validate`
+        columns (Mapping[str, Sequence[Any]]): Sequence of values per argument name (or alias), all of the same length.
+        Parameters without a column are treated like arguments that weren't passed.
+        lazy (bool, optional): Whether to collect all errors of a row in a `ValidationErrorGroup`, or only
+        return the first error. Defaults to True.
+
+    Raises:
+        TypeError: If `func` isn't decorated with `validate`, a column doesn't belong to any parameter or a
+        parameter has more than one column (under both its name and its alias)
+        ValueError: If the columns aren't of the same length
+
+    Returns:
+        ColumnarResult: The validated columns, the validity mask and the errors per invalid row
+    """
+    wrapper, bound_args = _unwrap(func)
+    wrapper._check_registry()
+    by_name = dict(zip(_parameter_names(wrapper, bound_args, columns), columns.values()))
+
+    lengths = {len(column) for column in by_name.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns should have the same length, got lengths: {sorted(lengths)}")
+    num_rows = lengths.pop() if lengths else 0
+
+    return _validate_column_batch(wrapper, bound_args, by_name, num_rows, lazy)
+
+
+def _validate_column_batch(
+    wrapper: _FunctionWrapper,
+    bound_args: tuple[Any, ...],
+    by_name: Mapping[str, Iterable[Any]],
+    num_rows: int,
+    lazy: bool,
+    typed: Collection[str] = (),
+) -> ColumnarResult:
+    """Validate columns keyed by parameter name, that all contain `num_rows` values. The values of the columns
+    in `typed` are known to have the correct type."""
+    func_name: str = getattr(wrapper._wrapped_func, "__fancy_signature_name__")
+    validated: dict[str, list[Any]] = {}
+    field_errors: dict[int, list[ValidationError | MissingArgument]] = {}
+    for i, (name, field) in enumerate(wrapper._fields.items()):
+        if i < len(bound_args):
+            values: Any = repeat(bound_args[i], num_rows)
+        else:
+            values = by_name.get(name, repeat(__EmptyArg__(), num_rows))
+        validated[name], column_errors = field.execute_column(name, values, lazy, wrapper._strict, typed=name in typed)
+        for row, error in column_errors.items():
+            field_errors.setdefault(row, []).append(error)
+
+    row_errors: dict[int, ValidationError | MissingArgument] = {}
+    for row, errors in field_errors.items():
+        row_errors[row] = _row_error(errors, f"Parameter validation for {func_name} failed", lazy)
+
+    if wrapper._related:
+        names = list(validated)
+        for row, values in enumerate(zip(*validated.values())):
+            if row in row_errors:
+                continue
+            row_kwargs = dict(zip(names, values))
+            related_errors: list[ValidationError | MissingArgument] = []
+            for related_validator in wrapper._related:
+                try:
+                    related_validator(**row_kwargs)
+                except ValidationError as e:
+                    related_errors.append(e)
+                    if not lazy:
+                        break
+            if related_errors:
+                row_errors[row] = _row_error(
+                    related_errors, f"Related parameter validation for {func_name} failed", lazy
+                )
+
+    mask = [True] * num_rows
+    for row in row_errors:
+        mask[row] = False
+
+    return ColumnarResult(validated, mask, dict(sorted(row_errors.items())))
+
+
+def _parameter_names(wrapper: _FunctionWrapper, bound_args: tuple[Any, ...], column_names: Iterable[str]) -> list[str]:
+    """Get the parameter name for each column name, which is a parameter name or alias
+
+    Raises:
+        TypeError: If a column doesn't belong to any parameter, or a parameter has more than one column (e.g.
+        under both its name and its alias). The bound parameters of a method (e.g. `self`) can't have a column.
+    """
+    by_alias = {alias: name for name, alias in wrapper._aliases.items()}
+    func_name = getattr(wrapper._wrapped_func, "__fancy_signature_name__")
+    num_bound = len(bound_args)
+    parameters = frozenset(list(wrapper._fields)[num_bound:])
+    columns_by_name: dict[str, str] = {}
+    for column_name in column_names:
+        name = by_alias.get(column_name, column_name)
+        if name not in parameters:
+            raise UnrecognizedArgument(f"Unrecognized argument '{column_name}' for '{func_name}'")
+        if name in columns_by_name:
+            raise TypeError(
+                f"Argument '{name}' for '{func_name}' is given more than once, "
+                f"as '{columns_by_name[name]}' and '{column_name}'"
+            )
+        columns_by_name[name] = column_name
+    return list(columns_by_name)
+
+
+def _row_error(
+    errors: list[ValidationError | MissingArgument], message: str, lazy: bool
+) -> ValidationError | MissingArgument:
+    # Like a regular call: a missing argument is raised as is, other errors are grouped when lazy
+    for error in errors:
+        if isinstance(error, MissingArgument):
+            return error
+    if lazy:
+        return ValidationErrorGroup(message, errors)
+    return errors[0]
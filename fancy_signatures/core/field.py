@@ -1,9 +1,17 @@
 from __future__ import annotations
-from typing import Any
+from typing import Any, Iterable
 
-from .interface import TypeCaster, Default, Validator
-from ..exceptions import ValidationError, ValidationErrorGroup, TypeValidationError, TypeCastError, MissingArgument
-from .empty import is_empty
+from .interface import TypeCaster, Default, Validator, has_default_coerce
+from ..exceptions import (
+    ValidationError,
+    ValidationErrorGroup,
+    TypeValidationError,
+    TypeCastError,
+    MissingArgument,
+    ElementValidationFailed,
+)
+from .empty import is_empty, __EmptyArg__
+from ..default.defaults import DefaultValue, DefaultFactory
 
 
 class UnTypedArgField:
@@ -12,24 +20,78 @@ class UnTypedArgField:
         "_validators",
         "_default",
         "_alias",
+        "_each",
+        "_keys",
+        "_values",
     )
 
     @property
     def alias(self) -> str | None:
         return self._alias
 
-    def __init__(self, required: bool, default: Default, validators: list[Validator], alias: str | None = None) -> None:
+    @property
+    def required(self) -> bool:
+        return self._required
+
+    @property
+    def default(self) -> Default:
+        return self._default
+
+    @property
+    def validators(self) -> list[Validator]:
+        return self._validators
+
+    @property
+    def validates_elements(self) -> bool:
+        return bool(self._each or self._keys or self._values)
+
+    def __init__(
+        self,
+        required: bool,
+        default: Default,
+        validators: list[Validator],
+        alias: str | None = None,
+        each: list[Validator] | None = None,
+        keys: list[Validator] | None = None,
+        values: list[Validator] | None = None,
+    ) -> None:
         self._required = required
         self._validators = validators
         self._default = default
         self._alias = alias
+        self._each = each if each is not None else []
+        self._keys = keys if keys is not None else []
+        self._values = values if values is not None else []
 
     def set_type(self, typecaster: TypeCaster) -> TypedArgField:
-        return TypedArgField(self._required, self._default, typecaster, self._validators, self._alias)
+        return TypedArgField(
+            self._required,
+            self._default,
+            typecaster,
+            self._validators,
+            self._alias,
+            each=self._each,
+            keys=self._keys,
+            values=self._values,
+        )
 
 
 class TypedArgField(UnTypedArgField):
-    __slots__ = ("_typecaster",)
+    __slots__ = ("_typecaster", "_sync_validators", "_async_validators")
+
+    @property
+    def typecaster(self) -> TypeCaster:
+        return self._typecaster
+
+    @property
+    def sync_validators(self) -> list[Validator]:
+        """The validators that are applied when the field is executed"""
+        return self._sync_validators
+
+    @property
+    def async_validators(self) -> list[Validator]:
+        """The validators with a coroutine `validate`, applied by the wrapper of a coroutine function"""
+        return self._async_validators
 
     def __init__(
         self,
@@ -38,9 +100,19 @@ class TypedArgField(UnTypedArgField):
         typecaster: TypeCaster,
         validators: list[Validator],
         alias: str | None = None,
+        each: list[Validator] | None = None,
+        keys: list[Validator] | None = None,
+        values: list[Validator] | None = None,
     ) -> None:
+        super().__init__(required, default, validators, alias, each=each, keys=keys, values=values)
+        self._sync_validators = [validator for validator in validators if not validator.is_async]
+        self._async_validators = [validator for validator in validators if validator.is_async]
+        if self.validates_elements:
+            if any(validator.is_async for validator in self._each + self._keys + self._values):
+                raise TypeError("Async validators can't be used as each, keys or values validators")
+            # The TypeCaster applies the element validators while traversing the container
+            typecaster = typecaster.with_element_validators(self._each, self._keys, self._values)
         self._typecaster = typecaster
-        super().__init__(required, default, validators, alias)
 
     def execute(self, name: str, value: Any, lazy: bool, strict: bool) -> Any:
         value_or_default = self._default(value)
@@ -59,11 +131,17 @@ class TypedArgField(UnTypedArgField):
             raise ValidationError(f"Couldn't cast to the correct type. message: {e}", name)
         except MissingArgument as e:
             raise ValidationError(str(e), name)
+        except ElementValidationFailed as e:
+            raise element_validation_error(name, e, lazy)
 
+        self._apply_validators(name, typecasted_value, lazy)
+        return typecasted_value
+
+    def _apply_validators(self, name: str, value: Any, lazy: bool) -> None:
         errors: list[ValidationError] = []
-        for validator in self._validators:
+        for validator in self._sync_validators:
             try:
-                validator(name, typecasted_value)
+                validator(name, value)
             except ValidationError as e:
                 if lazy:
                     errors.append(e)
@@ -73,4 +151,80 @@ class TypedArgField(UnTypedArgField):
         if errors:
             raise ValidationErrorGroup(f"Errors during validation of '{name}'", errors)
 
-        return typecasted_value
+    def execute_column(
+        self, name: str, values: Iterable[Any], lazy: bool, strict: bool, typed: bool = False
+    ) -> tuple[list[Any], dict[int, ValidationError | MissingArgument]]:
+        """Execute the field for all values of a column.
+
+        Values that already have the correct type and have no validators to apply are taken as is,
+        all other values are processed by `execute`. For TypeCasters that validate and cast in a single pass
+        (see `TypeCaster.coerce`) and for custom defaults, which may replace any value, all values are processed by
+        `execute`. Errors don't stop the processing of the column.
+
+        Args:
+            name (str): Name of the parameter
+            values (Iterable[Any]): The values in the column
+            lazy (bool): Whether to collect the errors of the validators in a `ValidationErrorGroup`
+            strict (bool): Whether typecasting is disabled
+            typed (bool, optional): Whether all values are known to have the correct type (e.g. converted by the
+            caller), only the validators are applied then. Defaults to False.
+
+        Returns:
+            tuple[list[Any], dict[int, ValidationError | MissingArgument]]: The processed column, invalid values are
+            left as provided. And the error per invalid row.
+        """
+        # The built-in defaults only replace empty values, other defaults are always called (like `execute` does)
+        builtin_default = type(self._default) is DefaultValue or type(self._default) is DefaultFactory
+        if typed and builtin_default and has_default_coerce(self._typecaster):
+            return self._validate_typed_column(name, values, lazy)
+
+        execute = self.execute
+        is_valid_type = self._typecaster.validate
+        check_values = bool(self._sync_validators) or not builtin_default or not has_default_coerce(self._typecaster)
+
+        column: list[Any] = []
+        append = column.append
+        errors: dict[int, ValidationError | MissingArgument] = {}
+
+        for row, value in enumerate(values):
+            if not check_values and not isinstance(value, __EmptyArg__) and is_valid_type(value):
+                append(value)
+                continue
+            try:
+                append(execute(name, value, lazy, strict))
+            except (ValidationError, MissingArgument) as e:
+                errors[row] = e
+                append(value)
+
+        return column, errors
+
+    def _validate_typed_column(
+        self, name: str, values: Iterable[Any], lazy: bool
+    ) -> tuple[list[Any], dict[int, ValidationError | MissingArgument]]:
+        column = list(values)
+        errors: dict[int, ValidationError | MissingArgument] = {}
+        if self._sync_validators:
+            apply_validators = self._apply_validators
+            for row, value in enumerate(column):
+                try:
+                    apply_validators(name, value, lazy)
+                except ValidationError as e:
+                    errors[row] = e
+        return column, errors
+
+
+def element_validation_error(name: str, error: ElementValidationFailed, lazy: bool) -> ValidationError:
+    """Create the error for failed element validators of parameter `name`
+
+    Args:
+        name (str): Name of the parameter
+        error (ElementValidationFailed): The error raised by the TypeCaster
+        lazy (bool): Whether to return all errors in a `ValidationErrorGroup`, or only the first
+
+    Returns:
+        ValidationError: Error per element named after the parameter and element, e.g. `a[0]`
+    """
+    errors = [ValidationError(e.reason, f"{name}{e.param}") for e in error.errors]
+    if lazy:
+        return ValidationErrorGroup(f"Errors during validation of the elements of '{name}'", errors)
+    return errors[0]
@@ -1,5 +1,6 @@
 from typing import TypeVar, Any, Generic
 from abc import ABC, abstractmethod
+import inspect
 
 from ..exceptions import TypeValidationError, ValidationError, ValidatorFailed, TypeCastError
 
@@ -45,6 +46,30 @@ class Validator(Generic[T], ABC):
         except ValidatorFailed as e:
             raise ValidationError(str(e), name)
 
+    @property
+    def is_async(self) -> bool:
+        """Whether `validate` is a coroutine function. Async validators can only be used for coroutine functions."""
+        return inspect.iscoroutinefunction(self.validate)
+
+    async def call_async(self, name: str, obj: T) -> T:
+        """
+        Await the validate coroutine and raise `ValidationError` if it failed.
+
+        Args:
+            name (str): The name of the validated argument
+            obj (T): The input value
+
+        Raises:
+            ValidationError: if the validation fails
+
+        Returns:
+            T: The validated argument
+        """
+        try:
+            return await self.validate(obj)  # type: ignore[misc, no-any-return]
+        except ValidatorFailed as e:
+            raise ValidationError(str(e), name)
+
 
 class Default(Generic[T], ABC):
     """Construct a default value for a function or method argument
@@ -65,6 +90,23 @@ class Default(Generic[T], ABC):
         """
         ...
 
+    @property
+    def is_async(self) -> bool:
+        """Whether the default has to be constructed by awaiting `get_async`. Async defaults can only be used for
+        coroutine functions."""
+        return False
+
+    async def get_async(self, value: Any) -> T:
+        """Like `get`, but the default may be constructed by awaiting a coroutine
+
+        Args:
+            value (Any): The input value
+
+        Returns:
+            T: The default or the value provided
+        """
+        return self.get(value)
+
     def __call__(self, value: Any) -> T:
         return self.get(value)
 
@@ -100,7 +142,61 @@ class TypeCaster(Generic[T], ABC):
         """
         ...
 
-    def __call__(self, param_value: Any, strict: bool) -> T:
+    def with_metadata(self, metadata: tuple[Any, ...]) -> "TypeCaster[T]":
+        """Get a TypeCaster that also takes the metadata of an `Annotated` type hint into account.
+
+        E.g. for `Annotated[np.ndarray, DType(np.float64)]` the metadata is `(DType(np.float64),)`.
+        By default metadata is ignored and the TypeCaster itself is returned. Override this method
+        to support metadata, return a new object instead of modifying this one since TypeCasters are shared.
+
+        Args:
+            metadata (tuple[Any, ...]): The metadata of the `Annotated` type hint
+
+        Returns:
+            TypeCaster[T]: TypeCaster for the type hint including the metadata
+        """
+        return self
+
+    def with_element_validators(
+        self, each: list[Validator], keys: list[Validator], values: list[Validator]
+    ) -> "TypeCaster[T]":
+        """Get a TypeCaster that also applies validators to the elements of a container, while validating
+        or casting the container. Return a new object instead of modifying this one since TypeCasters are shared.
+
+        When validators fail, `fancy_signatures.exceptions.ElementValidationFailed` should be raised by `coerce`.
+        By default element validators aren't supported.
+
+        Args:
+            each (list[Validator]): Validators for each element of a list, tuple or set
+            keys (list[Validator]): Validators for the keys of a dict
+            values (list[Validator]): Validators for the values of a dict
+
+        Raises:
+            TypeError: If the element validators aren't supported for the type hint
+
+        Returns:
+            TypeCaster[T]: TypeCaster that applies the element validators
+        """
+        raise TypeError(f"Element validators aren't supported for type hint '{self._type_hint}'")
+
+    def coerce(self, param_value: Any, strict: bool) -> T:
+        """Validate the type of a value and cast it if it's invalid.
+
+        The default implementation calls `validate` and, if that fails, `cast`. Override this method to
+        do both in a single traversal of the value, e.g. for containers. A valid value should be returned
+        as is, not copied.
+
+        Args:
+            param_value (Any): The actual value
+            strict (bool): Whether to raise an error for an invalid value instead of casting it
+
+        Raises:
+            TypeValidationError: If the value is invalid and `strict` is True
+            TypeCastError: If casting the value failed
+
+        Returns:
+            T: The value, or the typecasted value
+        """
         if not self.validate(param_value):
             if strict:
                 raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
@@ -110,3 +206,13 @@ class TypeCaster(Generic[T], ABC):
                 except TypeCastError as e:
                     raise TypeCastError(self._type_hint, extra_info=str(e))
         return param_value
+
+    def __call__(self, param_value: Any, strict: bool) -> T:
+        return self.coerce(param_value, strict)
+
+
+def has_default_coerce(typecaster: TypeCaster) -> bool:
+    """Whether the TypeCaster uses the default `coerce`, which starts with `validate`.
+    For those callers can call `validate` first and skip the call to `coerce` for valid values.
+    """
+    return type(typecaster).coerce is TypeCaster.coerce
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Protocol, Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from .api import _unwrap, _FunctionWrapper
+from .columnar import ColumnarResult, _parameter_names, _validate_column_batch
+
+
+class Cursor(Protocol):
+    """The part of a DB-API 2.0 (PEP 249) cursor that is used by `validate_cursor`"""
+
+    @property
+    def description(self) -> Sequence[Sequence[Any]] | None:
+        ...
+
+    @property
+    def arraysize(self) -> int:
+        ...
+
+    def fetchmany(self, size: int = ...) -> Sequence[Sequence[Any]]:
+        ...
+
+
+def validate_cursor(
+    func: Callable[..., Any],
+    cursor: Cursor,
+    *,
+    batch_size: int | None = None,
+    lazy: bool = True,
+    prefetch: bool = False,
+) -> Iterator[ColumnarResult]:
+    """Validate the rows of a query result against the signature of a function decorated with `validate`.
+
+    The columns of the result (`cursor.description`) are mapped to parameters (or aliases) once. Rows are
+    fetched in batches using `fetchmany`, and every batch is validated column by column like
+    `validate_columns`, without creating keyword arguments per row.
+
+    Args:
+        func (Callable[..., Any]): Function or method decorated with `validate`
+        cursor (Cursor): A DB-API cursor on which a query was executed
+        batch_size (int | None, optional): Number of rows to fetch and validate at once. Defaults to None,
+        `cursor.arraysize`.
+        lazy (bool, optional): Whether to collect all errors of a row in a `ValidationErrorGroup`, or only
+        return the first error. Defaults to True.
+        prefetch (bool, optional): Whether to fetch the next batch in a background thread while a batch is
+        validated. The cursor should support being used from another thread (e.g. a `sqlite3` connection
+        created with `check_same_thread=False`). Defaults to False.
+
+    Raises:
+        TypeError: If `func` isn't decorated with `validate`, a column doesn't belong to any parameter or a
+        parameter has more than one column
+        ValueError: If no query was executed on the cursor, or `batch_size` isn't positive
+
+    Returns:
+        Iterator[ColumnarResult]: The result per batch, the rows in `mask` and `errors` are numbered per batch
+    """
+    wrapper, bound_args = _unwrap(func)
+    if cursor.description is None:
+        raise ValueError("The cursor has no result set, execute a query first")
+    size = batch_size if batch_size is not None else cursor.arraysize
+    if size < 1:
+        raise ValueError(f"batch_size should be positive, got {size}")
+    names = _parameter_names(wrapper, bound_args, [column[0] for column in cursor.description])
+
+    if prefetch:
+        return _iter_prefetched_batches(wrapper, bound_args, names, cursor, size, lazy)
+    return _iter_batches(wrapper, bound_args, names, cursor, size, lazy)
+
+
+def _iter_batches(
+    wrapper: _FunctionWrapper,
+    bound_args: tuple[Any, ...],
+    names: list[str],
+    cursor: Cursor,
+    size: int,
+    lazy: bool,
+) -> Iterator[ColumnarResult]:
+    while rows := cursor.fetchmany(size):
+        yield _validate_rows(wrapper, bound_args, names, rows, lazy)
+
+
+def _iter_prefetched_batches(
+    wrapper: _FunctionWrapper,
+    bound_args: tuple[Any, ...],
+    names: list[str],
+    cursor: Cursor,
+    size: int,
+    lazy: bool,
+) -> Iterator[ColumnarResult]:
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_rows = executor.submit(cursor.fetchmany, size)
+        while rows := next_rows.result():
+            next_rows = executor.submit(cursor.fetchmany, size)
+            yield _validate_rows(wrapper, bound_args, names, rows, lazy)
+
+
+def _validate_rows(
+    wrapper: _FunctionWrapper,
+    bound_args: tuple[Any, ...],
+    names: list[str],
+    rows: Sequence[Sequence[Any]],
+    lazy: bool,
+) -> ColumnarResult:
+    wrapper._check_registry()
+    return _validate_column_batch(wrapper, bound_args, dict(zip(names, zip(*rows))), len(rows), lazy)
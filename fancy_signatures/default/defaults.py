@@ -1,4 +1,4 @@
-from typing import Any, TypeVar, Callable
+from typing import Any, Awaitable, TypeVar, Callable
 
 from ..core.interface import Default
 from ..core.empty import is_empty, __EmptyArg__
@@ -6,12 +6,17 @@ from ..core.empty import is_empty, __EmptyArg__
 
 T = TypeVar("T")
 FactoryFunc = Callable[[], Any]
+AsyncFactoryFunc = Callable[[], Awaitable[Any]]
 
 
 class DefaultValue(Default[T]):
     def __init__(self, value: Any = __EmptyArg__()) -> None:
         self._value = value
 
+    @property
+    def value(self) -> Any:
+        return self._value
+
     def get(self, value: T) -> T:
         if is_empty(value):
             return self._value
@@ -22,12 +27,45 @@ class DefaultFactory(Default[T]):
     def __init__(self, factory_func: FactoryFunc = __EmptyArg__) -> None:
         self._factory = factory_func
 
+    @property
+    def factory(self) -> FactoryFunc:
+        return self._factory
+
     def get(self, value: T) -> T:
         if is_empty(value):
             return self._factory()
         return value
 
 
+class AsyncDefaultFactory(Default[T]):
+    """Construct the default by awaiting a coroutine function, e.g. to look it up in a store.
+
+    Can only be used for coroutine functions. When several arguments with an `AsyncDefaultFactory` are missing
+    in a call, their factories are awaited concurrently.
+    """
+
+    def __init__(self, factory_func: AsyncFactoryFunc) -> None:
+        self._factory = factory_func
+
+    @property
+    def factory(self) -> AsyncFactoryFunc:
+        return self._factory
+
+    @property
+    def is_async(self) -> bool:
+        return True
+
+    def get(self, value: T) -> T:
+        if is_empty(value):
+            raise TypeError("An `AsyncDefaultFactory` can only be used for coroutine functions, use `get_async`")
+        return value
+
+    async def get_async(self, value: T) -> T:
+        if is_empty(value):
+            return await self._factory()  # type: ignore[no-any-return]
+        return value
+
+
 Zero: DefaultValue[int] = DefaultValue(0)
 EmptyList: DefaultFactory[list] = DefaultFactory(list)
 EmptyDict: DefaultFactory[dict] = DefaultFactory(dict)
@@ -7,23 +7,53 @@ class ValidationError(Exception):
     """Main validation error class"""
 
     def __init__(self, message: str, param: str | list[str]) -> None:
+        self.reason = message
+        self.param = param
         if isinstance(param, list):
             msg = f"Parameters '{param}' are invalid. {message}."
         else:
             msg = f"Parameter '{param}' is invalid. {message}."
         super().__init__(msg)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The arguments of `__init__` differ from `args`, which is used by default
+        return type(self), (self.reason, self.param), self.__dict__
+
 
 class MissingArgument(Exception):
     pass
 
 
+class UnrecognizedArgument(TypeError):
+    """Error raised when a function is called with an argument it doesn't have"""
+
+    pass
+
+
+class ElementValidationFailed(Exception):
+    """Error raised by a TypeCaster when validators of the elements of a container fail.
+    The `param` of the errors is the position of the element, e.g. '[0]'.
+    """
+
+    def __init__(self, errors: list[ValidationError]) -> None:
+        super().__init__(f"Validation of {len(errors)} element(s) failed")
+        self.errors = errors
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.errors,), self.__dict__
+
+
 class TypeCastError(TypeError):
     """Error raised when typecasting failed"""
 
     def __init__(self, expected_type: type | tuple[Any, ...], extra_info: str | None = None) -> None:
+        self.expected_type = expected_type
+        self.extra_info = extra_info
         super().__init__(f"Couldn't cast to correct type: {expected_type}. {extra_info if extra_info else ''}")
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.expected_type, self.extra_info), self.__dict__
+
 
 class UnCastableType(TypeCastError):
     """Error raised when typecasting is not possible for a type"""
@@ -31,6 +61,9 @@ class UnCastableType(TypeCastError):
     def __init__(self, expected_type: type | tuple[Any, ...]) -> None:
         super().__init__(expected_type, extra_info="It's impossible to cast a type of: `{expected_type}`")
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.expected_type,), self.__dict__
+
 
 class ValidatorFailed(ValueError):
     """Error raised when a validator fails"""
@@ -50,6 +83,9 @@ class ValidationErrorGroup(ExceptionGroup, ValidationError):
     def to_dict(self) -> dict[str, Any]:
         return _exception_group_to_dict(self)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (self.message, list(self.exceptions)), self.__dict__
+
 
 def _exception_group_to_dict(exc_group: ValidationErrorGroup) -> dict[str, Any]:
     exc_list: list[str | dict[str, str]] = []
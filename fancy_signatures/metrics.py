@@ -0,0 +1,208 @@
+"""Opt-in metrics of decorated functions: call counts, validation time and the outcome per parameter.
+
+Collecting metrics is disabled by default, and then costs nothing: decorated functions only switch to a
+measuring call once metrics are enabled (on their next call).
+
+Usage:
+    from fancy_signatures import metrics
+
+    metrics.enable()
+    ...
+    print(metrics.snapshot())
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, NamedTuple
+from array import array
+import weakref
+
+from .core.empty import is_empty
+
+
+__all__ = ["enable", "disable", "is_enabled", "reset", "snapshot", "FunctionStats", "ParameterStats"]
+
+# Number of validation times per function kept to compute percentiles, the oldest are overwritten
+SAMPLE_SIZE = 1024
+
+# Positions of the counters per parameter
+VALIDATED = 0
+CAST = 1
+DEFAULT = 2
+FAILED = 3
+
+# The counters per parameter of a function, indexed by the positions above
+Counters = dict[str, list[int]]
+
+_enabled = False
+# Incremented when metrics are enabled or disabled, decorated functions compare against it
+_generation = 0
+# The metrics of the decorated functions that were called while metrics were enabled, by decorated function.
+# Each function owns its metrics, they are dropped with the function.
+_functions: weakref.WeakKeyDictionary[Any, FunctionMetrics] = weakref.WeakKeyDictionary()
+
+
+class ParameterStats(NamedTuple):
+    """The outcomes of processing a parameter
+
+    Attributes:
+        validated (int): Number of arguments that had the correct type and were passed as is
+        cast (int): Number of arguments that were cast to the correct type
+        default (int): Number of calls in which the argument was missing, so the default was used
+        failed (int): Number of arguments that were invalid (or missing while required)
+    """
+
+    validated: int
+    cast: int
+    default: int
+    failed: int
+
+
+class FunctionStats(NamedTuple):
+    """The metrics of a decorated function, times are in nanoseconds and only include processing the arguments.
+    Percentiles are computed over the last `SAMPLE_SIZE` calls.
+    """
+
+    calls: int
+    failures: int
+    total_ns: int
+    mean_ns: float
+    p50_ns: int
+    p90_ns: int
+    p99_ns: int
+    parameters: dict[str, ParameterStats]
+
+
+class FunctionMetrics:
+    """Preallocated counters of a decorated function, updated by its wrapper"""
+
+    __slots__ = ("name", "calls", "failures", "total_ns", "samples", "parameters")
+
+    def __init__(self, name: str, parameter_names: Iterable[str]) -> None:
+        self.name = name
+        self.calls = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.samples = array("q", bytes(8 * SAMPLE_SIZE))
+        self.parameters: Counters = {name: [0, 0, 0, 0] for name in parameter_names}
+
+    def record(self, elapsed_ns: int, failed: bool) -> None:
+        self.samples[self.calls % SAMPLE_SIZE] = elapsed_ns
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if failed:
+            self.failures += 1
+
+    def clear(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_ns = 0
+        for counters in self.parameters.values():
+            counters[:] = [0, 0, 0, 0]
+
+    def stats(self) -> FunctionStats:
+        count = min(self.calls, SAMPLE_SIZE)
+        samples = sorted(self.samples[:count])
+        return FunctionStats(
+            calls=self.calls,
+            failures=self.failures,
+            total_ns=self.total_ns,
+            mean_ns=self.total_ns / self.calls if self.calls else 0.0,
+            p50_ns=_percentile(samples, 50),
+            p90_ns=_percentile(samples, 90),
+            p99_ns=_percentile(samples, 99),
+            parameters={name: ParameterStats(*counters) for name, counters in self.parameters.items()},
+        )
+
+
+def enable() -> None:
+    """Start collecting metrics of all decorated functions"""
+    global _enabled, _generation
+    _enabled = True
+    # Decorated functions select how they are called on their next call
+    _generation += 1
+
+
+def disable() -> None:
+    """Stop collecting metrics, the metrics collected so far remain available"""
+    global _enabled, _generation
+    _enabled = False
+    _generation += 1
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def generation() -> int:
+    """Get the number of times metrics were enabled or disabled"""
+    return _generation
+
+
+def reset() -> None:
+    """Set all collected metrics to zero"""
+    for function_metrics in _functions.values():
+        function_metrics.clear()
+
+
+def snapshot() -> dict[str, FunctionStats]:
+    """Get the metrics of all decorated functions that were called while metrics were enabled
+
+    Returns:
+        dict[str, FunctionStats]: The metrics per function, by module and qualified name (e.g. 'app.api.create_user').
+        Distinct functions with the same name (e.g. defined by a factory function) are numbered in the order they were
+        first measured: 'app.api.create_user', 'app.api.create_user #2', etc.
+    """
+    result: dict[str, FunctionStats] = {}
+    for function_metrics in list(_functions.values()):
+        name = function_metrics.name
+        number = 1
+        while name in result:
+            number += 1
+            name = f"{function_metrics.name} #{number}"
+        result[name] = function_metrics.stats()
+    return result
+
+
+def register(function: Any, name: str, parameter_names: Iterable[str]) -> FunctionMetrics:
+    """Create the metrics of a decorated function, which should keep them for as long as it exists
+
+    Args:
+        function (Any): The decorated function, the metrics are included in `snapshot` while it exists
+        name (str): Name of the function in `snapshot`
+        parameter_names (Iterable[str]): The parameters to count the outcomes of
+
+    Returns:
+        FunctionMetrics: The metrics to update when the function is called
+    """
+    function_metrics = FunctionMetrics(name, parameter_names)
+    _functions[function] = function_metrics
+    return function_metrics
+
+
+def count(counters: Counters, name: str, value: Any, result: Any) -> None:
+    """Count the outcome of processing the argument `value` of a parameter into `result`"""
+    counter = counters.get(name)
+    if counter is None:
+        # A parameter that isn't counted, e.g. `self`
+        return
+    if is_empty(value):
+        counter[DEFAULT] += 1
+    elif result is value:
+        counter[VALIDATED] += 1
+    else:
+        counter[CAST] += 1
+
+
+def count_failure(counters: Counters, name: str) -> None:
+    """Count an invalid (or missing) argument of a parameter"""
+    counter = counters.get(name)
+    if counter is not None:
+        counter[FAILED] += 1
+
+
+def _percentile(samples: list[int], percentile: int) -> int:
+    """Nearest-rank percentile of sorted samples"""
+    if not samples:
+        return 0
+    rank = -(-len(samples) * percentile // 100)
+    return samples[max(rank, 1) - 1]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Mapping
+from json import JSONDecodeError, loads
+import mmap
+import os
+
+from .api import _unwrap
+from .batch import RecordResult, _record_validator
+from .exceptions import ValidationError, MissingArgument, UnrecognizedArgument
+
+
+def validate_ndjson(
+    func: Callable[..., Any],
+    path: str | os.PathLike[str],
+    *,
+    lazy: bool = True,
+    call: bool = False,
+) -> Iterator[RecordResult]:
+    """Validate the records of a JSON Lines (NDJSON) file against the signature of a function decorated with `validate`.
+
+    The file is memory-mapped and read line by line, so only the current line is decoded at any time and
+    memory usage doesn't grow with the size of the file. Every line holds a JSON object of argument names
+    (or aliases) to values, blank lines are skipped. Like `validate_many`, errors (including lines that
+    aren't valid JSON) don't stop the iteration but are returned per record. Use `split_results` to get
+    the valid records and the errors as separate iterators.
+
+    Args:
+        func (Callable[..., Any]): Function or method decorated with `validate`
+        path (str | os.PathLike[str]): Path of the file
+        lazy (bool, optional): Whether to collect all errors of a record in a `ValidationErrorGroup`, or only
+        return the first error. Defaults to True.
+        call (bool, optional): Whether to call the function with the validated arguments. Defaults to False.
+
+    Raises:
+        TypeError: If `func` isn't decorated with `validate`
+        OSError: If the file can't be opened
+
+    Returns:
+        Iterator[RecordResult]: The result per line, the position is the (zero based) line number
+    """
+    wrapper, bound_args = _unwrap(func)
+    record_validator = _record_validator(wrapper, bound_args, lazy)
+    # Fail before iterating if the file doesn't exist, it's opened when the iteration starts
+    os.stat(path)
+    return _iter_lines(path, record_validator, wrapper._wrapped_func if call else None)
+
+
+def _iter_lines(
+    path: str | os.PathLike[str],
+    record_validator: Callable[[Mapping[str, Any]], dict[str, Any]],
+    wrapped_func: Callable[..., Any] | None,
+) -> Iterator[RecordResult]:
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # An empty file can't be mapped
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for position, line in enumerate(_split_lines(mapped)):
+                if not line.strip():
+                    continue
+                try:
+                    record = loads(line)
+                except (JSONDecodeError, UnicodeDecodeError) as e:
+                    yield RecordResult(position, None, e)
+                    continue
+                if not isinstance(record, dict):
+                    yield RecordResult(position, None, TypeError(f"Line {position + 1} doesn't contain a JSON object"))
+                    continue
+                try:
+                    kwargs = record_validator(record)
+                except (ValidationError, MissingArgument, UnrecognizedArgument) as e:
+                    yield RecordResult(position, None, e)
+                    continue
+
+                yield RecordResult(position, kwargs if wrapped_func is None else wrapped_func(**kwargs))
+
+
+def _split_lines(mapped: mmap.mmap) -> Iterator[bytes]:
+    start = 0
+    size = len(mapped)
+    while start < size:
+        end = mapped.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield mapped[start:end]
+        start = end + 1
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+from json import JSONDecoder, JSONDecodeError, detect_encoding
+from json.decoder import scanstring  # type: ignore[attr-defined]
+import re
+
+from .api import _unwrap
+from .exceptions import UnrecognizedArgument
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Decodes a single JSON value starting at an index, returns the value and the index after it
+_scan_once: Callable[[str, int], tuple[Any, int]] = JSONDecoder().scan_once  # type: ignore[attr-defined]
+
+
+def call_from_json(
+    func: Callable[..., Any],
+    data: bytes | bytearray | str,
+    *,
+    max_size: int | None = None,
+    ignore_unknown: bool = False,
+) -> Any:
+    """Call a function decorated with `validate` with the members of a JSON object as keyword arguments.
+
+    The object is decoded member by member. The name of each member is checked against the parameters
+    (and aliases) of the function before its value is decoded, so an unknown member is rejected without
+    decoding its value. The bound parameter of a method (e.g. `self`) is an unknown member. The decoded
+    values are passed to the function directly, without an intermediate dict of the whole object.
+
+    Args:
+        func (Callable[..., Any]): Function or method decorated with `validate`
+        data (bytes | bytearray | str): The JSON document, an object at the top level
+        max_size (int | None, optional): Maximum size of `data`, in bytes (or characters for a `str`). Larger
+        input is rejected before it's decoded. Defaults to None, no maximum.
+        ignore_unknown (bool, optional): Whether to skip members that don't belong to any parameter, instead of
+        raising a TypeError. Defaults to False.
+
+    Raises:
+        TypeError: If `func` isn't decorated with `validate`, or the object has an unknown member
+        ValueError: If `data` is larger than `max_size`
+        json.JSONDecodeError: If `data` isn't a valid JSON object
+        ValidationError: error that occurred during validation of parameters
+        ValidationErrorGroup: group of validation errors
+
+    Returns:
+        Any: The return value of the function, a coroutine for a coroutine function
+    """
+    wrapper, bound_args = _unwrap(func, allow_async_validators=True)
+    if max_size is not None and len(data) > max_size:
+        raise ValueError(f"Input of size {len(data)} is larger than the maximum of {max_size}")
+
+    if isinstance(data, (bytes, bytearray)):
+        text = data.decode(detect_encoding(data), "surrogatepass")
+    else:
+        text = data
+
+    # The bound parameters of a method (e.g. `self`) can't be passed by the JSON object
+    num_bound = len(bound_args)
+    names = list(wrapper._fields)[num_bound:]
+    known = set(names) | {alias for name in names if (alias := wrapper._aliases.get(name)) is not None}
+    func_name: str = getattr(wrapper._wrapped_func, "__fancy_signature_name__")
+    kwargs = _decode_arguments(text, known, ignore_unknown, func_name)
+    return wrapper(*bound_args, **kwargs)
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    return _WHITESPACE.match(text, index).end()  # type: ignore[union-attr]
+
+
+def _decode_arguments(text: str, known: set[str], ignore_unknown: bool, func_name: str) -> dict[str, Any]:
+    # Decodes the top level object like `json.JSONDecoder` does, values are decoded by its (C) scanner
+    scan_once = _scan_once
+    end = _skip_whitespace(text, 0)
+    if not text.startswith("{", end):
+        raise JSONDecodeError("Expecting a JSON object", text, end)
+    end = _skip_whitespace(text, end + 1)
+
+    kwargs: dict[str, Any] = {}
+    if text.startswith("}", end):
+        end += 1
+    else:
+        while True:
+            if not text.startswith('"', end):
+                raise JSONDecodeError("Expecting property name enclosed in double quotes", text, end)
+            key, end = scanstring(text, end + 1)
+            end = _skip_whitespace(text, end)
+            if not text.startswith(":", end):
+                raise JSONDecodeError("Expecting ':' delimiter", text, end)
+            end = _skip_whitespace(text, end + 1)
+
+            is_known = key in known
+            if not is_known and not ignore_unknown:
+                raise UnrecognizedArgument(f"Unrecognized argument '{key}' for '{func_name}'")
+            try:
+                value, end = scan_once(text, end)
+            except StopIteration as e:
+                raise JSONDecodeError("Expecting value", text, e.value) from None
+            if is_known:
+                kwargs[key] = value
+
+            end = _skip_whitespace(text, end)
+            if text.startswith("}", end):
+                end += 1
+                break
+            if not text.startswith(",", end):
+                raise JSONDecodeError("Expecting ',' delimiter", text, end)
+            end = _skip_whitespace(text, end + 1)
+
+    end = _skip_whitespace(text, end)
+    if end != len(text):
+        raise JSONDecodeError("Extra data", text, end)
+    return kwargs
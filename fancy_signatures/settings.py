@@ -1,4 +1,4 @@
-from typing import TypeAlias, Any
+from typing import TypeAlias, Any, Mapping
 from enum import Enum
 from .core.interface import TypeCaster
 
@@ -15,17 +15,30 @@ class ProtocolHandlingLevel(Enum):
 class Settings:
     WARN_ON_HANDLER_OVERRIDE: bool = True
     PROTOCOL_HANDLING: ProtocolHandlingLevel = ProtocolHandlingLevel.ALLOW
+    TYPECASTER_CACHE_SIZE: int = 1024
+    CAST_IN_PLACE: bool = False
+    MAX_LITERAL_LENGTH: int = 1_000_000
+    PARALLEL_THRESHOLD: int = 0
 
 
 class _SettingsTypes:
     WARN_ON_HANDLER_OVERRIDE = bool
     PROTOCOL_HANDLING = ProtocolHandlingLevel
+    TYPECASTER_CACHE_SIZE = int
+    CAST_IN_PLACE = bool
+    MAX_LITERAL_LENGTH = int
+    PARALLEL_THRESHOLD = int
 
 
 def reset() -> None:
     """Reset all settings to their default values"""
     Settings.WARN_ON_HANDLER_OVERRIDE = True
     Settings.PROTOCOL_HANDLING = ProtocolHandlingLevel.ALLOW
+    Settings.TYPECASTER_CACHE_SIZE = 1024
+    Settings.CAST_IN_PLACE = False
+    Settings.MAX_LITERAL_LENGTH = 1_000_000
+    Settings.PARALLEL_THRESHOLD = 0
+    _invalidate_typecasters()
 
 
 def set(setting: str, value: Any) -> None:
@@ -49,17 +62,39 @@ def set(setting: str, value: Any) -> None:
         raise TypeError(f"Setting '{setting}' should be of type '{should_be_type}'")
 
     setattr(Settings, _internal_name, value)
+    _invalidate_typecasters()
 
 
-def get_typecast_handlers() -> dict[str, dict[TypeAlias, type[TypeCaster]]]:
+def _snapshot() -> dict[str, Any]:
+    """Get the values of all settings, e.g. to send them to another process"""
+    return {name: getattr(Settings, name) for name in vars(_SettingsTypes) if not name.startswith("_")}
+
+
+def _restore(values: Mapping[str, Any]) -> None:
+    """Apply the values of `_snapshot`"""
+    for name, value in values.items():
+        setattr(Settings, name, value)
+    _invalidate_typecasters()
+
+
+def _invalidate_typecasters() -> None:
+    # Settings influence how TypeCasters are created, so cached instances can't be reused
+    from .typecasting.handlers import bump_registry_version
+
+    bump_registry_version()
+
+
+def get_typecast_handlers() -> dict[str, Mapping[TypeAlias, type[TypeCaster]]]:
     """Get all the current registered typecasters a a dictionairy
 
     Returns:
-        dict[str, dict[TypeAlias, type[TypeCaster]]]: Dict containing the stict and non strict handlers
+        dict[str, Mapping[TypeAlias, type[TypeCaster]]]: Dict containing the stict and non strict handlers, as
+        read-only snapshots
     """
-    from .typecasting.__handler_lib import CUSTOM_HANDLERS, STRICT_CUSTOM_HANDLERS
+    from .typecasting.handlers import handler_registry
 
+    registry = handler_registry()
     return {
-        "strict_handlers": STRICT_CUSTOM_HANDLERS,
-        "handlers": CUSTOM_HANDLERS,
+        "strict_handlers": registry.strict_handlers,
+        "handlers": registry.handlers,
     }
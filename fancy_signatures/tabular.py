@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator
+import csv
+import itertools
+
+from .api import _unwrap, _FunctionWrapper
+from .batch import RecordResult
+from .columnar import _parameter_names, _validate_column_batch
+from .core.field import TypedArgField
+from .typecasting.default import IntOrFloatTypeCaster
+from .typecasting.special_origins import BooleanTypeCaster
+
+
+_BOOLEANS = {"1": True, "1.0": True, "true": True, "0": False, "0.0": False, "false": False}
+
+
+def validate_csv(
+    func: Callable[..., Any],
+    file: Iterable[str],
+    *,
+    lazy: bool = True,
+    call: bool = False,
+    batch_size: int = 1024,
+    **fmtparams: Any,
+) -> Iterator[RecordResult]:
+    """Validate the rows of a CSV file against the signature of a function decorated with `validate`.
+
+    The first row holds the argument names (or aliases) of the columns. The rows are read in batches of
+    `batch_size` rows, which are validated column by column (see `validate_columns`). Cells are strings,
+    so for `int`, `float`, `bool` and `str` parameters a converter from string is selected once per column
+    and applied to the whole column, instead of typecasting every cell separately. Cells that can't be
+    converted are typecasted as usual, which reports the error.
+
+    Args:
+        func (Callable[..., Any]): Function or method decorated with `validate`
+        file (Iterable[str]): The CSV file, or any other iterable of lines accepted by `csv.reader`
+        lazy (bool, optional): Whether to collect all errors of a row in a `ValidationErrorGroup`, or only
+        return the first error. Defaults to True.
+        call (bool, optional): Whether to call the function with the validated arguments. Defaults to False.
+        batch_size (int, optional): The number of rows validated at once. Defaults to 1024.
+        **fmtparams (Any): Formatting parameters for `csv.reader`, e.g. `delimiter`
+
+    Raises:
+        TypeError: If `func` isn't decorated with `validate`, a column doesn't belong to any parameter or a
+        parameter has more than one column (when the header is read)
+        ValueError: If `batch_size` isn't positive
+
+    Returns:
+        Iterator[RecordResult]: The result per row, the position is the (zero based) index of the row after the
+        header. Rows with a different number of cells than the header have a ValueError.
+    """
+    wrapper, bound_args = _unwrap(func)
+    if batch_size < 1:
+        raise ValueError(f"batch_size should be positive, got {batch_size}")
+    return _iter_rows(wrapper, bound_args, csv.reader(file, **fmtparams), lazy, call, batch_size)
+
+
+def _iter_rows(
+    wrapper: _FunctionWrapper,
+    bound_args: tuple[Any, ...],
+    reader: Iterator[list[str]],
+    lazy: bool,
+    call: bool,
+    batch_size: int,
+) -> Iterator[RecordResult]:
+    wrapper._check_registry()
+    header = next(reader, None)
+    if header is None:
+        return
+    names = _parameter_names(wrapper, bound_args, header)
+    converters = [None if wrapper._strict else _string_converter(wrapper._fields[name]) for name in names]
+    wrapped_func = wrapper._wrapped_func if call else None
+
+    num_columns = len(names)
+    position = 0
+    while batch := list(itertools.islice(reader, batch_size)):
+        if len(set(map(len, batch))) == 1 and len(batch[0]) == num_columns:
+            yield from _validate_rows(wrapper, bound_args, names, converters, batch, position, lazy, wrapped_func)
+        else:
+            # Validate the rows between rows with the wrong number of values
+            start = 0
+            for i, row in enumerate(batch):
+                if len(row) != num_columns:
+                    rows = batch[start:i]
+                    yield from _validate_rows(
+                        wrapper, bound_args, names, converters, rows, position + start, lazy, wrapped_func
+                    )
+                    error = ValueError(f"Row {position + i} has {len(row)} values, expected {num_columns}")
+                    yield RecordResult(position + i, None, error)
+                    start = i + 1
+            rows = batch[start:]
+            yield from _validate_rows(
+                wrapper, bound_args, names, converters, rows, position + start, lazy, wrapped_func
+            )
+        position += len(batch)
+
+
+def _validate_rows(
+    wrapper: _FunctionWrapper,
+    bound_args: tuple[Any, ...],
+    names: list[str],
+    converters: list[Callable[[str], Any] | None],
+    rows: list[list[str]],
+    position: int,
+    lazy: bool,
+    wrapped_func: Callable[..., Any] | None,
+) -> list[RecordResult]:
+    if not rows:
+        return []
+    columns: dict[str, Iterable[Any]] = {}
+    typed: list[str] = []
+    for name, converter, column in zip(names, converters, zip(*rows)):
+        columns[name], is_typed = _convert(converter, column)
+        if is_typed:
+            typed.append(name)
+    result = _validate_column_batch(wrapper, bound_args, columns, len(rows), lazy, typed)
+
+    validated_names = list(result.columns)
+    validated_rows = zip(*result.columns.values()) if result.columns else itertools.repeat((), len(rows))
+    errors = result.errors
+    if not errors and wrapped_func is None:
+        return [
+            RecordResult(row, dict(zip(validated_names, values))) for row, values in enumerate(validated_rows, position)
+        ]
+
+    results: list[RecordResult] = []
+    for row, values in enumerate(validated_rows, position):
+        if row - position in errors:
+            results.append(RecordResult(row, None, errors[row - position]))
+            continue
+        kwargs = dict(zip(validated_names, values))
+        results.append(RecordResult(row, kwargs if wrapped_func is None else wrapped_func(**kwargs)))
+    return results
+
+
+def _string_converter(field: TypedArgField) -> Callable[[str], Any] | None:
+    """Select a function to convert a string to the type of the field, if the field uses a built-in TypeCaster"""
+    caster = field.typecaster
+    if type(caster) is IntOrFloatTypeCaster:
+        # `int` or `float`, which is what the TypeCaster calls to cast a string
+        return caster._type_hint  # type: ignore[no-any-return]
+    if type(caster) is BooleanTypeCaster:
+        return _to_bool
+    # Other types (and `str`, which needs no conversion) are left to the TypeCaster
+    return None
+
+
+def _to_bool(value: str) -> bool:
+    # Like `BooleanTypeCaster.cast` for strings
+    return _BOOLEANS[value.lower()]
+
+
+def _convert(converter: Callable[[str], Any] | None, column: tuple[str, ...]) -> tuple[Iterable[Any], bool]:
+    """Convert the cells of a column, returns the column and whether all cells were converted"""
+    if converter is None:
+        return column, False
+    try:
+        return list(map(converter, column)), True
+    except (ValueError, KeyError):
+        # Leave the cells that can't be converted to the TypeCaster, which raises the error
+        converted: list[Any] = []
+        for value in column:
+            try:
+                converted.append(converter(value))
+            except (ValueError, KeyError):
+                converted.append(value)
+        return converted, False
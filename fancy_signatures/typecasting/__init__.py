@@ -1,5 +1,11 @@
-from .factory import typecaster_factory  # noqa
-from .handlers import register_typecaster, unregister_typecaster, unregister_strict_typecaster  # noqa
+from .factory import typecaster_factory, typecaster_cache_info, clear_typecaster_cache  # noqa
+from .handlers import (  # noqa
+    register_typecaster,
+    unregister_typecaster,
+    unregister_strict_typecaster,
+    registry_version,
+)
 from .union import *  # noqa
 from .special_origins import *  # noqa
 from .generic_alias import *  # noqa
+from .parallel import Parallel  # noqa
@@ -1,7 +1,77 @@
-from typing import get_origin, TypeAlias, ParamSpec
+from typing import get_origin, TypeAlias, ParamSpec, NamedTuple, Any, Hashable
+import threading
 
 from ..core.interface import TypeCaster
+from ..settings import Settings
 from .default import DefaultTypeCaster
+from .handlers import HandlerRegistry, handler_registry, registry_version
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    version: int
+
+
+class _TypeCasterCache:
+    """Bounded mapping of type hints to `TypeCaster` instances, tied to a version of the handler registry.
+
+    The entries and their version are replaced together, so a thread that created a caster for an outdated
+    registry stores it in the outdated entries, which are no longer used. The entries are only replaced by
+    those of a newer version.
+    """
+
+    __slots__ = ("state", "hits", "misses")
+
+    def __init__(self) -> None:
+        self.state: tuple[int, dict[Hashable, TypeCaster]] = (registry_version(), {})
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self.state[0]
+
+    @property
+    def entries(self) -> dict[Hashable, TypeCaster]:
+        return self.state[1]
+
+    def entries_for(self, version: int) -> dict[Hashable, TypeCaster]:
+        """Get the entries for a registry version, replacing the entries of an older version. For an outdated
+        version a new dict is returned that isn't cached, so threads using an older snapshot can't evict the
+        entries of the current version."""
+        state = self.state
+        if state[0] == version:
+            return state[1]
+        if state[0] > version:
+            return {}
+        state = (version, {})
+        self.state = state
+        return state[1]
+
+    def reset(self, version: int) -> None:
+        self.state = (version, {})
+
+    @staticmethod
+    def store(entries: dict[Hashable, TypeCaster], key: Hashable, caster: TypeCaster) -> None:
+        maxsize = Settings.TYPECASTER_CACHE_SIZE
+        if maxsize <= 0:
+            return
+        while len(entries) >= maxsize:
+            # Evict the oldest entry, dicts preserve insertion order
+            try:
+                entries.pop(next(iter(entries)), None)
+            except (RuntimeError, StopIteration):
+                # Another thread changed the entries meanwhile
+                continue
+        entries[key] = caster
+
+
+_CACHE = _TypeCasterCache()
+# The registry snapshot used while creating a TypeCaster, by the nested `typecaster_factory` calls of its children
+_creating = threading.local()
 
 
 def typecaster_factory(type_hint: TypeAlias) -> TypeCaster:
@@ -11,6 +81,10 @@ def typecaster_factory(type_hint: TypeAlias) -> TypeCaster:
     Secondly; handlers are considered (the type hint is a subclass of the handler type)
     Lastly; a default TypeCaster is used.
 
+    Created TypeCasters are cached per type hint, so repeatedly requesting a caster for the same
+    type hint returns the same instance. The cache is invalidated when the handler registry changes
+    (see `register_typecaster`) or when a setting is changed.
+
     Args:
         type_hint (TypeAlias): the type hint
 
@@ -18,14 +92,74 @@ def typecaster_factory(type_hint: TypeAlias) -> TypeCaster:
         TypeCaster: TypeCaster instance that can be used to validate a given parameter and
         attempt to cast it to the correct type.
     """
-    from .__handler_lib import CUSTOM_HANDLERS, STRICT_CUSTOM_HANDLERS
+    # A snapshot of the handlers, so all handlers used to create the caster, and the TypeCasters of its
+    # children created from its `__init__`, belong to the same version
+    registry = getattr(_creating, "registry", None) or handler_registry()
+    entries = _CACHE.entries_for(registry.version)
+
+    key = _cache_key(type_hint)
+    try:
+        caster = entries.get(key)
+    except TypeError:
+        # Unhashable type hint, e.g. `Annotated` with unhashable metadata
+        _CACHE.misses += 1
+        return _create_typecaster(type_hint, registry)
+
+    if caster is not None:
+        _CACHE.hits += 1
+        return caster
+
+    _CACHE.misses += 1
+    caster = _create_typecaster(type_hint, registry)
+    _CACHE.store(entries, key, caster)
+    return caster
+
+
+def typecaster_cache_info() -> CacheInfo:
+    """Get statistics of the `typecaster_factory` cache
+
+    Returns:
+        CacheInfo: hits, misses, maximum size, current size and the registry version the cache belongs to
+    """
+    return CacheInfo(_CACHE.hits, _CACHE.misses, Settings.TYPECASTER_CACHE_SIZE, len(_CACHE.entries), _CACHE.version)
+
+
+def clear_typecaster_cache() -> None:
+    """Remove all cached TypeCasters and reset the cache statistics"""
+    _CACHE.reset(registry_version())
+    _CACHE.hits = 0
+    _CACHE.misses = 0
+
+
+def _cache_key(type_hint: Any) -> Hashable:
+    # Type hints compare equal regardless of the order of union members (`int | str == str | int`),
+    # but the order determines which cast is attempted first. So the arguments are part of the key.
+    args = getattr(type_hint, "__args__", None)
+    if not args or not isinstance(args, tuple):
+        return type_hint
+    metadata = getattr(type_hint, "__metadata__", None)
+    return (type_hint, tuple([_cache_key(arg) for arg in args]), metadata)
+
+
+def _create_typecaster(type_hint: TypeAlias, registry: HandlerRegistry) -> TypeCaster:
+    outer_registry = getattr(_creating, "registry", None)
+    _creating.registry = registry
+    try:
+        return _create_typecaster_with(type_hint, registry)
+    finally:
+        _creating.registry = outer_registry
+
+
+def _create_typecaster_with(type_hint: TypeAlias, registry: HandlerRegistry) -> TypeCaster:
+    strict_handlers = registry.strict_handlers
+    handlers = registry.handlers
 
     raw_origin = get_origin(type_hint)
 
     origin = raw_origin if raw_origin is not None else type_hint
 
-    if origin in STRICT_CUSTOM_HANDLERS:
-        return STRICT_CUSTOM_HANDLERS[origin](type_hint)
+    if origin in strict_handlers:
+        return strict_handlers[origin](type_hint)
 
     # Paramspec fails subbclass check and is not implemented by default (as of now)
     # so if we get here and it's ParamSpec, we can't continue. Hint to user that they can
@@ -36,9 +170,9 @@ def typecaster_factory(type_hint: TypeAlias) -> TypeCaster:
             "see `fancy_signatures.typecasting.register_handler`."
         )
 
-    for type_for_handler in CUSTOM_HANDLERS:
+    for type_for_handler, handler in handlers.items():
         # isinstance to support metaclasses as handler types
         if issubclass(origin, type_for_handler) or isinstance(origin, type_for_handler):
-            return CUSTOM_HANDLERS[type_for_handler](type_hint)
+            return handler(type_hint)
 
     return DefaultTypeCaster(type_hint)
@@ -1,8 +1,14 @@
-from typing import Any, get_origin, get_args, TypeVar
+from typing import Any, Callable, Iterable, Sequence, get_origin, get_args, TypeVar
+import copy
+import itertools
+import operator
 
-from ..exceptions import TypeCastError
-from ..core.interface import TypeCaster
+from ..exceptions import TypeCastError, TypeValidationError, ValidationError, ElementValidationFailed
+from ..core.interface import TypeCaster, Validator, has_default_coerce
+from ..settings import Settings
 from .factory import typecaster_factory
+from .parsing import parse_literal
+from .parallel import map_chunks, parallel_threshold, should_run_parallel
 
 
 T = TypeVar("T", set, dict, tuple, list)
@@ -14,16 +20,142 @@ class ListTupleSetTypeCaster(TypeCaster[list | tuple | set]):
         self._origin: type[set | list | tuple] = get_origin(type_hint) or type_hint  # type: ignore
         _args = get_args(type_hint)
         self._arg = get_args(type_hint)[0] if len(_args) > 0 else Any
+        self._arg_caster = typecaster_factory(self._arg)
+        self._is_set = issubclass(self._origin, set)
+        self._each: list[Validator] = []
+        self._parallel_threshold: int | None = Settings.PARALLEL_THRESHOLD or None
 
     def validate(self, param_value: Any) -> bool:
         if issubclass(type(param_value), self._origin):
-            if all([typecaster_factory(self._arg).validate(val) for val in param_value]):
-                return True
+            validate_arg = self._arg_caster.validate
+            return all(validate_arg(val) for val in param_value)
         return False
 
     def cast(self, param_value: Any) -> list | tuple | set:
-        casted_value = _attempt_typecast(param_value, self._origin)  # type: ignore
-        return self._origin([typecaster_factory(self._arg).cast(x) for x in casted_value])
+        return self.coerce(param_value, False)
+
+    def with_metadata(self, metadata: tuple[Any, ...]) -> "ListTupleSetTypeCaster":
+        caster = copy.copy(self)
+        caster._parallel_threshold = parallel_threshold(metadata, self._parallel_threshold)
+        return caster
+
+    def with_element_validators(
+        self, each: list[Validator], keys: list[Validator], values: list[Validator]
+    ) -> "ListTupleSetTypeCaster":
+        if keys or values:
+            raise TypeError(f"`keys` and `values` validators are only supported for dicts, not '{self._type_hint}'")
+        caster = copy.copy(self)
+        caster._each = list(each)
+        return caster
+
+    def coerce(self, param_value: Any, strict: bool) -> list | tuple | set:
+        # Validate, cast and apply the element validators in a single pass over the elements.
+        # A new container is only built once an element is changed by casting, unless the list can be patched.
+        owned = False
+        if not issubclass(type(param_value), self._origin):
+            if strict:
+                raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+            try:
+                param_value = _attempt_typecast(param_value, self._origin)  # type: ignore
+            except TypeCastError as e:
+                raise TypeCastError(self._type_hint, extra_info=str(e))
+            owned = True
+
+        if should_run_parallel(self._parallel_threshold, len(param_value)):
+            return self._coerce_parallel(param_value, owned, strict)
+
+        each = self._each
+        start = 0
+        if not each and has_default_coerce(self._arg_caster):
+            # Find the first invalid element, the elements before it are kept as they are
+            start = _first_invalid(self._arg_caster.validate, param_value, len(param_value))
+            if start == -1:
+                return param_value
+
+        coerce_arg = _element_coercer(self._arg_caster)
+        elements: list[Any] | None = None
+        # The elements to replace when patching the list, only once all elements are valid
+        patches: list[tuple[int, Any]] | None = None
+        errors: list[ValidationError] = []
+
+        for i, value in enumerate(itertools.islice(param_value, start, None), start):
+            try:
+                coerced = coerce_arg(value, strict)
+            except TypeValidationError:
+                raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+            except TypeCastError as e:
+                raise TypeCastError(self._type_hint, extra_info=str(e))
+            if coerced is not value and elements is None and patches is None:
+                if type(param_value) is list and (owned or Settings.CAST_IN_PLACE):
+                    patches = []
+                else:
+                    elements = list(itertools.islice(param_value, i))
+            if patches is not None:
+                if coerced is not value:
+                    patches.append((i, coerced))
+            elif elements is not None:
+                elements.append(coerced)
+            for validator in each:
+                try:
+                    validator("", coerced)
+                except ValidationError as e:
+                    errors.append(ValidationError(e.reason, f"{{{coerced!r}}}" if self._is_set else f"[{i}]"))
+
+        if errors:
+            raise ElementValidationFailed(errors)
+        if patches is not None:
+            for i, coerced in patches:
+                param_value[i] = coerced
+        if elements is None:
+            return param_value
+        if self._origin is list:
+            return elements
+        return self._origin(elements)
+
+    def _coerce_parallel(self, param_value: Any, owned: bool, strict: bool) -> list | tuple | set:
+        """Like `coerce`, processing chunks of the elements on the shared thread pool (see `Parallel`)"""
+        coerce_arg = _element_coercer(self._arg_caster)
+        each = self._each
+        is_set = self._is_set
+
+        def coerce_chunk(chunk: Sequence[Any], start: int) -> tuple[Sequence[Any], bool, list[ValidationError]]:
+            coerced_chunk: list[Any] | None = None
+            errors: list[ValidationError] = []
+            for i, value in enumerate(chunk):
+                coerced = coerce_arg(value, strict)
+                if coerced is not value and coerced_chunk is None:
+                    coerced_chunk = list(chunk[:i])
+                if coerced_chunk is not None:
+                    coerced_chunk.append(coerced)
+                for validator in each:
+                    try:
+                        validator("", coerced)
+                    except ValidationError as e:
+                        errors.append(ValidationError(e.reason, f"{{{coerced!r}}}" if is_set else f"[{start + i}]"))
+            if coerced_chunk is None:
+                return chunk, False, errors
+            return coerced_chunk, True, errors
+
+        values = param_value if isinstance(param_value, (list, tuple)) else list(param_value)
+        try:
+            chunks = map_chunks(coerce_chunk, values)
+        except TypeValidationError:
+            raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+        except TypeCastError as e:
+            raise TypeCastError(self._type_hint, extra_info=str(e))
+
+        errors = [error for _, _, chunk_errors in chunks for error in chunk_errors]
+        if errors:
+            raise ElementValidationFailed(errors)
+        if not any(changed for _, changed, _ in chunks):
+            return param_value
+        elements = list(itertools.chain.from_iterable(chunk for chunk, _, _ in chunks))
+        if type(param_value) is list and (owned or Settings.CAST_IN_PLACE):
+            param_value[:] = elements
+            return param_value
+        if self._origin is list:
+            return elements
+        return self._origin(elements)
 
 
 class DictTypeCaster(TypeCaster[dict]):
@@ -32,31 +164,202 @@ class DictTypeCaster(TypeCaster[dict]):
         next_hint = get_args(type_hint)
         self._key_hint = next_hint[0] if len(next_hint) > 0 else Any
         self._value_hint = next_hint[1] if len(next_hint) > 0 else Any
+        self._key_caster = typecaster_factory(self._key_hint)
+        self._value_caster = typecaster_factory(self._value_hint)
+        self._keys: list[Validator] = []
+        self._values: list[Validator] = []
+        self._parallel_threshold: int | None = Settings.PARALLEL_THRESHOLD or None
 
     def validate(self, param_value: Any) -> bool:
         if isinstance(param_value, dict):
-            keys = [typecaster_factory(self._key_hint).validate(value) for value in param_value.keys()]
-            values = [typecaster_factory(self._value_hint).validate(value) for value in param_value.values()]
-            if all(keys + values):
-                return True
+            validate_key = self._key_caster.validate
+            validate_value = self._value_caster.validate
+            return all(validate_key(k) and validate_value(v) for k, v in param_value.items())
         return False
 
     def cast(self, param_value: Any) -> dict:
-        casted_value = _attempt_typecast(param_value, dict)
-        return {
-            typecaster_factory(self._key_hint).cast(k): typecaster_factory(self._value_hint).cast(v)
-            for k, v in casted_value.items()
-        }
+        return self.coerce(param_value, False)
+
+    def with_metadata(self, metadata: tuple[Any, ...]) -> "DictTypeCaster":
+        caster = copy.copy(self)
+        caster._parallel_threshold = parallel_threshold(metadata, self._parallel_threshold)
+        return caster
+
+    def with_element_validators(
+        self, each: list[Validator], keys: list[Validator], values: list[Validator]
+    ) -> "DictTypeCaster":
+        if each:
+            raise TypeError("`each` validators aren't supported for dicts, use `keys` and/or `values`")
+        caster = copy.copy(self)
+        caster._keys = list(keys)
+        caster._values = list(values)
+        return caster
+
+    def coerce(self, param_value: Any, strict: bool) -> dict:
+        # Validate, cast and apply the element validators in a single pass over the items.
+        # A new dict is only built once an item is changed by casting, unless the values can be patched.
+        owned = False
+        if not isinstance(param_value, dict):
+            if strict:
+                raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+            try:
+                param_value = _attempt_typecast(param_value, dict)
+            except TypeCastError as e:
+                raise TypeCastError(self._type_hint, extra_info=str(e))
+            owned = True
+        patch_values = type(param_value) is dict and (owned or Settings.CAST_IN_PLACE)
+
+        if should_run_parallel(self._parallel_threshold, len(param_value)):
+            return self._coerce_parallel(param_value, patch_values, strict)
+
+        start = 0
+        key_caster = self._key_caster
+        value_caster = self._value_caster
+        if not self._keys and not self._values and has_default_coerce(key_caster) and has_default_coerce(value_caster):
+            # Find the first invalid item, the items before it are kept as they are
+            size = len(param_value)
+            key_start = _first_invalid(key_caster.validate, param_value.keys(), size)
+            value_start = _first_invalid(value_caster.validate, param_value.values(), size)
+            if key_start == -1 and value_start == -1:
+                return param_value
+            start = min(i for i in (key_start, value_start) if i != -1)
+
+        coerce_key = _element_coercer(key_caster)
+        coerce_value = _element_coercer(value_caster)
+        items: dict[Any, Any] | None = None
+        # The values to replace when patching the dict, only once all items are valid and no key was changed
+        patches: dict[Any, Any] = {}
+        errors: list[ValidationError] = []
+
+        for i, (key, value) in enumerate(itertools.islice(param_value.items(), start, None), start):
+            try:
+                coerced_key = coerce_key(key, strict)
+                coerced_value = coerce_value(value, strict)
+            except TypeValidationError:
+                raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+            except TypeCastError as e:
+                raise TypeCastError(self._type_hint, extra_info=str(e))
+
+            if items is None and (coerced_key is not key or coerced_value is not value):
+                if patch_values and coerced_key is key:
+                    patches[key] = coerced_value
+                else:
+                    items = {k: patches.get(k, v) for k, v in itertools.islice(param_value.items(), i)}
+            if items is not None:
+                items[coerced_key] = coerced_value
+
+            for validator in self._keys:
+                try:
+                    validator("", coerced_key)
+                except ValidationError as e:
+                    errors.append(ValidationError(e.reason, f"[key={coerced_key!r}]"))
+            for validator in self._values:
+                try:
+                    validator("", coerced_value)
+                except ValidationError as e:
+                    errors.append(ValidationError(e.reason, f"[{coerced_key!r}]"))
+
+        if errors:
+            raise ElementValidationFailed(errors)
+        if items is not None:
+            return items
+        param_value.update(patches)
+        return param_value
+
+    def _coerce_parallel(self, param_value: dict, patch_values: bool, strict: bool) -> dict:
+        """Like `coerce`, processing chunks of the items on the shared thread pool (see `Parallel`)"""
+        coerce_key = _element_coercer(self._key_caster)
+        coerce_value = _element_coercer(self._value_caster)
+        key_validators = self._keys
+        value_validators = self._values
+
+        def coerce_chunk(chunk: Sequence[tuple[Any, Any]], _: int) -> tuple[list[tuple[Any, Any]], bool, bool, list]:
+            coerced_items: list[tuple[Any, Any]] = []
+            keys_changed = False
+            values_changed = False
+            errors: list[ValidationError] = []
+            for key, value in chunk:
+                coerced_key = coerce_key(key, strict)
+                coerced_value = coerce_value(value, strict)
+                keys_changed = keys_changed or coerced_key is not key
+                values_changed = values_changed or coerced_value is not value
+                coerced_items.append((coerced_key, coerced_value))
+                for validator in key_validators:
+                    try:
+                        validator("", coerced_key)
+                    except ValidationError as e:
+                        errors.append(ValidationError(e.reason, f"[key={coerced_key!r}]"))
+                for validator in value_validators:
+                    try:
+                        validator("", coerced_value)
+                    except ValidationError as e:
+                        errors.append(ValidationError(e.reason, f"[{coerced_key!r}]"))
+            return coerced_items, keys_changed, values_changed, errors
+
+        try:
+            chunks = map_chunks(coerce_chunk, list(param_value.items()))
+        except TypeValidationError:
+            raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+        except TypeCastError as e:
+            raise TypeCastError(self._type_hint, extra_info=str(e))
+
+        errors = [error for *_, chunk_errors in chunks for error in chunk_errors]
+        if errors:
+            raise ElementValidationFailed(errors)
+        keys_changed = any(chunk[1] for chunk in chunks)
+        if not keys_changed and not any(chunk[2] for chunk in chunks):
+            return param_value
+        if patch_values and not keys_changed:
+            for coerced_items, _, values_changed, _ in chunks:
+                if values_changed:
+                    param_value.update(coerced_items)
+            return param_value
+        return dict(itertools.chain.from_iterable(coerced_items for coerced_items, *_ in chunks))
+
+
+def _first_invalid(validate: Callable[[Any], bool], values: Iterable[Any], size: int) -> int:
+    """Get the index of the first value for which `validate` returns False, or -1 if all values are valid.
+    The index is a lower bound if it can't be determined exactly.
+    """
+    iterator = iter(values)
+    if all(map(validate, iterator)):
+        return -1
+    # `all` stops right after the first invalid value, the iterator of builtin containers knows how many are left
+    remaining = operator.length_hint(iterator, -1)
+    return max(size - remaining - 1, 0) if remaining >= 0 else 0
+
+
+def _element_coercer(caster: TypeCaster) -> Callable[[Any, bool], Any]:
+    """Get the function to coerce the elements of a container with.
+
+    For TypeCasters using the default `coerce`, valid elements are returned after a single `validate` call
+    and invalid elements are cast using `cast`. So errors aren't wrapped twice. Other TypeCasters
+    coerce the element themselves (e.g. a nested container in a single pass).
+    """
+    if not has_default_coerce(caster):
+        return caster.coerce
+
+    validate = caster.validate
+    cast = caster.cast
+
+    def coerce_element(value: Any, strict: bool) -> Any:
+        if validate(value):
+            return value
+        if strict:
+            raise TypeValidationError(f"Invalid type, should be {caster._type_hint}")
+        return cast(value)
+
+    return coerce_element
 
 
 def _attempt_typecast(value: Any, to_type: type[T]) -> T:
     if isinstance(value, str):
         try:
-            value = eval(value)
-        except Exception:
-            raise TypeCastError(to_type)
+            value = parse_literal(value)
+        except ValueError as e:
+            raise TypeCastError(to_type, extra_info=str(e))
     try:
         casted_value = to_type(value)
-    except TypeError:
+    except (TypeError, ValueError):
         raise TypeCastError(to_type)
     return casted_value
@@ -1,3 +1,5 @@
+import threading
+import types
 import typing
 import warnings
 
@@ -5,6 +7,67 @@ from ..core.interface import TypeCaster
 from ..settings import Settings
 
 
+class HandlerRegistry(typing.NamedTuple):
+    """An immutable snapshot of the registered handlers.
+
+    Registering a handler never modifies a snapshot, it publishes a new one. So a snapshot can be used
+    without locking, e.g. while another thread registers a handler.
+
+    Attributes:
+        strict_handlers (Mapping[TypeAlias, type[TypeCaster]]): Handlers for type hints matching exactly
+        handlers (Mapping[TypeAlias, type[TypeCaster]]): Handlers for type hints matching exactly, as subclass or
+        by metaclass
+        version (int): The registry version of the snapshot
+    """
+
+    strict_handlers: typing.Mapping[typing.TypeAlias, type[TypeCaster]]
+    handlers: typing.Mapping[typing.TypeAlias, type[TypeCaster]]
+    version: int
+
+
+_registry: HandlerRegistry | None = None
+_registry_version: int = 0
+# Serializes writers, readers take a reference to the current snapshot instead
+_write_lock = threading.RLock()
+
+
+def registry_version() -> int:
+    """Get the current version of the handler registry.
+
+    The version is incremented every time a handler is (un)registered, caches holding
+    `TypeCaster` objects compare against it to find out whether they are outdated.
+
+    Returns:
+        int: the registry version
+    """
+    return _registry_version
+
+
+def bump_registry_version() -> None:
+    """Increment the registry version, invalidating all cached `TypeCaster` objects"""
+    with _write_lock:
+        registry = handler_registry()
+        _publish(registry.strict_handlers, registry.handlers)
+
+
+def handler_registry() -> HandlerRegistry:
+    """Get the current snapshot of the registered handlers, no lock is needed to use it.
+
+    Returns:
+        HandlerRegistry: the handlers and the registry version they belong to
+    """
+    registry = _registry
+    if registry is None:
+        with _write_lock:
+            if _registry is None:
+                # The built-in handlers import the TypeCasters, which import this module
+                from .__handler_lib import STRICT_CUSTOM_HANDLERS, CUSTOM_HANDLERS
+
+                _publish(STRICT_CUSTOM_HANDLERS, CUSTOM_HANDLERS, bump=False)
+            registry = _registry
+    return registry  # type: ignore[return-value]
+
+
 def register_typecaster(type_hints: list[typing.TypeAlias], handler: typing.Type[TypeCaster], strict: bool) -> None:
     """Register a TypeCaster object that handles a set of type hints.
 
@@ -14,26 +77,60 @@ def register_typecaster(type_hints: list[typing.TypeAlias], handler: typing.Type
         strict (bool): Whether the caster is invoked only if the type matches exactly (True)
         or if it's also invoked for all subclasses of type_hints
     """
-    from .__handler_lib import STRICT_CUSTOM_HANDLERS, CUSTOM_HANDLERS
+    with _write_lock:
+        registry = handler_registry()
+        strict_handlers = dict(registry.strict_handlers)
+        handlers = dict(registry.handlers)
+        handler_dict = strict_handlers if strict else handlers
 
-    handler_dict = STRICT_CUSTOM_HANDLERS if strict else CUSTOM_HANDLERS
+        for hint in type_hints:
+            _set_maybe_warn(hint, handler_dict, handler)
 
-    for hint in type_hints:
-        _set_maybe_warn(hint, handler_dict, handler)
+        _publish(strict_handlers, handlers)
 
 
 def unregister_typecaster(type_hint: typing.TypeAlias) -> None:
-    from .__handler_lib import CUSTOM_HANDLERS
-
-    if type_hint in CUSTOM_HANDLERS:
-        del CUSTOM_HANDLERS[type_hint]
+    with _write_lock:
+        registry = handler_registry()
+        if type_hint in registry.handlers:
+            handlers = dict(registry.handlers)
+            del handlers[type_hint]
+            _publish(registry.strict_handlers, handlers)
 
 
 def unregister_strict_typecaster(type_hint: typing.TypeAlias) -> None:
-    from .__handler_lib import STRICT_CUSTOM_HANDLERS
+    with _write_lock:
+        registry = handler_registry()
+        if type_hint in registry.strict_handlers:
+            strict_handlers = dict(registry.strict_handlers)
+            del strict_handlers[type_hint]
+            _publish(strict_handlers, registry.handlers)
+
+
+def restore_handlers(
+    strict_handlers: typing.Mapping[typing.TypeAlias, type[TypeCaster]],
+    handlers: typing.Mapping[typing.TypeAlias, type[TypeCaster]],
+) -> None:
+    """Replace all registered handlers, e.g. by the handlers of a snapshot sent from another process"""
+    with _write_lock:
+        _publish(strict_handlers, handlers)
+
 
-    if type_hint in STRICT_CUSTOM_HANDLERS:
-        del STRICT_CUSTOM_HANDLERS[type_hint]
+def _publish(
+    strict_handlers: typing.Mapping[typing.TypeAlias, type[TypeCaster]],
+    handlers: typing.Mapping[typing.TypeAlias, type[TypeCaster]],
+    bump: bool = True,
+) -> None:
+    """Replace the current snapshot, the caller should hold the write lock"""
+    global _registry, _registry_version
+    version = _registry_version + 1 if bump else _registry_version
+    if not isinstance(strict_handlers, types.MappingProxyType):
+        strict_handlers = types.MappingProxyType(dict(strict_handlers))
+    if not isinstance(handlers, types.MappingProxyType):
+        handlers = types.MappingProxyType(dict(handlers))
+    # Publish the snapshot before the version, a reader that sees the new version also finds the new snapshot
+    _registry = HandlerRegistry(strict_handlers, handlers, version)
+    _registry_version = version
 
 
 def _set_maybe_warn(
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Any, TypeVar, get_args
+
+from ..core.interface import TypeCaster
+from ..exceptions import TypeCastError
+from .handlers import register_typecaster
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+
+class DType:
+    """Metadata for an `Annotated` ndarray type hint, the array should have this data type.
+
+    E.g. `Annotated[np.ndarray, DType(np.float64)]`
+    """
+
+    __slots__ = ("dtype",)
+
+    def __init__(self, dtype: Any) -> None:
+        self.dtype = dtype
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, DType) and self.dtype == other.dtype
+
+    def __hash__(self) -> int:
+        return hash((DType, self.dtype))
+
+    def __repr__(self) -> str:
+        return f"DType({self.dtype!r})"
+
+
+class Shape:
+    """Metadata for an `Annotated` ndarray type hint, the array should have this shape.
+    Use -1 for dimensions that may have any size.
+
+    E.g. `Annotated[np.ndarray, Shape(-1, 3)]`
+    """
+
+    __slots__ = ("dims",)
+
+    def __init__(self, *dims: int) -> None:
+        self.dims = dims
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Shape) and self.dims == other.dims
+
+    def __hash__(self) -> int:
+        return hash((Shape, self.dims))
+
+    def __repr__(self) -> str:
+        return f"Shape{self.dims!r}"
+
+    def matches(self, shape: tuple[int, ...]) -> bool:
+        if len(shape) != len(self.dims):
+            return False
+        for size, expected in zip(shape, self.dims):
+            if expected != -1 and size != expected:
+                return False
+        return True
+
+
+class NDArrayTypeCaster(TypeCaster["np.ndarray"]):
+    """TypeCaster for `np.ndarray` and `numpy.typing.NDArray` type hints.
+
+    The data type is taken from `NDArray[<dtype>]` or `DType` metadata, the shape from `Shape` metadata.
+    Validating only checks the attributes of the array, casting is a single `np.asarray` call.
+    """
+
+    def __init__(self, type_hint: Any, dtype: Any = None, shape: Shape | None = None) -> None:
+        super().__init__(type_hint)
+        if dtype is None:
+            dtype = _dtype_from_hint(type_hint)
+        self._dtype = np.dtype(dtype) if dtype is not None else None
+        self._shape = shape
+
+    def with_metadata(self, metadata: tuple[Any, ...]) -> NDArrayTypeCaster:
+        dtype = self._dtype
+        shape = self._shape
+        for item in metadata:
+            if isinstance(item, DType):
+                dtype = item.dtype
+            elif isinstance(item, Shape):
+                shape = item
+        return NDArrayTypeCaster(self._type_hint, dtype, shape)
+
+    def validate(self, param_value: Any) -> bool:
+        return (
+            isinstance(param_value, np.ndarray)
+            and (self._dtype is None or param_value.dtype == self._dtype)
+            and (self._shape is None or self._shape.matches(param_value.shape))
+        )
+
+    def cast(self, param_value: Any) -> np.ndarray:
+        try:
+            if isinstance(param_value, (bytes, bytearray)):
+                # Raw bytes are interpreted as the contents of the array, not as a single string
+                array = np.frombuffer(param_value, dtype=self._dtype if self._dtype is not None else np.uint8)
+            else:
+                array = np.asarray(param_value, dtype=self._dtype)
+        except (ValueError, TypeError) as e:
+            raise TypeCastError(np.ndarray, extra_info=str(e))
+
+        if self._shape is not None and not self._shape.matches(array.shape):
+            raise TypeCastError(np.ndarray, extra_info=f"Expected shape {self._shape.dims}, got {array.shape}")
+        return array
+
+
+def register_ndarray_typecaster() -> None:
+    """Register `NDArrayTypeCaster` as the TypeCaster for `np.ndarray` (and subclasses)
+
+    Raises:
+        ImportError: If NumPy isn't installed
+    """
+    if np is None:  # pragma: no cover
+        raise ImportError("NumPy is required for the ndarray TypeCaster, install it using `pip install numpy`")
+    register_typecaster([np.ndarray], NDArrayTypeCaster, strict=False)
+
+
+def _dtype_from_hint(type_hint: Any) -> Any:
+    # `npt.NDArray[np.float64]` is `np.ndarray[tuple[int, ...], np.dtype[np.float64]]`
+    args = get_args(type_hint)
+    if len(args) != 2:
+        return None
+    dtype_args = get_args(args[1])
+    if len(dtype_args) != 1 or dtype_args[0] is Any or isinstance(dtype_args[0], TypeVar):
+        return None
+    try:
+        return np.dtype(dtype_args[0])
+    except (TypeError, ValueError):
+        # Abstract scalar types like `np.floating` can't be converted to a data type
+        return None
@@ -0,0 +1,101 @@
+from typing import Any, Callable, Sequence, TypeVar
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
+import threading
+
+
+T = TypeVar("T")
+
+_NUM_WORKERS = os.cpu_count() or 1
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_worker_state = threading.local()
+
+
+class Parallel:
+    """Metadata for an `Annotated` list, tuple, set or dict type hint, large containers are processed in parallel.
+
+    Containers with at least `threshold` elements are split in chunks, one per CPU, which are validated and cast on
+    a shared thread pool. The result and the order of the errors are the same as when processing serially. This
+    scales with the number of CPUs on free-threaded builds of Python, with the GIL it helps for element validators
+    and TypeCasters that release it (e.g. I/O or NumPy).
+
+    E.g. `Annotated[list[Point], Parallel(threshold=100_000)]`. Use the `PARALLEL_THRESHOLD` setting to enable
+    this for all containers.
+    """
+
+    __slots__ = ("threshold",)
+
+    def __init__(self, threshold: int = 10_000) -> None:
+        if threshold < 1:
+            raise ValueError(f"threshold should be positive, got {threshold}")
+        self.threshold = threshold
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Parallel) and self.threshold == other.threshold
+
+    def __hash__(self) -> int:
+        return hash((Parallel, self.threshold))
+
+    def __repr__(self) -> str:
+        return f"Parallel(threshold={self.threshold})"
+
+
+def parallel_threshold(metadata: tuple[Any, ...], default: int | None) -> int | None:
+    """Get the threshold of the `Parallel` metadata, or `default` if there is none"""
+    for item in metadata:
+        if isinstance(item, Parallel):
+            return item.threshold
+    return default
+
+
+def should_run_parallel(threshold: int | None, size: int) -> bool:
+    """Whether a container of this size should be processed in parallel. Containers nested in a container that is
+    processed in parallel are processed serially, waiting for the shared pool from one of its threads could deadlock.
+    """
+    return threshold is not None and size >= threshold and size > 1 and not getattr(_worker_state, "active", False)
+
+
+def map_chunks(func: Callable[[Sequence[Any], int], T], values: Sequence[Any]) -> list[T]:
+    """Call `func(chunk, start)` for consecutive chunks of `values` on the shared thread pool.
+
+    Args:
+        func (Callable[[Sequence[Any], int], T]): Function processing a chunk, `start` is the index of its first value
+        values (Sequence[Any]): The values to process
+
+    Raises:
+        BaseException: The exception raised for the first chunk (in order) that failed
+
+    Returns:
+        list[T]: The result per chunk, in order
+    """
+    executor = _get_executor()
+    size = len(values)
+    chunk_size = -(-size // min(_NUM_WORKERS, size))
+    futures: list[Future[T]] = []
+    for start in range(0, size, chunk_size):
+        stop = start + chunk_size
+        futures.append(executor.submit(_run_chunk, func, values[start:stop], start))
+    # Wait for all chunks before raising, so no chunk is still running when the caller continues
+    results = [future.exception() for future in futures]
+    for error in results:
+        if error is not None:
+            raise error
+    return [future.result() for future in futures]
+
+
+def _run_chunk(func: Callable[[Sequence[Any], int], T], chunk: Sequence[Any], start: int) -> T:
+    _worker_state.active = True
+    try:
+        return func(chunk, start)
+    finally:
+        _worker_state.active = False
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_NUM_WORKERS, thread_name_prefix="fancy_signatures")
+    return _executor
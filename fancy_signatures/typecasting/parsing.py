@@ -0,0 +1,72 @@
+from typing import Any
+import ast
+import json
+
+from ..settings import Settings
+
+
+_SCALARS: dict[str, Any] = {
+    "None": None,
+    "null": None,
+    "True": True,
+    "true": True,
+    "False": False,
+    "false": False,
+}
+_FLOAT_CHARS = frozenset("0123456789.eE+-_")
+
+
+def parse_literal(text: str) -> Any:
+    """Parse a string containing a literal, e.g. a container passed as a string.
+
+    Never evaluates code. Fast paths are used for JSON arrays and objects, comma-separated scalars
+    (e.g. `"1, 2.5, None"`, parsed to a tuple) and single scalars like `"None"` and `"null"`. Other
+    input is parsed as a Python literal (`ast.literal_eval`).
+
+    Args:
+        text (str): The string to parse
+
+    Raises:
+        ValueError: If the string isn't a valid literal, or it's longer than the `MAX_LITERAL_LENGTH` setting
+
+    Returns:
+        Any: The parsed value
+    """
+    max_length = Settings.MAX_LITERAL_LENGTH
+    if len(text) > max_length:
+        raise ValueError(f"Input of length {len(text)} is longer than the maximum of {max_length} characters")
+
+    text = text.strip()
+    if not text:
+        raise ValueError("Empty input")
+
+    first = text[0]
+    if first == "[" or first == "{":
+        try:
+            return json.loads(text)
+        except (ValueError, RecursionError):
+            # Not JSON, but possibly a Python literal like `{1: 2}` or `['a']`
+            pass
+    elif first not in "('\"":
+        try:
+            if "," not in text:
+                return _parse_scalar(text)
+            return tuple([_parse_scalar(token.strip()) for token in text.split(",")])
+        except ValueError:
+            pass
+
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError) as e:
+        raise ValueError(f"Invalid literal: {e}") from None
+
+
+def _parse_scalar(token: str) -> Any:
+    if token in _SCALARS:
+        return _SCALARS[token]
+    if not token or not _FLOAT_CHARS.issuperset(token):
+        raise ValueError(token)
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
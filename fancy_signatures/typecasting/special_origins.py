@@ -1,11 +1,13 @@
 from typing import Any, get_args, _ProtocolMeta, runtime_checkable
 from typing_extensions import _AnnotatedAlias
 import warnings
+import copy
 
 from ..settings import Settings, ProtocolHandlingLevel
 from ..exceptions import TypeCastError, UnCastableType
-from ..core.interface import TypeCaster
+from ..core.interface import TypeCaster, Validator, has_default_coerce
 from .factory import typecaster_factory
+from .parsing import parse_literal
 
 
 class StringTypeCaster(TypeCaster[str]):
@@ -30,13 +32,28 @@ class AnyTypeCaster(TypeCaster[Any]):
 class AnnotatedTypeCaster(TypeCaster[_AnnotatedAlias]):
     def __init__(self, type_hint: Any) -> None:
         super().__init__(type_hint)
-        self._origin = get_args(type_hint)[0]
+        self._origin, *metadata = get_args(type_hint)
+        self._caster = typecaster_factory(self._origin).with_metadata(tuple(metadata))
+        self._validates_elements = False
 
     def validate(self, param_value: Any) -> bool:
-        return typecaster_factory(self._origin).validate(param_value)
+        return self._caster.validate(param_value)
 
     def cast(self, param_value: Any) -> Any:
-        return typecaster_factory(self._origin).cast(param_value)
+        return self._caster.cast(param_value)
+
+    def with_element_validators(
+        self, each: list[Validator], keys: list[Validator], values: list[Validator]
+    ) -> "AnnotatedTypeCaster":
+        caster = copy.copy(self)
+        caster._caster = self._caster.with_element_validators(each, keys, values)
+        caster._validates_elements = True
+        return caster
+
+    def coerce(self, param_value: Any, strict: bool) -> Any:
+        if self._validates_elements or not has_default_coerce(self._caster):
+            return self._caster(param_value, strict)
+        return super().coerce(param_value, strict)
 
 
 class BooleanTypeCaster(TypeCaster[bool]):
@@ -63,8 +80,8 @@ class NoneTypeCaster(TypeCaster[None]):
     def cast(self, param_value: Any) -> None:
         if isinstance(param_value, str):
             try:
-                param_value = eval(param_value)
-            except TypeError:
+                param_value = parse_literal(param_value)
+            except ValueError:
                 raise TypeCastError(type(None))
         if not self.validate(param_value):
             raise TypeCastError(type(None))
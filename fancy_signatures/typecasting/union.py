@@ -1,26 +1,196 @@
-from typing import Any, get_args
+from typing import Any, Annotated, Literal, Mapping, get_args, get_origin, get_type_hints
 from types import UnionType
+import copy
 
-from ..exceptions import TypeCastError
-from ..core.interface import TypeCaster
+from ..exceptions import TypeCastError, TypeValidationError
+from ..core.interface import TypeCaster, Validator
 from .factory import typecaster_factory
 
 
+# Maximum number of value types the dispatch table of a UnionTypeCaster learns, bounds its size for
+# inputs of many different (e.g. dynamically created) types
+_MAX_DISPATCH_TYPES = 64
+_NO_TAG = object()
+
+
+class Discriminator:
+    """Metadata for an `Annotated` union type hint, the members are distinguished by the value of this field.
+
+    E.g. `Annotated[Cat | Dog, Discriminator("type")]`, where the `type` field of `Cat` is annotated with
+    `Literal["cat"]` (or `Cat.type == "cat"`). Values are routed to the member with the matching tag, instead of
+    trying every member in order. The tag is read as a key of mappings and as an attribute of other values.
+    """
+
+    __slots__ = ("field",)
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Discriminator) and self.field == other.field
+
+    def __hash__(self) -> int:
+        return hash((Discriminator, self.field))
+
+    def __repr__(self) -> str:
+        return f"Discriminator({self.field!r})"
+
+
 class UnionTypeCaster(TypeCaster[UnionType]):
     def __init__(self, type_hint: Any) -> None:
         super().__init__(type_hint)
         self._origins = get_args(type_hint)
+        self._casters = tuple(typecaster_factory(origin) for origin in self._origins)
+        self._validates_elements = False
+        self._accepts_none = type(None) in self._origins
+        self._dispatch = self._build_dispatch()
+        self._discriminator: str | None = None
+        self._tags: dict[Any, TypeCaster] = {}
+
+    def with_metadata(self, metadata: tuple[Any, ...]) -> "UnionTypeCaster":
+        for item in metadata:
+            if isinstance(item, Discriminator):
+                caster = copy.copy(self)
+                caster._discriminator = item.field
+                caster._tags = caster._build_tags()
+                return caster
+        return self
+
+    def _build_tags(self) -> dict[Any, TypeCaster]:
+        assert self._discriminator is not None
+        tags: dict[Any, TypeCaster] = {}
+        for origin, caster in zip(self._origins, self._casters):
+            if origin is type(None):
+                continue
+            member_tags = _member_tags(origin, self._discriminator)
+            if not member_tags:
+                raise TypeError(
+                    f"Can't determine the value of '{self._discriminator}' for '{origin}', annotate it with a "
+                    "Literal or set it as a class attribute"
+                )
+            for tag in member_tags:
+                if tag in tags:
+                    raise TypeError(f"Multiple members of '{self._type_hint}' have '{self._discriminator}' {tag!r}")
+                tags[tag] = caster
+        return tags
+
+    def _tagged_caster(self, param_value: Any) -> TypeCaster | None:
+        assert self._discriminator is not None
+        if isinstance(param_value, Mapping):
+            tag = param_value.get(self._discriminator, _NO_TAG)
+        else:
+            tag = getattr(param_value, self._discriminator, _NO_TAG)
+        try:
+            return self._tags.get(tag)
+        except TypeError:
+            # Unhashable tag
+            return None
+
+    def _no_member_info(self, param_value: Any) -> str:
+        return f"No member of '{self._type_hint}' matches the '{self._discriminator}' of {param_value!r}"
+
+    def _build_dispatch(self) -> dict[type, TypeCaster]:
+        # The member caster to try first per type of value. Seeded with the members that are plain classes and
+        # extended with the member that validated a value of a type that isn't in the table yet.
+        dispatch: dict[type, TypeCaster] = {}
+        for origin, caster in zip(self._origins, self._casters):
+            if isinstance(origin, type):
+                dispatch.setdefault(origin, caster)
+        return dispatch
 
     def validate(self, param_value: Any) -> bool:
-        for origin in self._origins:
-            if typecaster_factory(origin).validate(param_value):
+        if param_value is None and self._accepts_none:
+            return True
+        if self._discriminator is not None:
+            tagged = self._tagged_caster(param_value)
+            return tagged is not None and tagged.validate(param_value)
+        value_type = type(param_value)
+        first = self._dispatch.get(value_type)
+        if first is not None and first.validate(param_value):
+            return True
+        # Unknown type, or the member in the table rejects this value (e.g. `list[int] | list[str]`)
+        for caster in self._casters:
+            if caster is not first and caster.validate(param_value):
+                if first is None and len(self._dispatch) < _MAX_DISPATCH_TYPES:
+                    self._dispatch[value_type] = caster
                 return True
         return False
 
     def cast(self, param_value: Any) -> UnionType:
-        for origin in self._origins:
+        if self._discriminator is not None:
+            tagged = self._tagged_caster(param_value)
+            if tagged is None:
+                raise TypeCastError(self._type_hint, extra_info=self._no_member_info(param_value))
+            return tagged.cast(param_value)
+        for caster in self._casters:
             try:
-                return typecaster_factory(origin).cast(param_value)
+                return caster.cast(param_value)
             except TypeCastError:
                 pass
         raise TypeCastError(self._origins)
+
+    def with_element_validators(
+        self, each: list[Validator], keys: list[Validator], values: list[Validator]
+    ) -> "UnionTypeCaster":
+        # Apply the validators to all members that support them, e.g. the list in `list[int] | None`
+        casters: list[TypeCaster] = []
+        for member_caster in self._casters:
+            try:
+                casters.append(member_caster.with_element_validators(each, keys, values))
+            except TypeError:
+                casters.append(member_caster)
+        if casters == list(self._casters):
+            raise TypeError(f"Element validators aren't supported for any type in '{self._type_hint}'")
+
+        caster = copy.copy(self)
+        caster._casters = tuple(casters)
+        caster._dispatch = caster._build_dispatch()
+        if caster._discriminator is not None:
+            caster._tags = caster._build_tags()
+        caster._validates_elements = True
+        return caster
+
+    def coerce(self, param_value: Any, strict: bool) -> UnionType:
+        if self._discriminator is not None:
+            tagged = self._tagged_caster(param_value)
+            if tagged is not None:
+                return tagged(param_value, strict)
+            if param_value is None and self._accepts_none:
+                return None  # type: ignore[return-value]
+            if strict:
+                raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+            raise TypeCastError(self._type_hint, extra_info=self._no_member_info(param_value))
+        if not self._validates_elements:
+            return super().coerce(param_value, strict)
+
+        # Call the member casters, so the element validators are applied
+        for caster in self._casters:
+            try:
+                return caster(param_value, True)
+            except TypeValidationError:
+                pass
+        if strict:
+            raise TypeValidationError(f"Invalid type, should be {self._type_hint}")
+        for caster in self._casters:
+            try:
+                return caster(param_value, False)
+            except TypeCastError:
+                pass
+        raise TypeCastError(self._type_hint, extra_info=str(TypeCastError(self._origins)))
+
+
+def _member_tags(origin: Any, field: str) -> tuple[Any, ...]:
+    if get_origin(origin) is Annotated:
+        origin = get_args(origin)[0]
+    try:
+        hints = get_type_hints(origin)
+    except Exception:
+        # Not a class, or unresolvable forward references
+        hints = getattr(origin, "__annotations__", {})
+    hint = hints.get(field) if isinstance(hints, dict) else None
+    if get_origin(hint) is Literal:
+        return get_args(hint)
+    tag = getattr(origin, field, _NO_TAG)
+    if isinstance(tag, (str, int, bytes)):
+        return (tag,)
+    return ()
@@ -1,15 +1,36 @@
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
+import inspect
 
 from fancy_signatures.exceptions import ValidationError, ValidatorFailed
 
 
 class Related:
-    def __init__(self, func: Callable[..., None], *args: str, **kwargs: str) -> None:
+    def __init__(self, func: Callable[..., None] | Callable[..., Awaitable[None]], *args: str, **kwargs: str) -> None:
         self._func_args = args
         self._func_kwargs = kwargs
         self._func = func
 
+    @property
+    def is_async(self) -> bool:
+        """Whether the validation function is a coroutine function. Async related validators can only be used for
+        coroutine functions."""
+        return inspect.iscoroutinefunction(self._func)
+
     def __call__(self, **kwargs: Any) -> Any:
+        function_kwargs = self._function_kwargs(kwargs)
+        try:
+            self._func(**function_kwargs)
+        except ValidatorFailed as e:
+            raise ValidationError(str(e), list(self._func_args) + list(self._func_kwargs.values()))
+
+    async def call_async(self, **kwargs: Any) -> Any:
+        function_kwargs = self._function_kwargs(kwargs)
+        try:
+            await self._func(**function_kwargs)  # type: ignore[misc]
+        except ValidatorFailed as e:
+            raise ValidationError(str(e), list(self._func_args) + list(self._func_kwargs.values()))
+
+    def _function_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         function_kwargs = {k: v for k, v in kwargs.items() if k in self._func_args}
 
         for arg in self._func_args:
@@ -27,7 +48,4 @@ class Related:
                     "in the function arguments"
                 )
             function_kwargs[validation_func_arg_name] = value
-        try:
-            self._func(**function_kwargs)
-        except ValidatorFailed as e:
-            raise ValidationError(str(e), list(self._func_args) + list(self._func_kwargs.values()))
+        return function_kwargs
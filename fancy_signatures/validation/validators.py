@@ -1,5 +1,6 @@
 from typing import Protocol, TypeVar, Any
 import re
+import sys
 import decimal
 
 from ..core.interface import Validator
@@ -55,13 +56,41 @@ GeT = TypeVar("GeT", bound=HasGe)
 LeT = TypeVar("LeT", bound=HasLe)
 LengthT = TypeVar("LengthT", bound=HasLength)
 
+# Maximum number of indices of invalid elements shown in the error message of an array
+_MAX_INDICES_SHOWN = 10
+
+
+def _as_ndarray(obj: Any) -> Any:
+    """Return `obj` if it's a NumPy array, otherwise None.
+    NumPy is never imported here, if `obj` is an array NumPy has been imported already.
+    """
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(obj, np.ndarray):
+        return obj
+    return None
+
+
+def _check_elements(failed: Any, message: str) -> None:
+    """Raise `ValidatorFailed` if any element of the boolean array `failed` is True,
+    reporting the indices of those elements.
+    """
+    if not failed.any():
+        return
+    indices = sys.modules["numpy"].argwhere(failed)
+    shown = [index[0] if len(index) == 1 else tuple(index) for index in indices[:_MAX_INDICES_SHOWN].tolist()]
+    more = f" and {len(indices) - len(shown)} more" if len(indices) > len(shown) else ""
+    raise ValidatorFailed(f"{message} (invalid elements at indices: {shown}{more})")
+
 
 class GE(Validator[LtT]):
     def __init__(self, value: Any) -> None:
         self._min = value
 
     def validate(self, obj: LtT) -> LtT:
-        if obj < self._min:
+        array = _as_ndarray(obj)
+        if array is not None:
+            _check_elements(array < self._min, f"Value should be greater than or equal to {self._min}")
+        elif obj < self._min:
             raise ValidatorFailed(f"Value should be greater than or equal to {self._min}")
         return obj
 
@@ -71,7 +100,10 @@ class GT(Validator[LeT]):
         self._min = value
 
     def validate(self, obj: LeT) -> LeT:
-        if obj <= self._min:
+        array = _as_ndarray(obj)
+        if array is not None:
+            _check_elements(array <= self._min, f"Value should be greater than {self._min}")
+        elif obj <= self._min:
             raise ValidatorFailed(f"Value should be greater than {self._min}")
         return obj
 
@@ -81,7 +113,10 @@ class LE(Validator[GtT]):
         self._max = value
 
     def validate(self, obj: GtT) -> GtT:
-        if obj > self._max:
+        array = _as_ndarray(obj)
+        if array is not None:
+            _check_elements(array > self._max, f"Value should be smaller than {self._max}")
+        elif obj > self._max:
             raise ValidatorFailed(f"Value should be smaller than {self._max}")
         return obj
 
@@ -91,7 +126,10 @@ class LT(Validator[GeT]):
         self._max = value
 
     def validate(self, obj: GeT) -> GeT:
-        if obj >= self._max:
+        array = _as_ndarray(obj)
+        if array is not None:
+            _check_elements(array >= self._max, f"Value should be smaller than or equal to {self._max}")
+        elif obj >= self._max:
             raise ValidatorFailed(f"Value should be smaller than or equal to {self._max}")
         return obj
 
@@ -151,7 +189,10 @@ class MultipleOfValidator(Validator[int | float]):
         self._base = base
 
     def validate(self, obj: int | float) -> int | float:
-        if obj % self._base != 0:
+        array = _as_ndarray(obj)
+        if array is not None:
+            _check_elements(array % self._base != 0, f"Parameter should be a multiple of {self._base}")
+        elif obj % self._base != 0:
             raise ValidatorFailed(f"Parameter should be a multiple of {self._base}")
         return obj
 
@@ -161,14 +202,34 @@ class DecimalPlacesValidator(Validator[float]):
         self._places = places
 
     def validate(self, obj: float) -> float:
+        array = _as_ndarray(obj)
+        if array is not None:
+            _check_elements(
+                self._too_many_places_array(array),
+                f"Parameter should have a maximum of {self._places} decimal places",
+            )
+        elif self._too_many_places(obj):
+            raise ValidatorFailed(f"Parameter should have a maximum of {self._places} decimal places")
+        return obj
+
+    def _too_many_places(self, obj: Any) -> bool:
         try:
             places = decimal.Decimal(str(obj)).as_tuple().exponent
         except decimal.InvalidOperation:
             raise TypeError("Value cannot be converted to a decimal")
         assert isinstance(places, int)  # for mypy
-        if -places > self._places:
-            raise ValidatorFailed(f"Parameter should have a maximum of {self._places} decimal places")
-        return obj
+        return -places > self._places
+
+    def _too_many_places_array(self, array: Any) -> Any:
+        np = sys.modules["numpy"]
+        if np.issubdtype(array.dtype, np.integer) or np.issubdtype(array.dtype, np.bool_):
+            return np.zeros(array.shape, dtype=bool)
+        if np.issubdtype(array.dtype, np.floating):
+            # A float has at most `places` decimals if it's the float closest to some k / 10**places
+            factor = 10.0**self._places
+            return np.rint(array * factor) / factor != array
+        too_many_places = [self._too_many_places(value) for value in array.flat]
+        return np.array(too_many_places, dtype=bool).reshape(array.shape)
 
 
 class OptionalGE(AllowOptionalMixin, GE[LtT]):
@@ -4,7 +4,8 @@ import pytest
 from fancy_signatures.settings import reset as settings_reset, set, ProtocolHandlingLevel
 from fancy_signatures.core.interface import TypeCaster
 from fancy_signatures.exceptions import TypeCastError
-from fancy_signatures.typecasting import register_typecaster, unregister_strict_typecaster
+from fancy_signatures.typecasting import register_typecaster
+from fancy_signatures.typecasting.default import IntOrFloatTypeCaster
 
 
 class ExceptionNotRaised(Exception):
@@ -38,7 +39,7 @@ def custom_int_handler() -> Generator[bool, None, None]:
     set("WARN_ON_HANDLER_OVERRIDE", False)
     register_typecaster(type_hints=[int], handler=IntTypeCaster, strict=True)
     yield True
-    unregister_strict_typecaster(int)
+    register_typecaster(type_hints=[int], handler=IntOrFloatTypeCaster, strict=True)
     settings_reset()
 
 
@@ -1,4 +1,5 @@
 from typing import Any, ContextManager
+import pickle
 import pytest
 from contextlib import nullcontext as does_not_raise
 from fancy_signatures.api import validate, argument
@@ -12,9 +13,12 @@ from fancy_signatures.validation.validators import (
 )
 from fancy_signatures.default import DefaultValue, EmptyList
 from fancy_signatures.validation.related.validators import exactly_one
-from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, MissingArgument
 from fancy_signatures.core.empty import __EmptyArg__, is_empty
-from .conftest import ExceptionNotRaised
+from fancy_signatures.settings import set as adjust_setting, reset as settings_reset
+from fancy_signatures.typecasting import register_typecaster, typecaster_cache_info
+from fancy_signatures.typecasting.default import IntOrFloatTypeCaster
+from .conftest import ExceptionNotRaised, IntTypeCaster
 
 
 Zero: DefaultValue[int] = DefaultValue(0)
@@ -275,3 +279,105 @@ def test__init_decorated() -> None:
     c = Course(**{"name": "a", "cost": 1.2})  # type: ignore
 
     assert c._cost == 1.2
+
+
+def test__typecasters_refreshed_after_register() -> None:
+    @validate
+    def func(a: int) -> int:
+        return a
+
+    assert func(1.5) == 1
+
+    adjust_setting("WARN_ON_HANDLER_OVERRIDE", False)
+    register_typecaster(type_hints=[int], handler=IntTypeCaster, strict=True)
+    try:
+        with pytest.raises(ValidationError):
+            func(1.5)
+    finally:
+        register_typecaster(type_hints=[int], handler=IntOrFloatTypeCaster, strict=True)
+        settings_reset()
+
+    assert func(1.5) == 1
+
+
+def test__method_binding_shares_wrapper() -> None:
+    first = MyClass(1).my_method
+    before = typecaster_cache_info()
+    second = MyClass(2).my_method
+
+    assert first.__func__ is second.__func__ is MyClass.__dict__["my_method"]
+    assert typecaster_cache_info() == before
+    assert second(1, 2) == 5
+    assert MyClass.my_method(MyClass(3), 1, 2) == 6
+
+
+def test__method_binding_self_validated() -> None:
+    with pytest.raises(MissingArgument):
+        MyClass.my_method()
+
+
+class Slotted:
+    __slots__ = ("_base",)
+
+    @validate
+    def __init__(self, base: int) -> None:
+        self._base = base
+
+    @validate
+    def method(self, a: int) -> int:
+        return self._base + a
+
+
+def test__slotted_class() -> None:
+    s = Slotted("1")
+
+    assert s.method("2") == 3
+    assert not hasattr(s, "__dict__")
+
+
+def test__binding_does_not_store_on_instance() -> None:
+    c = MyClass(1)
+    c.my_method(1, 2)
+
+    assert "my_method" not in vars(c)
+    assert "__init__" not in vars(Course("a", 1.2))
+
+
+def test__classmethod_bound_to_subclass() -> None:
+    class SubClass(MyClass):
+        classvar = "subclass classvar"
+
+    assert MyClass.my_classmethod("test") == "Got test, had classvar"
+    assert SubClass.my_classmethod("test") == "Got test, had subclass classvar"
+
+
+@validate
+class PicklableClass:
+    def __init__(self, a: int) -> None:
+        self.a = a
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        pytest.param(func_2, id="function"),
+        pytest.param(MyClass.my_method, id="method"),
+        pytest.param(PicklableClass.__init__, id="class"),
+    ],
+)
+def test__pickle_by_reference(func: Any) -> None:
+    assert pickle.loads(pickle.dumps(func)) is func
+
+
+def test__pickle_bound_method() -> None:
+    method = pickle.loads(pickle.dumps(MyClass(1).my_method))
+    assert method(1, "2") == 4
+
+
+def test__pickle_local_function() -> None:
+    @validate
+    def local_func(a: int) -> int:
+        return a
+
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(local_func)
@@ -0,0 +1,259 @@
+from typing import Any
+import asyncio
+import inspect
+import sys
+import time
+import pytest
+
+from fancy_signatures import validate, argument, validate_many, call_from_json
+from fancy_signatures.core.interface import Validator
+from fancy_signatures.default import AsyncDefaultFactory, DefaultValue
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.validation.related import Related
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, ValidatorFailed, MissingArgument
+
+
+class _IsAvailable(Validator[str]):
+    """Pretends to look up a value in an external service"""
+
+    def __init__(self, taken: set[str], delay: float = 0.0) -> None:
+        self._taken = taken
+        self._delay = delay
+        self.calls = 0
+
+    async def validate(self, obj: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        if obj in self._taken:
+            raise ValidatorFailed(f"'{obj}' is taken")
+        return obj
+
+
+class _Broken(Validator[Any]):
+    async def validate(self, obj: Any) -> Any:
+        raise RuntimeError("Service unavailable")
+
+
+async def _different(a: str, b: str) -> None:
+    await asyncio.sleep(0)
+    if a == b:
+        raise ValidatorFailed("Should be different")
+
+
+def test__validator_is_async() -> None:
+    assert _IsAvailable(set()).is_async
+    assert not GE(0).is_async
+    assert Related(_different, "a", "b").is_async
+
+
+def test__async_function() -> None:
+    @validate
+    async def func(a: int, b: str = argument(validators=[_IsAvailable({"taken"})])) -> tuple[int, str]:
+        return a, b
+
+    assert asyncio.run(func("1", "free")) == (1, "free")
+    with pytest.raises(ValidationError):
+        asyncio.run(func(1, "taken"))
+    with pytest.raises(MissingArgument):
+        asyncio.run(func(b="free"))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="inspect.markcoroutinefunction requires Python 3.12")
+def test__async_function_is_coroutine_function() -> None:
+    @validate
+    async def func(a: int) -> int:
+        return a
+
+    assert inspect.iscoroutinefunction(func)
+
+
+def test__async_validators_are_awaited_concurrently() -> None:
+    validators = [_IsAvailable(set(), delay=0.1) for _ in range(5)]
+
+    @validate
+    async def func(a: str = argument(validators=validators[:3]), b: str = argument(validators=validators[3:])) -> str:
+        return a + b
+
+    start = time.perf_counter()
+    assert asyncio.run(func("x", "y")) == "xy"
+    assert time.perf_counter() - start < 0.3
+    assert all(validator.calls == 1 for validator in validators)
+
+
+def test__async_validators_after_sync_validators() -> None:
+    is_available = _IsAvailable(set())
+
+    @validate
+    async def func(a: int = argument(validators=[GE(0), is_available])) -> int:
+        return a
+
+    with pytest.raises(ValidationError):
+        asyncio.run(func(-1))
+    assert is_available.calls == 0
+    assert asyncio.run(func("1")) == 1
+    assert is_available.calls == 1
+
+
+def test__async_validators_skip_empty() -> None:
+    is_available = _IsAvailable(set())
+
+    @validate
+    async def func(a: str = argument(validators=[is_available], required=False)) -> Any:
+        return a
+
+    asyncio.run(func())
+    assert is_available.calls == 0
+
+
+def test__async_validators_lazy() -> None:
+    @validate(lazy=True)
+    async def func(
+        a: int = argument(validators=[GE(0)]),
+        b: str = argument(validators=[_IsAvailable({"x"}), _IsAvailable({"x"})]),
+        c: str = argument(validators=[_IsAvailable({"y"})]),
+    ) -> Any:
+        return a, b, c
+
+    with pytest.raises(ValidationErrorGroup) as exc_info:
+        asyncio.run(func(-1, "x", "y"))
+    errors = exc_info.value.exceptions
+    assert len(errors) == 3
+    assert isinstance(errors[0], ValidationError)
+    assert isinstance(errors[1], ValidationErrorGroup) and len(errors[1].exceptions) == 2
+    assert isinstance(errors[2], ValidationErrorGroup) and len(errors[2].exceptions) == 1
+
+
+def test__async_validators_not_lazy() -> None:
+    @validate
+    async def func(a: str = argument(validators=[_IsAvailable({"x"})]), b: str = argument()) -> Any:
+        return a, b
+
+    with pytest.raises(ValidationError) as exc_info:
+        asyncio.run(func("x", "y"))
+    assert "'x' is taken" in str(exc_info.value)
+
+
+def test__async_validator_other_exception() -> None:
+    @validate(lazy=True)
+    async def func(a: str = argument(validators=[_Broken()])) -> Any:
+        return a
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(func("x"))
+
+
+@pytest.mark.parametrize("lazy", [True, False])
+def test__async_related(lazy: bool) -> None:
+    @validate(related=[Related(_different, "a", "b")], lazy=lazy)
+    async def func(a: str, b: str) -> str:
+        return a + b
+
+    assert asyncio.run(func("x", "y")) == "xy"
+    with pytest.raises(ValidationErrorGroup if lazy else ValidationError):
+        asyncio.run(func("x", "x"))
+
+
+def test__async_method() -> None:
+    class Service:
+        @validate
+        async def handle(self, a: str = argument(validators=[_IsAvailable({"x"})])) -> str:
+            return a
+
+    assert asyncio.run(Service().handle("y")) == "y"
+    with pytest.raises(ValidationError):
+        asyncio.run(Service().handle("x"))
+
+
+@pytest.mark.parametrize("compile", [True, False])
+def test__async_function_without_async_validators(compile: bool) -> None:
+    @validate(compile=compile)
+    async def func(a: int = argument(validators=[GE(0)])) -> int:
+        return a
+
+    assert (func.compiled_source is not None) == compile  # type: ignore[attr-defined]
+    assert asyncio.run(func("1")) == 1
+    with pytest.raises(ValidationError):
+        asyncio.run(func(-1))
+
+
+def test__compile_with_async_validators() -> None:
+    @validate(compile=True)
+    async def func(a: str = argument(validators=[_IsAvailable({"x"})])) -> str:
+        return a
+
+    assert asyncio.run(func("y")) == "y"
+    with pytest.raises(ValidationError):
+        asyncio.run(func("x"))
+
+
+def test__async_validators_on_sync_function() -> None:
+    with pytest.raises(TypeError):
+
+        @validate
+        def func(a: str = argument(validators=[_IsAvailable(set())])) -> str:
+            return a
+
+    with pytest.raises(TypeError):
+
+        @validate(related=[Related(_different, "a", "b")])
+        def other_func(a: str, b: str) -> str:
+            return a + b
+
+
+def test__async_element_validators() -> None:
+    with pytest.raises(TypeError):
+
+        @validate
+        async def func(a: list[str] = argument(each=[_IsAvailable(set())])) -> list[str]:
+            return a
+
+
+def test__async_validators_in_batch() -> None:
+    @validate
+    async def func(a: str = argument(validators=[_IsAvailable({"x"})])) -> str:
+        return a
+
+    with pytest.raises(TypeError):
+        list(validate_many(func, [{"a": "y"}]))
+    assert asyncio.run(call_from_json(func, '{"a": "y"}')) == "y"
+
+
+async def _next_id() -> str:
+    await asyncio.sleep(0.1)
+    return "7"
+
+
+def test__async_defaults() -> None:
+    @validate
+    async def func(
+        a: int = argument(default=AsyncDefaultFactory(_next_id)),
+        b: int = argument(default=AsyncDefaultFactory(_next_id), alias="bee", validators=[GE(0)]),
+        c: int = argument(default=AsyncDefaultFactory(_next_id)),
+        d: int = argument(default=DefaultValue(1)),
+    ) -> tuple[int, ...]:
+        return a, b, c, d
+
+    start = time.perf_counter()
+    assert asyncio.run(func()) == (7, 7, 7, 1)
+    assert time.perf_counter() - start < 0.25
+    assert asyncio.run(func(1, bee=2)) == (1, 2, 7, 1)
+    assert asyncio.run(func(c="3")) == (7, 7, 3, 1)
+    with pytest.raises(ValidationError):
+        asyncio.run(func(b=-1))
+
+
+def test__async_defaults_compiled() -> None:
+    @validate(compile=True)
+    async def func(a: int, b: int = argument(default=AsyncDefaultFactory(_next_id))) -> tuple[int, int]:
+        return a, b
+
+    assert asyncio.run(func("1")) == (1, 7)
+    assert asyncio.run(func(1, 2)) == (1, 2)
+
+
+def test__async_defaults_on_sync_function() -> None:
+    with pytest.raises(TypeError):
+
+        @validate
+        def func(a: str = argument(default=AsyncDefaultFactory(_next_id))) -> str:
+            return a
@@ -0,0 +1,220 @@
+from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import multiprocessing
+import pickle
+import pytest
+
+from fancy_signatures import validate, validate_many, split_results, argument, RecordResult, batch
+from fancy_signatures import register_typecaster, unregister_typecaster, adjust_setting
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.validation.related import exactly_one
+from fancy_signatures.core.empty import __EmptyArg__
+from fancy_signatures.core.interface import TypeCaster, Validator
+from fancy_signatures.exceptions import (
+    ValidationError,
+    ValidationErrorGroup,
+    MissingArgument,
+    UnrecognizedArgument,
+    TypeCastError,
+)
+
+
+def _func(a: int = argument(validators=[GE(0)], required=False), b: int = argument(alias="bee", required=False)) -> int:
+    return a + b
+
+
+generic = validate(related=[exactly_one("a", "b")])(_func)
+compiled = validate(related=[exactly_one("a", "b")], compile=True)(_func)
+
+
+@validate(related=[exactly_one("a", "b")])
+def importable(a: int = argument(validators=[GE(0)], required=False), b: int = argument(required=False)) -> int:
+    return a if b is None else b
+
+
+class Celsius:
+    def __init__(self, degrees: float) -> None:
+        self.degrees = float(degrees)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Celsius) and self.degrees == other.degrees
+
+
+class CelsiusTypeCaster(TypeCaster[Celsius]):
+    def validate(self, param_value: Any) -> bool:
+        return isinstance(param_value, Celsius)
+
+    def cast(self, param_value: Any) -> Celsius:
+        try:
+            return Celsius(str(param_value).removesuffix("C"))
+        except ValueError:
+            raise TypeCastError(Celsius)
+
+
+@validate
+def measure(t: Celsius, readings: list[int] = argument(required=False)) -> Any:
+    return t, readings
+
+
+class Offset:
+    def __init__(self, base: int) -> None:
+        self.base = base
+
+    @validate
+    def add(self, a: int) -> int:
+        return self.base + a
+
+
+@pytest.mark.parametrize("func", [generic, compiled])
+def test__validate_many(func: Any) -> None:
+    records = [{"a": "1"}, {"bee": 2}, {"a": -1}, {"a": 1, "b": 1}, {"c": 1}]
+    results = list(validate_many(func, records))
+
+    assert [r.position for r in results] == [0, 1, 2, 3, 4]
+    assert results[0] == RecordResult(0, {"a": 1, "b": __EmptyArg__()})
+    assert results[1].ok and results[1].value["b"] == 2
+    assert isinstance(results[2].error, ValidationErrorGroup)
+    assert isinstance(results[3].error, ValidationErrorGroup)
+    assert isinstance(results[4].error, UnrecognizedArgument)
+    assert not any(r.ok for r in results[2:])
+
+
+@pytest.mark.parametrize("compile", [True, False])
+def test__validate_many_raises_other_errors(compile: bool) -> None:
+    class Suffix(Validator[str]):
+        def validate(self, obj: str) -> str:
+            return obj + "x"
+
+    @validate(compile=compile)
+    def func(a: int = argument(validators=[Suffix()])) -> int:
+        return a
+
+    with pytest.raises(TypeError) as exc_info:
+        list(validate_many(func, [{"a": 1}]))
+    assert not isinstance(exc_info.value, UnrecognizedArgument)
+
+
+@pytest.mark.parametrize("compile", [True, False])
+def test__validate_many_method_invalid_keys(compile: bool) -> None:
+    class Service:
+        @validate(compile=compile)
+        def method(self, a: int) -> Any:
+            return self, a
+
+    service = Service()
+    records: list[dict[Any, Any]] = [{"a": 1}, {"self": 2, "a": 1}, {1: 2}, {"a": "3"}]
+    results = list(validate_many(service.method, records, call=True))
+
+    assert [r.value for r in results] == [(service, 1), None, None, (service, 3)]
+    assert isinstance(results[1].error, UnrecognizedArgument)
+    assert isinstance(results[2].error, UnrecognizedArgument)
+
+
+def test__validate_many_not_lazy() -> None:
+    results = list(validate_many(generic, [{"a": -1}], lazy=False))
+    assert isinstance(results[0].error, ValidationError)
+
+
+def test__validate_many_missing_argument() -> None:
+    @validate
+    def func(a: int) -> int:
+        return a
+
+    result = next(validate_many(func, [{}]))
+    assert isinstance(result.error, MissingArgument)
+
+
+def test__validate_many_call() -> None:
+    @validate
+    def func(a: int, b: int = argument(validators=[GE(0)])) -> int:
+        return a + b
+
+    results = list(validate_many(func, [{"a": 1, "b": "2"}, {"a": 1, "b": -2}], call=True))
+    assert results[0].value == 3
+    assert not results[1].ok
+
+
+def test__validate_many_method() -> None:
+    class MyClass:
+        def __init__(self, base: int) -> None:
+            self.base = base
+
+        @validate
+        def method(self, a: int) -> int:
+            return self.base + a
+
+    results = list(validate_many(MyClass(1).method, [{"a": "2"}], call=True))
+    assert results[0].value == 3
+
+
+def test__validate_many_not_decorated() -> None:
+    with pytest.raises(TypeError):
+        validate_many(_func, [])  # type: ignore[arg-type]
+
+
+def test__split_results() -> None:
+    valid, errors = split_results(validate_many(generic, [{"a": 1}, {"a": -1}, {"b": 1}, {"c": 1}]))
+
+    assert next(errors).position == 1
+    # The valid result before the error was buffered
+    assert [r.position for r in valid] == [0, 2]
+    assert [r.position for r in errors] == [3]
+
+
+def test__split_results_close() -> None:
+    valid, errors = split_results(validate_many(generic, [{"a": -1}, {"a": 1}, {"a": -2}]))
+    errors.close()
+
+    assert [r.position for r in valid] == [1]
+    assert list(errors) == []
+
+
+@pytest.mark.parametrize("call", [True, False])
+def test__validate_many_processes(call: bool) -> None:
+    records = [{"a": "1"}, {"b": 2}, {"a": -1}, {"a": 1, "b": 1}, {"c": 1}, {"a": 3}, {}] * 3
+    expected = list(validate_many(importable, records, call=call))
+
+    results = list(validate_many(importable, records, call=call, processes=2, chunk_size=2))
+
+    assert [r.position for r in results] == list(range(len(records)))
+    assert [(r.value, type(r.error), str(r.error)) for r in results] == [
+        (r.value, type(r.error), str(r.error)) for r in expected
+    ]
+
+
+def test__validate_many_processes_spawn(reset_settings: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+    # A spawned worker imports `measure` without the TypeCaster and setting of this process
+    spawn = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(batch, "ProcessPoolExecutor", spawn)
+    register_typecaster([Celsius], CelsiusTypeCaster, strict=False)
+    adjust_setting("MAX_LITERAL_LENGTH", 5)
+    records = [{"t": "20C"}, {"t": 1.5, "readings": "[1, 2, 3]"}, {"t": "x"}]
+    try:
+        expected = list(validate_many(measure, records))
+        results = list(validate_many(measure, records, processes=1))
+    finally:
+        unregister_typecaster(Celsius)
+
+    assert expected[0].value["t"] == Celsius(20)
+    assert isinstance(expected[1].error, ValidationErrorGroup)
+    assert [(r.value, type(r.error), str(r.error)) for r in results] == [
+        (r.value, type(r.error), str(r.error)) for r in expected
+    ]
+
+
+def test__validate_many_processes_method() -> None:
+    results = list(validate_many(Offset(1).add, [{"a": "2"}, {"a": "x"}], call=True, processes=1))
+    assert results[0].value == 3
+    assert isinstance(results[1].error, ValidationError)
+
+
+def test__validate_many_processes_not_picklable() -> None:
+    with pytest.raises(pickle.PicklingError):
+        validate_many(generic, [], processes=2)
+
+
+@pytest.mark.parametrize("processes, chunk_size", [(0, 10), (2, 0)])
+def test__validate_many_processes_invalid(processes: int, chunk_size: int) -> None:
+    with pytest.raises(ValueError):
+        validate_many(importable, [], processes=processes, chunk_size=chunk_size)
@@ -0,0 +1,156 @@
+from typing import Any, ContextManager
+from contextlib import nullcontext as does_not_raise
+import linecache
+import traceback
+import pytest
+
+from fancy_signatures import validate_many
+from fancy_signatures.api import validate, argument
+from fancy_signatures.validation.validators import GE, BlackListedValues, MaxLength
+from fancy_signatures.validation.related import exactly_one
+from fancy_signatures.default import EmptyList, DefaultValue
+from fancy_signatures.core.empty import __EmptyArg__, is_empty
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, MissingArgument
+
+
+def _func(
+    a: int = argument(validators=[GE(0), BlackListedValues(10)], required=False),
+    b: list[int] = argument(default=EmptyList, validators=[MaxLength(3)]),
+    c: int | None = argument(alias="see", required=False),
+    *,
+    d: float = 1.5,
+) -> tuple[Any, ...]:
+    return a, b, c, d
+
+
+generic = validate(related=[exactly_one("a", "c")])(_func)
+compiled = validate(related=[exactly_one("a", "c")], compile=True)(_func)
+generic_lazy = validate(related=[exactly_one("a", "c")], lazy=True)(_func)
+compiled_lazy = validate(related=[exactly_one("a", "c")], lazy=True, compile=True)(_func)
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, expectation",
+    [
+        pytest.param((1,), {}, does_not_raise(), id="positional"),
+        pytest.param(("1", ["1", 2]), {"d": "2"}, does_not_raise(), id="cast"),
+        pytest.param((), {"see": "3", "b": (1,)}, does_not_raise(), id="alias"),
+        pytest.param((), {"c": 3}, does_not_raise(), id="by name"),
+        pytest.param((-1,), {}, pytest.raises(ValidationError), id="validator"),
+        pytest.param((10, [1, 2, 3, 4]), {}, pytest.raises(ValidationError), id="multiple validators"),
+        pytest.param((), {"a": 1, "c": 1}, pytest.raises(ValidationError), id="related"),
+        pytest.param(("a", "b"), {}, pytest.raises(ValidationError), id="typecast"),
+        pytest.param((1,), {"e": 1}, pytest.raises(TypeError), id="unrecognized"),
+    ],
+)
+def test__compiled_equals_generic(args: tuple, kwargs: dict[str, Any], expectation: ContextManager) -> None:
+    for generic_func, compiled_func in [(generic, compiled), (generic_lazy, compiled_lazy)]:
+        with expectation as generic_exc:
+            generic_result = generic_func(*args, **kwargs)
+        with expectation as compiled_exc:
+            compiled_result = compiled_func(*args, **kwargs)
+
+        if generic_exc is None:
+            assert generic_result == compiled_result
+        else:
+            assert type(generic_exc.value) is type(compiled_exc.value)
+            assert str(generic_exc.value) == str(compiled_exc.value)
+
+
+def test__compiled_lazy_error_group() -> None:
+    try:
+        compiled_lazy(-1, [1, 2, 3, 4], [1])
+    except ValidationErrorGroup as e:
+        assert len(e.exceptions) == 3
+        assert isinstance(e.exceptions[0], ValidationErrorGroup)
+    else:
+        pytest.fail("ValidationErrorGroup not raised")
+
+
+def test__compiled_missing_argument() -> None:
+    @validate(compile=True)
+    def func(a: int, b: int = argument(default=DefaultValue(1))) -> int:
+        return a + b
+
+    assert func(1) == 2
+
+    with pytest.raises(MissingArgument):
+        func(b=1)
+
+
+def test__compiled_not_required() -> None:
+    @validate(compile=True)
+    def func(a: int = argument(required=False)) -> Any:
+        return a
+
+    assert is_empty(func())
+    assert func(__EmptyArg__()) == __EmptyArg__()
+
+
+def test__compiled_source() -> None:
+    assert generic.compiled_source is None
+    assert compiled.compiled_source is not None
+    assert compiled.compiled_source.startswith("def compiled_call(a=_fs_empty, b=_fs_empty, c=_fs_empty, d=_fs_empty")
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        pytest.param(lambda *args: None, id="var positional"),
+        pytest.param(lambda **kwargs: None, id="var keyword"),
+        pytest.param(lambda a, /: None, id="positional only"),
+        pytest.param(lambda _fs_a: None, id="reserved name"),
+    ],
+)
+def test__compile_unsupported_signature(func: Any) -> None:
+    with pytest.raises(NotImplementedError):
+        validate(compile=True)(func)
+
+
+class _WithMethod:
+    def __init__(self, base: int) -> None:
+        self._base = base
+
+    @validate(compile=True)
+    def method(self, a: int = argument(validators=[GE(0)])) -> int:
+        return self._base + a
+
+
+def test__compiled_source_without_aliases() -> None:
+    @validate(compile=True)
+    def func(a: int) -> int:
+        return a
+
+    assert func.compiled_source.count("if _fs_kwargs:") == 1  # type: ignore[attr-defined]
+
+
+def test__compiled_source_in_traceback() -> None:
+    class A:
+        @validate(compile=True)
+        def get(self, x: int) -> int:
+            return x
+
+    class B:
+        @validate(compile=True)
+        def get(self, y: int | None = argument(required=False)) -> Any:
+            return y
+
+    B().get(1)
+    list(validate_many(B().get, [{"y": 1}]))
+    with pytest.raises(MissingArgument) as exc_info:
+        A().get()
+
+    frames = [
+        frame for frame in traceback.extract_tb(exc_info.tb) if frame.filename.startswith("<fancy_signatures compiled")
+    ]
+    assert len(frames) == 1
+    assert "A.get call" in frames[0].filename
+    source = "".join(linecache.getlines(frames[0].filename))
+    assert source == A.get.compiled_source  # type: ignore[attr-defined]
+
+
+def test__compiled_method() -> None:
+    assert _WithMethod(1).method("2") == 3
+
+    with pytest.raises(ValidationError):
+        _WithMethod(1).method(-1)
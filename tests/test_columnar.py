@@ -0,0 +1,110 @@
+from typing import Any
+import pytest
+
+from fancy_signatures import validate, validate_columns, validate_many, argument
+from fancy_signatures.core.interface import Default
+from fancy_signatures.default import EmptyList
+from fancy_signatures.validation.validators import GE, MaxLength
+from fancy_signatures.validation.related import exactly_one
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, MissingArgument, UnrecognizedArgument
+
+
+@validate(related=[exactly_one("a", "b")])
+def _func(
+    a: int | None = argument(required=False),
+    b: int | None = argument(alias="bee", required=False),
+    c: list[int] = argument(default=EmptyList, validators=[MaxLength(2)]),
+) -> Any:
+    return a, b, c
+
+
+def test__validate_columns() -> None:
+    result = validate_columns(_func, {"a": ["1", [1], None, 3], "bee": [None, None, 2, 3]})
+
+    assert result.mask == [True, False, True, False]
+    assert result.columns["a"][0] == 1
+    assert result.columns["b"][2] == 2
+    assert result.columns["c"] == [[], [], [], []]
+    assert result.columns["c"][0] is not result.columns["c"][1]
+    assert list(result.errors) == [1, 3]
+    assert isinstance(result.errors[1], ValidationErrorGroup)
+    assert "Related parameter validation" in str(result.errors[3])
+
+
+def test__validate_columns_equals_call() -> None:
+    rows = [{"a": "1", "c": ["1"]}, {"bee": [1]}, {"a": [1], "c": [1, 2, 3]}, {"a": None, "bee": 1}]
+    columns = {"a": ["1", None, [1], None], "bee": [None, [1], None, 1], "c": [["1"], [], [1, 2, 3], []]}
+    result = validate_columns(_func, columns, lazy=False)
+
+    for row, kwargs in enumerate(rows):
+        try:
+            _func(**kwargs)
+        except ValidationError as e:
+            assert str(result.errors[row]) == str(e)
+        else:
+            assert result.mask[row]
+
+
+def test__validate_columns_not_lazy() -> None:
+    result = validate_columns(_func, {"a": [-1], "c": [[1, 2, 3]]}, lazy=False)
+
+    assert not isinstance(result.errors[0], ValidationErrorGroup)
+    assert isinstance(result.errors[0], ValidationError)
+
+
+def test__validate_columns_missing_argument() -> None:
+    @validate
+    def func(a: int, b: int = argument(validators=[GE(0)])) -> int:
+        return a + b
+
+    result = validate_columns(func, {"b": [-1]})
+    assert isinstance(result.errors[0], MissingArgument)
+
+
+class _NotAvailable(Default[str]):
+    def get(self, value: Any) -> Any:
+        return "N/A" if value == "" else value
+
+
+def test__validate_columns_custom_default() -> None:
+    @validate
+    def func(a: str = argument(default=_NotAvailable())) -> str:
+        return a
+
+    result = validate_columns(func, {"a": ["", "x"]})
+    assert result.columns["a"] == [func(""), "x"] == ["N/A", "x"]
+    assert [r.value["a"] for r in validate_many(func, [{"a": ""}])] == ["N/A"]
+
+
+def test__validate_columns_method() -> None:
+    class MyClass:
+        @validate
+        def method(self, a: int) -> int:
+            return a
+
+    instance = MyClass()
+    result = validate_columns(instance.method, {"a": ["1", "2"]})
+    assert result.columns["self"] == [instance, instance]
+    assert result.columns["a"] == [1, 2]
+
+    with pytest.raises(UnrecognizedArgument):
+        validate_columns(instance.method, {"self": [1, 2], "a": ["1", "2"]})
+
+
+@pytest.mark.parametrize(
+    "columns, error",
+    [
+        pytest.param({"a": [1], "c": [[], []]}, ValueError, id="different lengths"),
+        pytest.param({"d": [1]}, TypeError, id="unrecognized"),
+        pytest.param({"b": [1], "bee": [2]}, TypeError, id="name and alias"),
+    ],
+)
+def test__validate_columns_invalid_input(columns: dict[str, Any], error: type[Exception]) -> None:
+    with pytest.raises(error):
+        validate_columns(_func, columns)
+
+
+def test__validate_columns_empty() -> None:
+    result = validate_columns(_func, {})
+    assert result.mask == []
+    assert result.columns == {"a": [], "b": [], "c": []}
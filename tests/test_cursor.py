@@ -0,0 +1,69 @@
+from typing import Any, Generator
+import sqlite3
+import pytest
+
+from fancy_signatures import validate, validate_cursor, argument
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.exceptions import ValidationErrorGroup, MissingArgument
+
+
+@validate
+def _func(a: int = argument(validators=[GE(0)]), b: str = argument(alias="bee"), c: float = 0.0) -> Any:
+    return a
+
+
+@pytest.fixture
+def connection() -> Generator[sqlite3.Connection, None, None]:
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    connection.execute("CREATE TABLE records (a INTEGER, bee TEXT, c REAL)")
+    connection.executemany(
+        "INSERT INTO records VALUES (?, ?, ?)", [(i if i % 4 else -i, f"b{i}", i / 2) for i in range(1, 11)]
+    )
+    yield connection
+    connection.close()
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test__validate_cursor(connection: sqlite3.Connection, prefetch: bool) -> None:
+    cursor = connection.execute("SELECT a, bee, c FROM records ORDER BY a")
+    batches = list(validate_cursor(_func, cursor, batch_size=4, prefetch=prefetch))
+
+    assert [len(batch.mask) for batch in batches] == [4, 4, 2]
+    assert batches[0].mask == [False, False, True, True]
+    assert isinstance(batches[0].errors[0], ValidationErrorGroup)
+    assert batches[0].columns["a"] == [-8, -4, 1, 2]
+    assert batches[0].columns["b"] == ["b8", "b4", "b1", "b2"]
+    assert all(all(batch.mask) for batch in batches[1:])
+
+
+def test__validate_cursor_arraysize(connection: sqlite3.Connection) -> None:
+    cursor = connection.execute("SELECT a, bee FROM records WHERE a > 0")
+    cursor.arraysize = 5
+
+    batches = list(validate_cursor(_func, cursor))
+
+    assert [len(batch.mask) for batch in batches] == [5, 3]
+    assert batches[0].columns["c"] == [0.0] * 5
+
+
+def test__validate_cursor_missing_column(connection: sqlite3.Connection) -> None:
+    cursor = connection.execute("SELECT a FROM records WHERE a > 0")
+
+    batch = next(validate_cursor(_func, cursor))
+
+    assert isinstance(batch.errors[0], MissingArgument)
+
+
+def test__validate_cursor_empty(connection: sqlite3.Connection) -> None:
+    cursor = connection.execute("SELECT a, bee FROM records WHERE a > 100")
+
+    assert list(validate_cursor(_func, cursor)) == []
+
+
+def test__validate_cursor_invalid(connection: sqlite3.Connection) -> None:
+    with pytest.raises(ValueError):
+        validate_cursor(_func, connection.cursor())
+    with pytest.raises(ValueError):
+        validate_cursor(_func, connection.execute("SELECT a FROM records"), batch_size=0)
+    with pytest.raises(TypeError):
+        validate_cursor(_func, connection.execute("SELECT a, bee AS d FROM records"))
@@ -1,9 +1,11 @@
 import typing
+import asyncio
 import pytest
 from datetime import datetime
 from dataclasses import dataclass
 from fancy_signatures.core.empty import __EmptyArg__
 from fancy_signatures.default import (
+    AsyncDefaultFactory,
     DefaultValue,
     Default,
     DefaultFactory,
@@ -99,3 +101,18 @@ def test__custom_default_factory() -> None:
     default: DefaultFactory[int] = DefaultFactory(my_default_factory)
 
     assert default(__EmptyArg__()) == cur_year
+
+
+def test__async_default_factory() -> None:
+    async def factory() -> int:
+        return 1
+
+    default: AsyncDefaultFactory[int] = AsyncDefaultFactory(factory)
+
+    assert default.is_async
+    assert not DefaultFactory(list).is_async
+    assert asyncio.run(default.get_async(__EmptyArg__())) == 1
+    assert asyncio.run(default.get_async(2)) == 2
+    assert default(2) == 2
+    with pytest.raises(TypeError):
+        default(__EmptyArg__())
@@ -0,0 +1,119 @@
+from typing import Any, Annotated
+import pytest
+
+from fancy_signatures import validate, argument
+from fancy_signatures.validation.validators import GE, MaxLength, OptionalGE
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup
+
+
+@pytest.mark.parametrize("compile", [False, True])
+@pytest.mark.parametrize(
+    "type_hint, kwargs, value, expectation",
+    [
+        pytest.param(list[int], {"each": [GE(0)]}, ["1", 2], [1, 2], id="list"),
+        pytest.param(tuple[int, ...], {"each": [GE(0)]}, [1, 2], (1, 2), id="tuple"),
+        pytest.param(set[int], {"each": [GE(0)]}, {"1"}, {1}, id="set"),
+        pytest.param(dict[str, int], {"keys": [MaxLength(1)], "values": [GE(0)]}, {"a": "1"}, {"a": 1}, id="dict"),
+        pytest.param(list[int] | None, {"each": [GE(0)]}, None, None, id="optional"),
+        pytest.param(Annotated[list[int], "meta"], {"each": [GE(0)]}, [1], [1], id="annotated"),
+        pytest.param(list[int | None], {"each": [OptionalGE(0)]}, [None, 1], [None, 1], id="optional elements"),
+    ],
+)
+def test__element_validators_valid(
+    compile: bool, type_hint: Any, kwargs: dict[str, Any], value: Any, expectation: Any
+) -> None:
+    @validate(compile=compile)
+    def func(a: type_hint = argument(**kwargs)) -> Any:  # type: ignore[valid-type]
+        return a
+
+    assert func(value) == expectation
+
+
+@pytest.mark.parametrize("compile", [False, True])
+@pytest.mark.parametrize(
+    "type_hint, kwargs, value, names",
+    [
+        pytest.param(list[int], {"each": [GE(0)]}, [1, -1, "-2"], ["a[1]", "a[2]"], id="list"),
+        pytest.param(set[int], {"each": [GE(0)]}, {-1}, ["a{-1}"], id="set"),
+        pytest.param(
+            dict[str, int],
+            {"keys": [MaxLength(1)], "values": [GE(0)]},
+            {"ab": 1, "b": -1},
+            ["a[key='ab']", "a['b']"],
+            id="dict",
+        ),
+        pytest.param(list[int] | None, {"each": [GE(0)]}, [-1], ["a[0]"], id="optional"),
+        pytest.param(Annotated[list[int], "meta"], {"each": [GE(0)]}, [-1], ["a[0]"], id="annotated"),
+    ],
+)
+def test__element_validators_invalid(
+    compile: bool, type_hint: Any, kwargs: dict[str, Any], value: Any, names: list[str]
+) -> None:
+    @validate(lazy=True, compile=compile)
+    def func(a: type_hint = argument(**kwargs)) -> Any:  # type: ignore[valid-type]
+        return a
+
+    with pytest.raises(ValidationErrorGroup) as exc_info:
+        func(value)
+
+    (field_errors,) = exc_info.value.exceptions
+    assert isinstance(field_errors, ValidationErrorGroup)
+    assert [str(e) for e in field_errors.exceptions] == [
+        f"Parameter '{name}' is invalid. {e.reason}." for name, e in zip(names, field_errors.exceptions)
+    ]
+
+
+def test__element_validators_not_lazy() -> None:
+    @validate
+    def func(a: list[int] = argument(each=[GE(0)])) -> Any:
+        return a
+
+    with pytest.raises(ValidationError, match=r"Parameter 'a\[1\]' is invalid"):
+        func([0, -1, -2])
+
+
+def test__element_validators_returns_same_object() -> None:
+    @validate
+    def func(a: list[int] = argument(each=[GE(0)])) -> Any:
+        return a
+
+    value = [1, 2]
+    assert func(value) is value
+
+
+def test__element_validators_strict() -> None:
+    @validate(type_strict=True)
+    def func(a: list[int] = argument(each=[GE(0)])) -> Any:
+        return a
+
+    with pytest.raises(ValidationError, match="Type validation failed"):
+        func([1, "2"])
+
+
+def test__element_validators_with_validators() -> None:
+    @validate(lazy=True)
+    def func(a: list[int] = argument(each=[GE(0)], validators=[MaxLength(1)])) -> Any:
+        return a
+
+    with pytest.raises(ValidationErrorGroup) as exc_info:
+        func([1, 2])
+
+    assert "Errors during validation of 'a'" in str(exc_info.value.exceptions[0])
+
+
+@pytest.mark.parametrize(
+    "type_hint, kwargs",
+    [
+        pytest.param(int, {"each": [GE(0)]}, id="int"),
+        pytest.param(Any, {"each": [GE(0)]}, id="untyped"),
+        pytest.param(int | None, {"each": [GE(0)]}, id="union"),
+        pytest.param(list[int], {"keys": [GE(0)]}, id="keys on list"),
+        pytest.param(dict[str, int], {"each": [GE(0)]}, id="each on dict"),
+    ],
+)
+def test__element_validators_unsupported(type_hint: Any, kwargs: dict[str, Any]) -> None:
+    with pytest.raises(TypeError):
+
+        @validate
+        def func(a: type_hint = argument(**kwargs)) -> Any:  # type: ignore[valid-type]
+            return a
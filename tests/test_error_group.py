@@ -1,7 +1,10 @@
+import pickle
+import pytest
+
 from fancy_signatures import validate, argument
 from fancy_signatures.validation import OptionalLT, MultipleOfValidator, GE
 from fancy_signatures.default import Zero
-from fancy_signatures.exceptions import ValidationErrorGroup
+from fancy_signatures.exceptions import ValidationErrorGroup, TypeCastError, UnCastableType
 
 from .conftest import ExceptionNotRaised
 
@@ -56,3 +59,20 @@ def test__to_dict_with_exception_and_group() -> None:
         raise ExceptionNotRaised()
     except ValidationErrorGroup as e:
         assert e.to_dict() == expected_result
+
+
+def test__pickle() -> None:
+    try:
+        func(a=1, b="1")  # type: ignore
+        raise ExceptionNotRaised()
+    except ValidationErrorGroup as e:
+        unpickled = pickle.loads(pickle.dumps(e))
+        assert type(unpickled) is ValidationErrorGroup
+        assert unpickled.to_dict() == e.to_dict()
+
+
+@pytest.mark.parametrize("error", [TypeCastError(int, "x"), TypeCastError(int), UnCastableType(int)])
+def test__pickle_type_cast_error(error: TypeCastError) -> None:
+    unpickled = pickle.loads(pickle.dumps(error))
+    assert type(unpickled) is type(error)
+    assert str(unpickled) == str(error)
@@ -0,0 +1,186 @@
+from typing import Any
+import asyncio
+import gc
+import pytest
+
+from fancy_signatures import validate, argument, metrics
+from fancy_signatures.default import DefaultValue
+from fancy_signatures.typecasting import registry_version
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, MissingArgument
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics() -> Any:
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def _stats(func: Any) -> metrics.FunctionStats:
+    return metrics.snapshot()[f"{func.__module__}.{func.__qualname__}"]
+
+
+def test__disabled() -> None:
+    @validate
+    def func(a: int) -> int:
+        return a
+
+    assert func("1") == 1
+    assert func._compiled is None  # type: ignore[attr-defined]
+    assert f"{func.__module__}.{func.__qualname__}" not in metrics.snapshot()
+
+
+@pytest.mark.parametrize("compile", [True, False])
+def test__function(compile: bool) -> None:
+    @validate(lazy=True, compile=compile)
+    def func(
+        a: int,
+        b: str = argument(default=DefaultValue("b")),
+        c: int = argument(validators=[GE(0)], required=False),
+    ) -> int:
+        return a
+
+    metrics.enable()
+    assert func(1) == 1
+    assert func("2", "x", c=3) == 2
+    with pytest.raises(ValidationErrorGroup):
+        func(1, c=-1)
+    with pytest.raises(ValidationErrorGroup):
+        func("a")
+
+    stats = _stats(func)
+    assert stats.calls == 4
+    assert stats.failures == 2
+    assert stats.total_ns > 0
+    assert 0 < stats.p50_ns <= stats.p90_ns <= stats.p99_ns
+    if compile:
+        # The generated code is only timed
+        assert set(stats.parameters.values()) == {metrics.ParameterStats(0, 0, 0, 0)}
+    else:
+        assert stats.parameters == {
+            "a": metrics.ParameterStats(validated=2, cast=1, default=0, failed=1),
+            "b": metrics.ParameterStats(validated=1, cast=0, default=3, failed=0),
+            "c": metrics.ParameterStats(validated=1, cast=0, default=2, failed=1),
+        }
+
+
+def test__enable_keeps_typecasters() -> None:
+    @validate(compile=True)
+    def func(a: list[int]) -> list[int]:
+        return a
+
+    func(["1"])
+    version = registry_version()
+    caster = func._fields["a"].typecaster  # type: ignore[attr-defined]
+
+    metrics.enable()
+    assert func(["1"]) == [1]
+    metrics.disable()
+    assert func(["1"]) == [1]
+
+    assert registry_version() == version
+    assert func._fields["a"].typecaster is caster  # type: ignore[attr-defined]
+    assert _stats(func).calls == 1
+
+
+def test__not_lazy() -> None:
+    @validate
+    def func(a: int, b: int = argument(validators=[GE(0)])) -> int:
+        return a + b
+
+    metrics.enable()
+    with pytest.raises(ValidationError):
+        func(1, -1)
+    with pytest.raises(MissingArgument):
+        func(b=1)
+
+    stats = _stats(func)
+    assert (stats.calls, stats.failures) == (2, 2)
+    assert stats.parameters["b"].failed == 1
+    assert stats.parameters["a"].failed == 1
+
+
+def test__disable_and_reset() -> None:
+    @validate(compile=True)
+    def func(a: int) -> int:
+        return a
+
+    metrics.enable()
+    func(1)
+    metrics.disable()
+    func(1)
+
+    assert _stats(func).calls == 1
+    assert func.compiled_source is not None  # type: ignore[attr-defined]
+    metrics.reset()
+    assert _stats(func) == metrics.FunctionStats(0, 0, 0, 0.0, 0, 0, 0, {"a": metrics.ParameterStats(0, 0, 0, 0)})
+
+
+def test__method() -> None:
+    class Service:
+        @validate
+        def handle(self, a: int) -> int:
+            return a
+
+    metrics.enable()
+    assert Service().handle("1") == 1
+
+    stats = _stats(Service.handle)
+    assert stats.calls == 1
+    assert stats.parameters == {"a": metrics.ParameterStats(validated=0, cast=1, default=0, failed=0)}
+
+
+def test__async_function() -> None:
+    @validate
+    async def func(a: int) -> int:
+        return a
+
+    metrics.enable()
+    assert asyncio.run(func("1")) == 1
+
+    assert _stats(func).calls == 1
+
+
+def _make_func(validate_b: bool) -> Any:
+    if validate_b:
+
+        @validate
+        def func(a: int, b: int = argument(validators=[GE(0)])) -> int:
+            return a + b
+
+    else:
+
+        @validate
+        def func(a: int) -> int:  # type: ignore[no-redef]
+            return a
+
+    return func
+
+
+def test__same_name() -> None:
+    first, second = _make_func(True), _make_func(False)
+    name = f"{first.__module__}.{first.__qualname__}"
+    assert name == f"{second.__module__}.{second.__qualname__}"
+
+    metrics.enable()
+    first(1, 2)
+    second("1")
+    second("1")
+
+    snapshot = metrics.snapshot()
+    assert snapshot[name].calls == 1
+    assert set(snapshot[name].parameters) == {"a", "b"}
+    assert snapshot[f"{name} #2"].calls == 2
+    assert snapshot[f"{name} #2"].parameters == {"a": metrics.ParameterStats(validated=0, cast=2, default=0, failed=0)}
+
+    del first, second
+    gc.collect()
+    assert name not in metrics.snapshot()
+
+
+def test__percentiles() -> None:
+    assert metrics._percentile([], 50) == 0
+    assert metrics._percentile([1, 2, 3, 4], 50) == 2
+    assert metrics._percentile(list(range(1, 101)), 99) == 99
+    assert metrics._percentile([5], 1) == 5
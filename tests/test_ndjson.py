@@ -0,0 +1,115 @@
+from typing import Any
+from pathlib import Path
+import json
+import pytest
+
+from fancy_signatures import validate, validate_ndjson, split_results, argument
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, UnrecognizedArgument
+from fancy_signatures.__main__ import main
+
+
+@validate
+def handler(a: int = argument(validators=[GE(0)]), b: int = argument(alias="bee", required=False)) -> int:
+    return a
+
+
+class _Service:
+    @validate
+    def handle(self, a: int) -> int:
+        return a
+
+
+service = _Service()
+
+
+def _write(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(lines))
+    return path
+
+
+@pytest.fixture
+def ndjson_file(tmp_path: Path) -> Path:
+    return _write(
+        tmp_path / "records.jsonl",
+        ['{"a": 1}', '{"a": "2", "bee": 3}', "", '{"a": -1}', "not json", "[1]", '{"c": 1}', '{"a": 4}\r'],
+    )
+
+
+def test__validate_ndjson(ndjson_file: Path) -> None:
+    results = list(validate_ndjson(handler, ndjson_file))
+
+    assert [r.position for r in results] == [0, 1, 3, 4, 5, 6, 7]
+    assert [r.ok for r in results] == [True, True, False, False, False, False, True]
+    assert results[1].value == {"a": 2, "b": 3}
+    assert isinstance(results[2].error, ValidationErrorGroup)
+    assert isinstance(results[3].error, json.JSONDecodeError)
+    assert isinstance(results[4].error, TypeError)
+    assert isinstance(results[5].error, TypeError)
+
+
+def test__validate_ndjson_not_lazy_call(ndjson_file: Path) -> None:
+    results = list(validate_ndjson(handler, str(ndjson_file), lazy=False, call=True))
+
+    assert [r.value for r in results if r.ok] == [1, 2, 4]
+    assert isinstance(results[2].error, ValidationError)
+
+
+def test__validate_ndjson_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "empty.jsonl"
+    path.write_bytes(b"")
+
+    assert list(validate_ndjson(handler, path)) == []
+
+
+def test__validate_ndjson_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(OSError):
+        validate_ndjson(handler, tmp_path / "missing.jsonl")
+
+
+def test__validate_ndjson_split(ndjson_file: Path) -> None:
+    valid, errors = split_results(validate_ndjson(handler, ndjson_file))
+
+    assert [r.position for r in valid] == [0, 1, 7]
+    assert [r.position for r in errors] == [3, 4, 5, 6]
+
+
+def test__cli(ndjson_file: Path, capsys: Any) -> None:
+    assert main(["validate-file", "tests.test_ndjson:handler", str(ndjson_file), "--max-errors", "1"]) == 1
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith(f"{ndjson_file}:4: ")
+    assert len(lines) == 2
+    assert lines[1].startswith("7 records: 3 valid, 4 invalid in ")
+    assert "records/s" in lines[1]
+
+
+def test__cli_method_bound_parameter(tmp_path: Path, capsys: Any) -> None:
+    path = _write(tmp_path / "records.jsonl", ['{"a": 1}', '{"self": 1, "a": 2}', '{"a": 3}'])
+
+    results = list(validate_ndjson(service.handle, path, call=True))
+    assert [r.value for r in results] == [1, None, 3]
+    assert isinstance(results[1].error, UnrecognizedArgument)
+
+    assert main(["validate-file", "tests.test_ndjson:service.handle", str(path)]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith(f"{path}:2: UnrecognizedArgument(")
+    assert lines[1].startswith("3 records: 2 valid, 1 invalid in ")
+
+
+def test__cli_valid_file(tmp_path: Path, capsys: Any) -> None:
+    path = _write(tmp_path / "valid.jsonl", ['{"a": 1}'])
+
+    assert main(["validate-file", "tests.test_ndjson:handler", str(path)]) == 0
+    assert capsys.readouterr().out.startswith("1 records: 1 valid, 0 invalid")
+
+
+@pytest.mark.parametrize("target", ["tests.test_ndjson", "tests.missing_module:handler", "tests.test_ndjson:missing"])
+def test__cli_invalid_target(target: str, tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        main(["validate-file", target, str(tmp_path / "file.jsonl")])
+
+
+def test__cli_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit):
+        main(["validate-file", "tests.test_ndjson:handler", str(tmp_path / "missing.jsonl")])
@@ -0,0 +1,101 @@
+from typing import Any
+import json
+import pytest
+
+from fancy_signatures import validate, argument, call_from_json
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, MissingArgument, UnrecognizedArgument
+
+
+@validate
+def _func(a: int = argument(validators=[GE(0)]), b: list[float] = argument(alias="bee", required=False)) -> Any:
+    return a, b
+
+
+@pytest.mark.parametrize(
+    "data, expectation",
+    [
+        pytest.param(b'{"a": 1, "bee": [1, 2.5]}', (1, [1.0, 2.5]), id="bytes"),
+        pytest.param(bytearray(b'{"a": "2", "b": [3]}'), (2, [3.0]), id="bytearray"),
+        pytest.param(' { "a" : 3 , "b" : [] } ', (3, []), id="str with whitespace"),
+        pytest.param('{"b": [], "a": 1, "a": 4}', (4, []), id="duplicate key"),
+        pytest.param('{"a": 1, "bee": [1]}'.encode("utf-16"), (1, [1.0]), id="utf-16"),
+    ],
+)
+def test__call_from_json(data: Any, expectation: Any) -> None:
+    assert call_from_json(_func, data) == expectation
+
+
+@pytest.mark.parametrize(
+    "data, error",
+    [
+        pytest.param("{}", MissingArgument, id="missing"),
+        pytest.param('{"a": -1}', ValidationError, id="validator"),
+        pytest.param('{"a": 1, "c": 1}', TypeError, id="unknown"),
+        pytest.param('{"a": 1', json.JSONDecodeError, id="unclosed"),
+        pytest.param('{"a": 1} 1', json.JSONDecodeError, id="extra data"),
+        pytest.param('{"a" 1}', json.JSONDecodeError, id="missing colon"),
+        pytest.param('{"a": 1 "b": []}', json.JSONDecodeError, id="missing comma"),
+        pytest.param('{"a": }', json.JSONDecodeError, id="missing value"),
+        pytest.param("{a: 1}", json.JSONDecodeError, id="unquoted key"),
+        pytest.param("[1]", json.JSONDecodeError, id="not an object"),
+    ],
+)
+def test__call_from_json_errors(data: str, error: type[Exception]) -> None:
+    with pytest.raises(error):
+        call_from_json(_func, data)
+
+
+def test__call_from_json_unknown_rejected_before_value() -> None:
+    # The value of the unknown member is invalid JSON, the member name is rejected first
+    with pytest.raises(TypeError):
+        call_from_json(_func, '{"a": 1, "c": [invalid')
+
+
+def test__call_from_json_ignore_unknown() -> None:
+    assert call_from_json(_func, '{"c": {"d": [1]}, "a": 1}', ignore_unknown=True)[0] == 1
+
+
+def test__call_from_json_max_size() -> None:
+    data = b'{"a": 1}'
+
+    assert call_from_json(_func, data, max_size=len(data))[0] == 1
+    with pytest.raises(ValueError):
+        call_from_json(_func, data, max_size=len(data) - 1)
+
+
+def test__call_from_json_lazy_method() -> None:
+    class _Class:
+        @validate(lazy=True, compile=True)
+        def method(self, a: int = argument(validators=[GE(0)]), b: int = argument(validators=[GE(0)])) -> int:
+            return a + b
+
+    assert call_from_json(_Class().method, '{"a": 1, "b": "2"}') == 3
+    with pytest.raises(ValidationErrorGroup):
+        call_from_json(_Class().method, '{"a": -1, "b": -1}')
+
+
+@pytest.mark.parametrize("ignore_unknown", [True, False])
+def test__call_from_json_bound_parameter(ignore_unknown: bool) -> None:
+    class _Class:
+        @validate
+        def method(self, x: int) -> tuple[Any, int]:
+            return self, x
+
+        @validate
+        def other_method(this, x: int) -> tuple[Any, int]:
+            return this, x
+
+    instance = _Class()
+    for method, name in ((instance.method, "self"), (instance.other_method, "this")):
+        data = f'{{"{name}": "attacker", "x": 3}}'
+        if ignore_unknown:
+            assert call_from_json(method, data, ignore_unknown=True) == (instance, 3)
+        else:
+            with pytest.raises(UnrecognizedArgument):
+                call_from_json(method, data)
+
+
+def test__call_from_json_not_decorated() -> None:
+    with pytest.raises(TypeError):
+        call_from_json(lambda a: a, '{"a": 1}')
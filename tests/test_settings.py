@@ -11,6 +11,10 @@ from fancy_signatures.typecasting.generic_alias import ListTupleSetTypeCaster
 def test__setting_default() -> None:
     assert Settings.WARN_ON_HANDLER_OVERRIDE is True
     assert Settings.PROTOCOL_HANDLING == ProtocolHandlingLevel.ALLOW
+    assert Settings.TYPECASTER_CACHE_SIZE == 1024
+    assert Settings.CAST_IN_PLACE is False
+    assert Settings.MAX_LITERAL_LENGTH == 1_000_000
+    assert Settings.PARALLEL_THRESHOLD == 0
 
 
 def test__change_setting(reset_settings: bool) -> None:
@@ -21,7 +25,7 @@ def test__change_setting(reset_settings: bool) -> None:
 
 def test_default_handlers() -> None:
     handlers_dict = get_typecast_handlers()
-    assert len(handlers_dict["strict_handlers"]) == 8
+    assert len(handlers_dict["strict_handlers"]) == 9
     assert len(handlers_dict["handlers"]) == 5
 
 
@@ -42,6 +46,10 @@ def test__warning_raised_when_handler_override(reset_settings: bool) -> None:
     [
         ("WARN_ON_HANDLER_OVERRIDE", "true"),
         ("PROTOCOL_HANDLING", "ALLOW"),
+        ("TYPECASTER_CACHE_SIZE", "10"),
+        ("CAST_IN_PLACE", 1),
+        ("MAX_LITERAL_LENGTH", "10"),
+        ("PARALLEL_THRESHOLD", 1.5),
     ],
 )
 def test__settings_invalid_type(setting_name: str, value: Any) -> None:
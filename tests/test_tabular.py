@@ -0,0 +1,103 @@
+from typing import Any
+import io
+import pytest
+
+from fancy_signatures import validate, validate_csv, argument
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.validation.related import exactly_one
+from fancy_signatures.exceptions import ValidationError, ValidationErrorGroup, MissingArgument, UnrecognizedArgument
+
+
+@validate
+def _func(
+    a: int = argument(validators=[GE(0)]),
+    b: float = argument(alias="bee", required=False),
+    c: bool = False,
+    d: str = "",
+) -> Any:
+    return a
+
+
+def _csv(*lines: str) -> io.StringIO:
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+def test__validate_csv() -> None:
+    results = list(validate_csv(_func, _csv("a,bee,c,d", "1,1.5,true,x", "2,3,0,y", "-1,1,1,z", "x,1,1,z", "3,1,yes,")))
+
+    assert [r.position for r in results] == [0, 1, 2, 3, 4]
+    assert results[0].value == {"a": 1, "b": 1.5, "c": True, "d": "x"}
+    assert results[1].value == {"a": 2, "b": 3.0, "c": False, "d": "y"}
+    assert type(results[1].value["b"]) is float
+    assert isinstance(results[2].error, ValidationErrorGroup)
+    assert isinstance(results[3].error, ValidationErrorGroup)
+    assert isinstance(results[4].error, ValidationErrorGroup)
+    assert "Couldn't cast" in str(results[4].error.exceptions[0])
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1024])
+def test__validate_csv_batches(batch_size: int) -> None:
+    lines = ["a"] + [str(i) if i % 3 else "-1" for i in range(10)]
+    results = list(validate_csv(_func, _csv(*lines), batch_size=batch_size, lazy=False, call=True))
+
+    assert [r.position for r in results] == list(range(10))
+    assert [r.value for r in results if r.ok] == [1, 2, 4, 5, 7, 8]
+    assert all(isinstance(r.error, ValidationError) for r in results if not r.ok)
+
+
+def test__validate_csv_wrong_number_of_values() -> None:
+    results = list(validate_csv(_func, _csv("a,d", "1,x", "2", "3,x,y", "4,x"), batch_size=3))
+
+    assert [r.position for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert isinstance(results[1].error, ValueError)
+
+
+def test__validate_csv_missing_column() -> None:
+    results = list(validate_csv(_func, _csv("d", "x")))
+
+    assert isinstance(results[0].error, MissingArgument)
+
+
+def test__validate_csv_related_and_format() -> None:
+    @validate(related=[exactly_one("a", "b")])
+    def func(a: int = argument(required=False), b: int = argument(required=False)) -> Any:
+        return a
+
+    results = list(validate_csv(func, _csv("a;b", "1;2"), delimiter=";"))
+
+    assert isinstance(results[0].error, ValidationErrorGroup)
+
+
+def test__validate_csv_strict() -> None:
+    @validate(type_strict=True)
+    def func(a: int) -> int:
+        return a
+
+    results = list(validate_csv(func, _csv("a", "1")))
+
+    assert isinstance(results[0].error, ValidationError)
+
+
+def test__validate_csv_empty() -> None:
+    assert list(validate_csv(_func, io.StringIO(""))) == []
+
+
+def test__validate_csv_invalid_batch_size() -> None:
+    with pytest.raises(ValueError):
+        validate_csv(_func, _csv("a", "1"), batch_size=0)
+
+
+def test__validate_csv_unknown_column() -> None:
+    with pytest.raises(TypeError):
+        list(validate_csv(_func, _csv("a,e", "1,2")))
+
+
+def test__validate_csv_bound_parameter_column() -> None:
+    class MyClass:
+        @validate
+        def method(self, a: int) -> int:
+            return a
+
+    with pytest.raises(UnrecognizedArgument):
+        list(validate_csv(MyClass().method, _csv("self,a", "1,2")))
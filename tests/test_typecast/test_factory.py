@@ -1,11 +1,29 @@
 from dataclasses import dataclass
+import sys
+import threading
 import typing
 from contextlib import nullcontext as does_not_raise
 
 from pydantic import BaseModel
 
 import pytest
-from fancy_signatures.typecasting.factory import typecaster_factory
+from fancy_signatures.typecasting.factory import (
+    typecaster_factory,
+    typecaster_cache_info,
+    clear_typecaster_cache,
+    _CACHE,
+)
+from fancy_signatures.typecasting.handlers import (
+    handler_registry,
+    registry_version,
+    register_typecaster,
+    unregister_strict_typecaster,
+)
+from fancy_signatures.typecasting.default import DefaultTypeCaster
+from fancy_signatures.typecasting.generic_alias import ListTupleSetTypeCaster
+from fancy_signatures import validate
+from fancy_signatures.typecasting.default import IntOrFloatTypeCaster
+from fancy_signatures.settings import set as set_setting
 from fancy_signatures.exceptions import TypeValidationError
 
 
@@ -255,3 +273,179 @@ def test__protocol_validate_correct_result(input_value: typing.Any, expected: bo
     caster = typecaster_factory(list[MyInterace])
 
     assert caster.validate(input_value) == expected
+
+
+def test__cache_returns_same_instance() -> None:
+    clear_typecaster_cache()
+
+    first = typecaster_factory(dict[str, list[int]])
+    before = typecaster_cache_info()
+    second = typecaster_factory(dict[str, list[int]])
+    after = typecaster_cache_info()
+
+    assert first is second
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+    assert after.currsize == before.currsize == 4  # dict, str, list and int
+
+
+def test__cache_respects_union_order() -> None:
+    int_first = typecaster_factory(list[int | str])
+    str_first = typecaster_factory(list[str | int])
+
+    assert int_first is not str_first
+    assert int_first.cast([1.5]) == [1]
+    assert str_first.cast([1.5]) == ["1.5"]
+
+
+def test__cache_unhashable_type_hint() -> None:
+    clear_typecaster_cache()
+
+    caster = typecaster_factory(typing.Annotated[int, ["unhashable"]])
+
+    assert typecaster_cache_info().misses == 2
+    assert typecaster_cache_info().currsize == 1  # Only the int caster is cached
+    assert caster.validate(1)
+
+
+def test__cache_invalidated_on_register(custom_int_handler: bool) -> None:
+    assert custom_int_handler is True
+    custom_caster = typecaster_factory(int)
+    version = registry_version()
+
+    unregister_strict_typecaster(int)
+    register_typecaster(type_hints=[int], handler=IntOrFloatTypeCaster, strict=True)
+
+    assert registry_version() > version
+    assert typecaster_factory(int) is not custom_caster
+    assert isinstance(typecaster_factory(int), IntOrFloatTypeCaster)
+
+
+def test__cache_bounded(reset_settings: bool) -> None:
+    assert reset_settings is True
+    set_setting("TYPECASTER_CACHE_SIZE", 2)
+
+    typecaster_factory(list[int])
+    typecaster_factory(list[str])
+    typecaster_factory(list[float])
+
+    assert typecaster_cache_info().currsize == 2
+
+
+def test__caster_tree_resolved_once() -> None:
+    caster = typecaster_factory(dict[str, list[dict[str, float]]])
+    before = typecaster_cache_info()
+
+    result = caster({"a": [{"x": "1.5"}, {"y": 2}]}, False)
+
+    assert result == {"a": [{"x": 1.5}, {"y": 2.0}]}
+    assert typecaster_cache_info() == before
+
+
+def test__registry_snapshot_immutable() -> None:
+    snapshot = handler_registry()
+
+    register_typecaster(type_hints=[_CustomType], handler=IntOrFloatTypeCaster, strict=True)
+    try:
+        assert _CustomType not in snapshot.strict_handlers
+        assert handler_registry().strict_handlers[_CustomType] is IntOrFloatTypeCaster
+        assert handler_registry().version > snapshot.version
+        with pytest.raises(TypeError):
+            snapshot.strict_handlers[_CustomType] = IntOrFloatTypeCaster  # type: ignore[index]
+    finally:
+        unregister_strict_typecaster(_CustomType)
+    assert _CustomType not in handler_registry().strict_handlers
+
+
+def test__cache_not_replaced_by_outdated_version() -> None:
+    version = registry_version()
+    entries = _CACHE.entries_for(version)
+
+    outdated = _CACHE.entries_for(version - 1)
+
+    assert outdated is not entries
+    assert _CACHE.entries_for(version) is entries
+    assert _CACHE.version == version
+
+
+class _Nested:
+    pass
+
+
+_T = typing.TypeVar("_T")
+
+
+class _Box(typing.Generic[_T]):
+    pass
+
+
+class _OuterCaster(ListTupleSetTypeCaster):
+    def __init__(self, type_hint: typing.Any) -> None:
+        # A handler registered while the caster is created doesn't affect its children
+        register_typecaster(type_hints=[_Nested], handler=IntOrFloatTypeCaster, strict=True)
+        super().__init__(type_hint)
+
+
+def test__children_created_with_same_registry() -> None:
+    register_typecaster(type_hints=[_Box], handler=_OuterCaster, strict=True)
+    try:
+        caster = typecaster_factory(_Box[_Nested])
+        assert type(caster._arg_caster) is DefaultTypeCaster
+        assert type(typecaster_factory(_Nested)) is IntOrFloatTypeCaster
+    finally:
+        unregister_strict_typecaster(_Box)
+        unregister_strict_typecaster(_Nested)
+
+
+class _StressCaster(DefaultTypeCaster):
+    pass
+
+
+def test__registry_concurrent_registration(reset_settings: bool) -> None:
+    # Both registering threads may register the handler while the other one's is still registered
+    set_setting("WARN_ON_HANDLER_OVERRIDE", False)
+
+    @validate
+    def func(a: list[_CustomType], b: int) -> int:
+        return b
+
+    errors: list[BaseException] = []
+    stop = threading.Event()
+
+    def register() -> None:
+        try:
+            for _ in range(200):
+                register_typecaster(type_hints=[_CustomType], handler=_StressCaster, strict=True)
+                unregister_strict_typecaster(_CustomType)
+        except BaseException as e:  # pragma: no cover
+            errors.append(e)
+        finally:
+            stop.set()
+
+    def read() -> None:
+        try:
+            while not stop.is_set():
+                caster = typecaster_factory(list[_CustomType])
+                assert isinstance(caster, ListTupleSetTypeCaster)
+                assert type(caster._arg_caster) in (DefaultTypeCaster, _StressCaster)
+                assert typecaster_factory(int).validate(1)
+                assert func([_CustomType(1, "a")], "2") == 2
+                assert len(handler_registry().handlers) == 5
+        except BaseException as e:  # pragma: no cover
+            errors.append(e)
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=register) for _ in range(2)]
+        threads += [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert _CustomType not in handler_registry().strict_handlers
+    assert type(typecaster_factory(list[_CustomType])._arg_caster) is DefaultTypeCaster
@@ -1,7 +1,10 @@
 import pytest
 import typing
+from fancy_signatures.settings import set as adjust_setting
+from fancy_signatures.typecasting import typecaster_factory
+from fancy_signatures.typecasting.default import IntOrFloatTypeCaster
 from fancy_signatures.typecasting.generic_alias import ListTupleSetTypeCaster, DictTypeCaster
-from fancy_signatures.exceptions import TypeCastError
+from fancy_signatures.exceptions import TypeCastError, TypeValidationError
 
 
 @pytest.mark.parametrize("origin", [list, typing.List])
@@ -172,3 +175,150 @@ def test__tuple_ellipsis() -> None:
 
     assert c.validate((1, 2, 3)) is True
     assert c.cast((1, "2", 3)) == (1, 2, 3)
+
+
+@pytest.mark.parametrize(
+    "type_hint, value, expectation",
+    [
+        pytest.param(list[int], [1, "2", 3], [1, 2, 3], id="list"),
+        pytest.param(tuple[int, ...], (1, "2"), (1, 2), id="tuple"),
+        pytest.param(set[int], {"1", 2}, {1, 2}, id="set"),
+        pytest.param(list[list[int]], [[1], ["2"]], [[1], [2]], id="nested"),
+        pytest.param(dict[str, int], {"a": 1, "b": "2"}, {"a": 1, "b": 2}, id="dict"),
+        pytest.param(dict[int, list[int]], {"1": [1], 2: ["2"]}, {1: [1], 2: [2]}, id="nested dict"),
+        pytest.param(list[int], "[1, 2]", [1, 2], id="cast container"),
+    ],
+)
+def test__coerce(type_hint: typing.Any, value: typing.Any, expectation: typing.Any) -> None:
+    caster = typecaster_factory(type_hint)
+
+    result = caster.coerce(value, False)
+
+    assert result == expectation
+    assert type(result) is type(expectation)
+    assert result is not value
+
+
+@pytest.mark.parametrize(
+    "type_hint, value",
+    [
+        pytest.param(list[int], [1, 2], id="list"),
+        pytest.param(tuple[int, ...], (1, 2), id="tuple"),
+        pytest.param(list[list[int]], [[1], [2]], id="nested"),
+        pytest.param(dict[str, list[int]], {"a": [1]}, id="dict"),
+    ],
+)
+def test__coerce_valid_returns_same_object(type_hint: typing.Any, value: typing.Any) -> None:
+    assert typecaster_factory(type_hint).coerce(value, False) is value
+
+
+def test__coerce_keeps_valid_elements() -> None:
+    valid = [1]
+    value = [valid, ["2"]]
+
+    result = typecaster_factory(list[list[int]]).coerce(value, False)
+
+    assert result[0] is valid
+    assert value == [[1], ["2"]]
+
+
+def test__coerce_single_pass() -> None:
+    calls: list[typing.Any] = []
+
+    class CountingCaster(IntOrFloatTypeCaster):
+        def validate(self, param_value: typing.Any) -> bool:
+            calls.append(param_value)
+            return super().validate(param_value)
+
+    caster = ListTupleSetTypeCaster(list[int])
+    caster._arg_caster = CountingCaster(int)
+
+    assert caster.coerce([1, 2, "3", 4], False) == [1, 2, 3, 4]
+    # Valid elements are validated once
+    assert [calls.count(value) for value in (1, 2, 4)] == [1, 1, 1]
+
+
+@pytest.mark.parametrize(
+    "type_hint, value",
+    [
+        pytest.param(list[int], [1, "2"], id="element"),
+        pytest.param(list[int], (1, 2), id="container"),
+        pytest.param(dict[str, int], {"a": "1"}, id="dict"),
+    ],
+)
+def test__coerce_strict(type_hint: typing.Any, value: typing.Any) -> None:
+    with pytest.raises(TypeValidationError, match=r"Invalid type, should be"):
+        typecaster_factory(type_hint).coerce(value, True)
+
+
+def test__coerce_list_subclass() -> None:
+    class MyList(list):
+        def __iter__(self) -> typing.Iterator[typing.Any]:
+            yield from super().__iter__()
+
+    assert typecaster_factory(list[int]).coerce(MyList([1, "2", 3]), False) == [1, 2, 3]
+
+
+def test__coerce_copies_list_by_default() -> None:
+    value = [1, "2"]
+
+    result = typecaster_factory(list[int]).coerce(value, False)
+
+    assert result == [1, 2]
+    assert value == [1, "2"]
+
+
+def test__coerce_list_in_place(reset_settings: bool) -> None:
+    adjust_setting("CAST_IN_PLACE", True)
+    value = [1, "2", 3]
+
+    result = typecaster_factory(list[int]).coerce(value, False)
+
+    assert result is value
+    assert value == [1, 2, 3]
+
+
+def test__coerce_tuple_not_in_place(reset_settings: bool) -> None:
+    adjust_setting("CAST_IN_PLACE", True)
+    value = (1, "2")
+
+    assert typecaster_factory(tuple[int, ...]).coerce(value, False) == (1, 2)
+    assert value == (1, "2")
+
+
+def test__coerce_dict_in_place(reset_settings: bool) -> None:
+    adjust_setting("CAST_IN_PLACE", True)
+    value = {"a": 1, "b": "2"}
+
+    result = typecaster_factory(dict[str, int]).coerce(value, False)
+
+    assert result is value
+    assert value == {"a": 1, "b": 2}
+
+
+def test__coerce_dict_in_place_key_changed(reset_settings: bool) -> None:
+    adjust_setting("CAST_IN_PLACE", True)
+    value = {1: "1", "2": 2}
+
+    result = typecaster_factory(dict[int, int]).coerce(value, False)
+
+    assert result is not value
+    assert result == {1: 1, 2: 2}
+    assert value == {1: "1", "2": 2}
+
+
+@pytest.mark.parametrize(
+    "type_hint, value",
+    [
+        pytest.param(list[int], [1, "2", "x"], id="list"),
+        pytest.param(dict[str, int], {"a": "1", "b": "x"}, id="dict"),
+    ],
+)
+def test__coerce_in_place_invalid_unchanged(reset_settings: bool, type_hint: typing.Any, value: typing.Any) -> None:
+    adjust_setting("CAST_IN_PLACE", True)
+    original = value.copy()
+
+    with pytest.raises(TypeCastError):
+        typecaster_factory(type_hint).coerce(value, False)
+
+    assert value == original
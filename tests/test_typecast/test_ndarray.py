@@ -0,0 +1,94 @@
+from typing import Any, Annotated, Generator
+from array import array
+import pytest
+
+from fancy_signatures import validate
+from fancy_signatures.exceptions import TypeCastError, ValidationError
+from fancy_signatures.typecasting import typecaster_factory, unregister_typecaster
+from fancy_signatures.typecasting.ndarray import NDArrayTypeCaster, DType, Shape, register_ndarray_typecaster
+
+np = pytest.importorskip("numpy")
+npt = pytest.importorskip("numpy.typing")
+
+
+@pytest.fixture(scope="function")
+def ndarray_handler() -> Generator[bool, None, None]:
+    register_ndarray_typecaster()
+    yield True
+    unregister_typecaster(np.ndarray)
+
+
+@pytest.mark.parametrize(
+    "type_hint, value, expectation",
+    [
+        pytest.param(np.ndarray, np.zeros(2), True, id="plain"),
+        pytest.param(np.ndarray, [1, 2], False, id="list"),
+        pytest.param(npt.NDArray[np.float64], np.zeros(2), True, id="NDArray dtype"),
+        pytest.param(npt.NDArray[np.int64], np.zeros(2), False, id="NDArray wrong dtype"),
+        pytest.param(npt.NDArray[Any], np.zeros(2, dtype=np.int8), True, id="NDArray any dtype"),
+        pytest.param(Annotated[np.ndarray, DType(np.int8)], np.zeros(2, dtype=np.int8), True, id="DType"),
+        pytest.param(Annotated[np.ndarray, Shape(-1, 3)], np.zeros((5, 3)), True, id="Shape"),
+        pytest.param(Annotated[np.ndarray, Shape(-1, 3)], np.zeros((5, 2)), False, id="wrong Shape"),
+        pytest.param(Annotated[np.ndarray, Shape(-1, 3)], np.zeros(3), False, id="wrong number of dims"),
+        pytest.param(Annotated[npt.NDArray[np.int64], DType(np.float64)], np.zeros(2), True, id="DType overrides"),
+    ],
+)
+def test__ndarray_validate(ndarray_handler: bool, type_hint: Any, value: Any, expectation: bool) -> None:
+    assert typecaster_factory(type_hint).validate(value) is expectation
+
+
+@pytest.mark.parametrize(
+    "type_hint, value, dtype, shape",
+    [
+        pytest.param(np.ndarray, [1, 2], np.int64, (2,), id="list"),
+        pytest.param(npt.NDArray[np.float32], [1, 2], np.float32, (2,), id="NDArray"),
+        pytest.param(Annotated[np.ndarray, DType(np.float64), Shape(-1, 2)], [[1, 2]], np.float64, (1, 2), id="2d"),
+        pytest.param(Annotated[np.ndarray, DType(np.uint8)], b"ab", np.uint8, (2,), id="bytes"),
+        pytest.param(np.ndarray, memoryview(array("d", [1, 2])), np.float64, (2,), id="buffer"),
+        pytest.param(npt.NDArray[np.float64], np.zeros(2, dtype=np.int8), np.float64, (2,), id="array"),
+    ],
+)
+def test__ndarray_cast(ndarray_handler: bool, type_hint: Any, value: Any, dtype: Any, shape: tuple) -> None:
+    result = typecaster_factory(type_hint).cast(value)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == dtype
+    assert result.shape == shape
+
+
+@pytest.mark.parametrize(
+    "type_hint, value",
+    [
+        pytest.param(npt.NDArray[np.int64], ["a"], id="invalid value"),
+        pytest.param(np.ndarray, [[1], [1, 2]], id="ragged"),
+        pytest.param(npt.NDArray[np.float64], b"abc", id="buffer size"),
+        pytest.param(Annotated[np.ndarray, Shape(-1, 3)], [[1, 2]], id="shape"),
+    ],
+)
+def test__ndarray_cast_fails(ndarray_handler: bool, type_hint: Any, value: Any) -> None:
+    with pytest.raises(TypeCastError):
+        typecaster_factory(type_hint).cast(value)
+
+
+def test__ndarray_with_metadata_returns_new_caster(ndarray_handler: bool) -> None:
+    caster = typecaster_factory(np.ndarray)
+    annotated = typecaster_factory(Annotated[np.ndarray, Shape(2)])
+
+    assert isinstance(caster, NDArrayTypeCaster)
+    assert caster.validate(np.zeros(3))
+    assert not annotated.validate(np.zeros(3))
+
+
+def test__ndarray_decorated(ndarray_handler: bool) -> None:
+    @validate
+    def func(a: Annotated[np.ndarray, DType(np.float64), Shape(-1, 3)]) -> Any:
+        return a
+
+    assert func([[1, 2, 3]]).dtype == np.float64
+
+    with pytest.raises(ValidationError):
+        func([[1, 2]])
+
+
+def test__ndarray_not_registered_by_default() -> None:
+    assert not isinstance(typecaster_factory(np.ndarray), NDArrayTypeCaster)
@@ -0,0 +1,164 @@
+import os
+import threading
+import pytest
+import typing
+
+from fancy_signatures import validate, argument
+from fancy_signatures.core.interface import Validator
+from fancy_signatures.settings import set as adjust_setting
+from fancy_signatures.typecasting import typecaster_factory, Parallel, parallel
+from fancy_signatures.validation.validators import GE
+from fancy_signatures.exceptions import (
+    TypeCastError,
+    TypeValidationError,
+    ValidationErrorGroup,
+    ElementValidationFailed,
+)
+
+
+@pytest.fixture(autouse=True)
+def four_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Split containers in multiple chunks, regardless of the number of CPUs
+    monkeypatch.setattr(parallel, "_NUM_WORKERS", 4)
+
+
+def _parallel(type_hint: typing.Any) -> typing.Any:
+    return typecaster_factory(typing.Annotated[type_hint, Parallel(threshold=2)])
+
+
+@pytest.mark.parametrize(
+    "type_hint, value",
+    [
+        pytest.param(list[int], [1, "2", 3] * 100, id="list"),
+        pytest.param(tuple[int, ...], (1, "2") * 100, id="tuple"),
+        pytest.param(set[int], {"1", 2, *range(3, 200)}, id="set"),
+        pytest.param(list[list[int]], [[1], ["2"]] * 100, id="nested"),
+        pytest.param(dict[str, int], {str(i): i if i % 2 else str(i) for i in range(200)}, id="dict"),
+        pytest.param(dict[int, list[int]], {"1": [1], 2: ["2"], **{i: [i] for i in range(3, 200)}}, id="nested dict"),
+        pytest.param(list[int], "[1, 2, 3]", id="cast container"),
+    ],
+)
+def test__parallel_coerce(type_hint: typing.Any, value: typing.Any) -> None:
+    expectation = typecaster_factory(type_hint).coerce(value, False)
+
+    result = _parallel(type_hint).coerce(value, False)
+
+    assert result == expectation
+    assert type(result) is type(expectation)
+    assert list(result) == list(expectation)
+
+
+@pytest.mark.parametrize(
+    "type_hint, value",
+    [
+        pytest.param(list[int], list(range(100)), id="list"),
+        pytest.param(tuple[int, ...], tuple(range(100)), id="tuple"),
+        pytest.param(dict[str, list[int]], {str(i): [i] for i in range(100)}, id="dict"),
+    ],
+)
+def test__parallel_coerce_valid_returns_same_object(type_hint: typing.Any, value: typing.Any) -> None:
+    assert _parallel(type_hint).coerce(value, False) is value
+
+
+def test__parallel_coerce_below_threshold() -> None:
+    caster = typecaster_factory(typing.Annotated[list[int], Parallel(threshold=1000)])
+    assert caster.coerce([1, "2"], False) == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "type_hint, value",
+    [
+        pytest.param(list[int], [1, 2, "3", 4], id="list"),
+        pytest.param(dict[str, int], {"a": 1, "b": 2, "c": "3"}, id="dict"),
+    ],
+)
+def test__parallel_coerce_in_place(reset_settings: bool, type_hint: typing.Any, value: typing.Any) -> None:
+    adjust_setting("CAST_IN_PLACE", True)
+
+    result = _parallel(type_hint).coerce(value, False)
+
+    assert result is value
+    assert all(type(element) is int for element in (value.values() if isinstance(value, dict) else value))
+
+
+def test__parallel_coerce_first_error() -> None:
+    value = [1, 2, "a", 4, 5, "b", 7, 8, "c"] * 10
+
+    with pytest.raises(TypeCastError) as serial_error:
+        typecaster_factory(list[int]).coerce(value, False)
+    with pytest.raises(TypeCastError) as parallel_error:
+        _parallel(list[int]).coerce(value, False)
+
+    assert str(parallel_error.value) == str(serial_error.value)
+
+
+def test__parallel_coerce_strict() -> None:
+    with pytest.raises(TypeValidationError, match=r"Invalid type, should be"):
+        _parallel(list[int]).coerce([1, 2, "3"], True)
+
+
+@pytest.mark.parametrize(
+    "type_hint, value, kwargs",
+    [
+        pytest.param(list[int], [1, -1, 2, -2, 3, -3] * 20, {"each": [GE(0)]}, id="list"),
+        pytest.param(
+            dict[int, int],
+            {i: -i if i % 3 else i for i in range(-50, 50)},
+            {"keys": [GE(0)], "values": [GE(0)]},
+            id="dict",
+        ),
+    ],
+)
+def test__parallel_element_validators(type_hint: typing.Any, value: typing.Any, kwargs: dict) -> None:
+    serial_caster = typecaster_factory(type_hint).with_element_validators(
+        **{"each": [], "keys": [], "values": [], **kwargs}
+    )
+    parallel_caster = _parallel(type_hint).with_element_validators(**{"each": [], "keys": [], "values": [], **kwargs})
+
+    with pytest.raises(ElementValidationFailed) as serial_errors:
+        serial_caster.coerce(value, False)
+    with pytest.raises(ElementValidationFailed) as parallel_errors:
+        parallel_caster.coerce(value, False)
+
+    assert [str(e) for e in parallel_errors.value.errors] == [str(e) for e in serial_errors.value.errors]
+
+
+def test__parallel_argument() -> None:
+    @validate(lazy=True)
+    def func(a: typing.Annotated[list[int], Parallel(threshold=10)] = argument(each=[GE(0)])) -> list[int]:
+        return a
+
+    assert func(["1"] * 100) == [1] * 100
+    with pytest.raises(ValidationErrorGroup):
+        func([1] * 50 + [-1] + [1] * 50)
+
+
+def test__parallel_setting(reset_settings: bool) -> None:
+    adjust_setting("PARALLEL_THRESHOLD", 2)
+    # Containers nested in a container processed in parallel are processed serially
+    assert typecaster_factory(list[list[int]]).coerce([["1", 2]] * 20, False) == [[1, 2]] * 20
+    assert typecaster_factory(typing.Annotated[list[int], Parallel(threshold=1000)])._caster._parallel_threshold == 1000
+
+
+@pytest.mark.skipif((os.cpu_count() or 1) < 2, reason="Requires multiple CPUs")
+def test__parallel_uses_threads() -> None:
+    threads: set[str] = set()
+    barrier = threading.Barrier(2, timeout=5)
+
+    class RecordThread(Validator[int]):
+        def validate(self, obj: int) -> int:
+            threads.add(threading.current_thread().name)
+            if obj == 0:
+                # The first element of the first two chunks, both chunks have to run at the same time
+                barrier.wait()
+            return obj
+
+    size = 2 * (os.cpu_count() or 1)
+    caster = _parallel(list[int]).with_element_validators([RecordThread()], [], [])
+    caster.coerce([0 if i in (0, 2) else 1 for i in range(size)], False)
+    assert len(threads) >= 2
+
+
+def test__parallel_invalid_threshold() -> None:
+    with pytest.raises(ValueError):
+        Parallel(threshold=0)
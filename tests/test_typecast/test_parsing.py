@@ -0,0 +1,57 @@
+import pytest
+from typing import Any
+
+from fancy_signatures.settings import set
+from fancy_signatures.typecasting.parsing import parse_literal
+
+
+@pytest.mark.parametrize(
+    "text, expectation",
+    [
+        pytest.param("[1, 2, 3]", [1, 2, 3], id="JSON array"),
+        pytest.param('{"a": [1.5, null, true]}', {"a": [1.5, None, True]}, id="JSON object"),
+        pytest.param("{1: 2, 3: 4}", {1: 2, 3: 4}, id="Python dict"),
+        pytest.param("['a', (1,)]", ["a", (1,)], id="Python list"),
+        pytest.param("(1.3, 2)", (1.3, 2), id="tuple"),
+        pytest.param("1, 2.5, None", (1, 2.5, None), id="comma separated"),
+        pytest.param("1,2,", (1, 2), id="trailing comma"),
+        pytest.param("'a', 'b'", ("a", "b"), id="comma separated strings"),
+        pytest.param("None", None),
+        pytest.param(" null ", None),
+        pytest.param("False", False),
+        pytest.param("-12", -12),
+        pytest.param("1e3", 1000.0),
+        pytest.param("'text'", "text"),
+    ],
+)
+def test__parse_literal(text: str, expectation: Any) -> None:
+    result = parse_literal(text)
+
+    assert result == expectation
+    assert type(result) is type(expectation)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param("", id="empty"),
+        pytest.param("abc", id="name"),
+        pytest.param("__import__('os').getcwd()", id="code"),
+        pytest.param("[1, 2", id="unclosed"),
+        pytest.param("1, a", id="comma separated name"),
+        pytest.param("inf", id="float special value"),
+        pytest.param("[" * 10_000 + "]" * 10_000, id="deeply nested"),
+    ],
+)
+def test__parse_literal_invalid(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_literal(text)
+
+
+def test__parse_literal_max_length(reset_settings: bool) -> None:
+    assert reset_settings is True
+    set("MAX_LITERAL_LENGTH", 5)
+
+    assert parse_literal("[1,2]") == [1, 2]
+    with pytest.raises(ValueError):
+        parse_literal("[1,2,3]")
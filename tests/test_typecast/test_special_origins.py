@@ -7,6 +7,7 @@ from fancy_signatures.typecasting.special_origins import (
     AnnotatedTypeCaster,
     StringTypeCaster,
     BooleanTypeCaster,
+    NoneTypeCaster,
     ProtocolTypecaster,
 )
 
@@ -205,3 +206,14 @@ def test__protocol_raises_error(disallow_protocols: bool) -> None:
 
     with pytest.raises(RuntimeError):
         ProtocolTypecaster(MyInterface)
+
+
+@pytest.mark.parametrize("value", [None, "None", "null", " None "])
+def test__none_cast(value: Any) -> None:
+    assert NoneTypeCaster(type(None)).cast(value) is None
+
+
+@pytest.mark.parametrize("value", ["0", "abc", "[]", 0, "__import__('os')"])
+def test__none_cast_fail(value: Any) -> None:
+    with pytest.raises(TypeCastError):
+        NoneTypeCaster(type(None)).cast(value)
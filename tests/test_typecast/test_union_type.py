@@ -1,8 +1,11 @@
 import pytest
-from typing import Any, Union, List, Tuple
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Annotated, Any, Literal, Union, List, Tuple
 
-from fancy_signatures.exceptions import TypeCastError
-from fancy_signatures.typecasting.union import UnionTypeCaster
+from fancy_signatures.exceptions import TypeCastError, TypeValidationError
+from fancy_signatures.typecasting import typecaster_factory
+from fancy_signatures.typecasting.union import UnionTypeCaster, Discriminator
 
 
 @pytest.mark.parametrize("origin", [int | float, Union[int, float]])
@@ -110,3 +113,139 @@ def test__union_cast_fail(origin: type, value: Any) -> None:
 
     with pytest.raises(TypeCastError):
         c.cast(value)
+
+
+@pytest.mark.parametrize(
+    "value, expectation",
+    [
+        pytest.param(None, True),
+        pytest.param(1, True),
+        pytest.param("a", True),
+        pytest.param(True, True, id="subclass of a member"),
+        pytest.param(1.5, False),
+        pytest.param([1], False),
+    ],
+)
+def test__union_validate_dispatch(value: Any, expectation: bool) -> None:
+    c = UnionTypeCaster(int | str | None)
+
+    # The second time the type is looked up in the dispatch table
+    assert c.validate(value) is expectation
+    assert c.validate(value) is expectation
+
+
+def test__union_dispatch_learns_types() -> None:
+    c = UnionTypeCaster(int | list[int])
+
+    assert bool not in c._dispatch
+    assert list not in c._dispatch
+    assert c.validate(True)
+    assert c.validate([1])
+    assert c._dispatch[bool] is c._casters[0]
+    assert c._dispatch[list] is c._casters[1]
+    assert not c.validate(1.5)
+    assert float not in c._dispatch
+
+
+def test__union_dispatch_falls_back_for_rejected_value() -> None:
+    c = UnionTypeCaster(list[int] | list[str])
+
+    assert c.validate([1])
+    assert c._dispatch[list] is c._casters[0]
+    assert c.validate(["a"])
+    assert not c.validate([1.5])
+
+
+@dataclass
+class _Cat:
+    type: Literal["cat"]
+    lives: int = 9
+
+
+@dataclass
+class _Dog:
+    type: Literal["dog", "puppy"]
+    good: bool = True
+
+
+class _Fish:
+    type = "fish"
+
+    def __init__(self, type: str, fins: int = 2) -> None:
+        self.fins = fins
+
+
+@dataclass
+class _Kitten:
+    type: Literal["kitten", "cat"]
+
+
+_PETS = Annotated[_Cat | _Dog | _Fish | None, Discriminator("type")]
+
+
+@pytest.mark.parametrize(
+    "value, expectation",
+    [
+        pytest.param(_Cat("cat"), True),
+        pytest.param(_Dog("puppy"), True),
+        pytest.param(None, True),
+        pytest.param({"type": "cat"}, False),
+        pytest.param(SimpleNamespace(type="dog"), False, id="tag of another member"),
+        pytest.param(1, False),
+    ],
+)
+def test__discriminated_union_validate(value: Any, expectation: bool) -> None:
+    c = typecaster_factory(_PETS)
+
+    assert c.validate(value) is expectation
+
+
+@pytest.mark.parametrize(
+    "value, expected_type",
+    [
+        pytest.param({"type": "cat", "lives": "3"}, _Cat),
+        pytest.param({"type": "dog"}, _Dog),
+        pytest.param({"type": "puppy"}, _Dog),
+        pytest.param({"type": "fish"}, _Fish),
+    ],
+)
+def test__discriminated_union_cast(value: Any, expected_type: type) -> None:
+    c = typecaster_factory(_PETS)
+
+    assert type(c(value, False)) is expected_type
+
+
+@pytest.mark.parametrize("value", [{"type": "cow"}, {"lives": 1}, {"type": ["cat"]}, "cat"])
+def test__discriminated_union_no_member(value: Any) -> None:
+    c = typecaster_factory(_PETS)
+
+    with pytest.raises(TypeCastError):
+        c(value, False)
+    with pytest.raises(TypeValidationError):
+        c(value, True)
+
+
+def test__discriminated_union_routes_to_one_member() -> None:
+    c = typecaster_factory(_PETS)
+    # A dog payload that would also be accepted by `_Fish(**value)`, the tag decides
+    value = {"type": "dog"}
+
+    assert isinstance(c(value, False), _Dog)
+
+
+def test__discriminated_union_without_discriminator() -> None:
+    c = typecaster_factory(Annotated[int | str, "not a discriminator"])
+
+    assert c(1, True) == 1
+
+
+@pytest.mark.parametrize(
+    "hint",
+    [
+        pytest.param(Annotated[_Cat | int, Discriminator("type")], id="no tag"),
+        pytest.param(Annotated[_Cat | _Kitten, Discriminator("type")], id="duplicate tag"),
+    ],
+)
+def test__discriminated_union_invalid(hint: Any) -> None:
+    with pytest.raises(TypeError):
+        typecaster_factory(hint)
@@ -238,3 +238,44 @@ def test__optional_validators(value: Any, expectation: ContextManager) -> None:
 
     with expectation:
         v("test", value)
+
+
+@pytest.mark.parametrize(
+    "validator, valid, invalid, indices",
+    [
+        pytest.param(GE(0), [0, 1, 2], [0, -1, 2, -3], "[1, 3]", id="GE"),
+        pytest.param(GT(0), [1, 2], [1, 0], "[1]", id="GT"),
+        pytest.param(LE(1), [0, 1], [2, 1], "[0]", id="LE"),
+        pytest.param(LT(1), [0, -1], [1, 0], "[0]", id="LT"),
+        pytest.param(MultipleOfValidator(2), [[2, 4], [0, 6]], [[2, 3], [4, 5]], "[(0, 1), (1, 1)]", id="MultipleOf"),
+        pytest.param(DecimalPlacesValidator(2), [0.29, 1.25, 3.0], [0.29, 0.1 + 0.2, 0.001], "[1, 2]", id="Decimals"),
+        pytest.param(DecimalPlacesValidator(2), [1, 2], None, None, id="Decimals int"),
+        pytest.param(OptionalGE(0), [0, 1], [-1], "[0]", id="Optional"),
+    ],
+)
+def test__validators_ndarray(validator: Any, valid: list, invalid: list | None, indices: str | None) -> None:
+    np = pytest.importorskip("numpy")
+
+    validator.validate(np.array(valid))
+
+    if invalid is not None:
+        with pytest.raises(ValidationError) as exc_info:
+            validator("a", np.array(invalid))
+        assert f"invalid elements at indices: {indices})" in str(exc_info.value)
+
+
+def test__validators_ndarray_indices_truncated() -> None:
+    np = pytest.importorskip("numpy")
+
+    with pytest.raises(ValidatorFailed, match=r"indices: \[0, 1, 2, 3, 4, 5, 6, 7, 8, 9\] and 90 more"):
+        GE(0).validate(-np.ones(100))
+
+
+def test__decimal_places_validator_object_ndarray() -> None:
+    np = pytest.importorskip("numpy")
+
+    v = DecimalPlacesValidator(1)
+    v.validate(np.array([0.5, 1], dtype=object))
+
+    with pytest.raises(ValidatorFailed, match=r"indices: \[1\]"):
+        v.validate(np.array([0.5, 0.25], dtype=object))